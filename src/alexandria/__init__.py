@@ -1,13 +1,11 @@
 """Alexandria - Screenshot Recall Utility for Wayland compositors."""
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "Aabish Malik"
 __email__ = "aabishmalik3337@gmail.com"
 
-from alexandria.config import Config, XDGDirs
-from alexandria.core import Memory, MemoryDB, ScreenshotCapture, OCRProcessor
-from alexandria.service import AlexandriaDaemon
-
 __all__ = [
     "Config",
     "XDGDirs",
@@ -17,3 +15,31 @@ __all__ = [
     "OCRProcessor",
     "AlexandriaDaemon",
 ]
+
+# Public names are resolved on first access so that importing the package
+# does not pull in SQLAlchemy, OpenCV, Tesseract or the daemon stack.
+_LAZY = {
+    "Config": ("alexandria.config", "Config"),
+    "XDGDirs": ("alexandria.config", "XDGDirs"),
+    "Memory": ("alexandria.core", "Memory"),
+    "MemoryDB": ("alexandria.core", "MemoryDB"),
+    "ScreenshotCapture": ("alexandria.core", "ScreenshotCapture"),
+    "OCRProcessor": ("alexandria.core", "OCRProcessor"),
+    "AlexandriaDaemon": ("alexandria.service", "AlexandriaDaemon"),
+}
+
+
+def __getattr__(name):
+    """Import public names lazily (PEP 562)."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(__all__)
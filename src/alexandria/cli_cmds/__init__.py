@@ -0,0 +1,5 @@
+"""Subcommands for the Alexandria command-line interface.
+
+Each module defines a single click command named ``cmd`` and is only
+imported when that subcommand is invoked.
+"""
@@ -0,0 +1,69 @@
+"""`alexandria cleanup` command."""
+
+import datetime
+import sqlite3
+import sys
+from pathlib import Path
+
+import click
+
+
+@click.command("cleanup")
+@click.option("--days", default=30, help="Delete memories older than N days")
+@click.option("--confirm", is_flag=True, help="Skip confirmation prompt")
+def cmd(days, confirm):
+    """Clean up old memories."""
+    try:
+        from alexandria.config import Config
+        from alexandria.core.shared_files import unreferenced_files
+
+        config = Config()
+        db_path = config.database_path
+
+        if not confirm:
+            click.confirm(f"Delete all memories older than {days} days?", abort=True)
+
+        deleted_count = 0
+        if Path(db_path).exists():
+            cutoff_date = datetime.datetime.utcnow() - datetime.timedelta(days=days)
+            # Same text format SQLAlchemy uses for DateTime columns on SQLite
+            cutoff = cutoff_date.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+            with sqlite3.connect(db_path) as conn:
+                rows = conn.execute(
+                    "SELECT screenshot_path, thumbnail_path FROM memories"
+                    " WHERE timestamp < ?",
+                    (cutoff,),
+                ).fetchall()
+
+                deleted_count = conn.execute(
+                    "DELETE FROM memories WHERE timestamp < ?", (cutoff,)
+                ).rowcount
+
+                # Captures of an unchanged screen share files; find those no
+                # remaining memory uses before the delete commits
+                unreferenced = unreferenced_files(conn.execute, rows)
+
+            # Only remove files once their rows are really gone
+            for path in unreferenced:
+                Path(path).unlink(missing_ok=True)
+
+            # Release free pages and refresh planner statistics, as
+            # MemoryDB.cleanup_old_memories() does
+            if deleted_count:
+                try:
+                    # incremental_vacuum frees one page per result row
+                    conn.execute("PRAGMA incremental_vacuum").fetchall()
+                    conn.execute("PRAGMA optimize")
+                    conn.commit()
+                except sqlite3.Error as e:
+                    click.echo(f"Database compaction failed: {e}", err=True)
+            conn.close()
+
+        click.echo(f"Deleted {deleted_count} memories.")
+
+    except click.Abort:
+        click.echo("Cleanup cancelled.")
+    except Exception as e:
+        click.echo(f"Cleanup error: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,39 @@
+"""`alexandria config` command."""
+
+import sys
+
+import click
+
+
+@click.command("config")
+def cmd():
+    """Show current configuration."""
+    try:
+        from alexandria.config import Config
+
+        config_instance = Config()
+
+        click.echo("Alexandria Configuration:")
+        click.echo(f"  Config file: {config_instance.config_file}")
+        click.echo(f"  Data directory: {config_instance.data_dir}")
+        click.echo(f"  Cache directory: {config_instance.cache_dir}")
+        click.echo(f"  Database: {config_instance.database_path}")
+
+        click.echo("\nScreenshot Settings:")
+        screenshot_config = config_instance.get("screenshot")
+        for key, value in screenshot_config.items():
+            click.echo(f"  {key}: {value}")
+
+        click.echo("\nWayland Settings:")
+        wayland_config = config_instance.get("wayland")
+        for key, value in wayland_config.items():
+            click.echo(f"  {key}: {value}")
+
+        click.echo("\nOCR Settings:")
+        ocr_config = config_instance.get("ocr")
+        for key, value in ocr_config.items():
+            click.echo(f"  {key}: {value}")
+
+    except Exception as e:
+        click.echo(f"Config error: {e}", err=True)
+        sys.exit(1)
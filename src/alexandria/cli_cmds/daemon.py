@@ -0,0 +1,32 @@
+"""`alexandria daemon` command."""
+
+import sys
+
+import click
+
+
+@click.command("daemon")
+@click.option("--debug", is_flag=True, help="Enable debug logging")
+@click.option("--one-shot", is_flag=True, help="Take one screenshot and exit")
+def cmd(debug, one_shot):
+    """Run the Alexandria screenshot daemon."""
+    from alexandria.service import AlexandriaDaemon
+
+    if debug:
+        import logging
+
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    daemon_instance = AlexandriaDaemon()
+
+    if one_shot:
+        daemon_instance.capture_and_process_screenshot()
+        return
+
+    try:
+        daemon_instance.run()
+    except KeyboardInterrupt:
+        click.echo("Daemon stopped by user")
+    except Exception as e:
+        click.echo(f"Daemon error: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,21 @@
+"""`alexandria gui` command."""
+
+import sys
+
+import click
+
+
+@click.command("gui")
+def cmd():
+    """Launch the Alexandria GUI."""
+    try:
+        from alexandria.gui.main_window import main
+
+        main()
+    except ImportError as e:
+        click.echo(f"GUI dependencies not available: {e}", err=True)
+        click.echo("Please install GTK3 and PyGObject dependencies", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"GUI error: {e}", err=True)
+        sys.exit(1)
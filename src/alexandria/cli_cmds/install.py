@@ -0,0 +1,82 @@
+"""`alexandria install` command."""
+
+import shutil
+import sys
+from pathlib import Path
+
+import click
+
+# Repository root, where the systemd/, desktop/ and man/ directories live
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+
+@click.command("install")
+def cmd():
+    """Install Alexandria systemd service and desktop files."""
+    try:
+        from alexandria.config import Config
+
+        Config().ensure_ready()
+
+        # Install systemd service
+        systemd_dir = Path.home() / ".config" / "systemd" / "user"
+        systemd_dir.mkdir(parents=True, exist_ok=True)
+
+        service_source = PROJECT_ROOT / "systemd" / "alexandria.service"
+        service_dest = systemd_dir / "alexandria.service"
+
+        if service_source.exists():
+            shutil.copy2(service_source, service_dest)
+            click.echo(f"Installed systemd service: {service_dest}")
+
+        # Install desktop file
+        desktop_dir = Path.home() / ".local" / "share" / "applications"
+        desktop_dir.mkdir(parents=True, exist_ok=True)
+
+        desktop_source = PROJECT_ROOT / "desktop" / "org.alexandria.recall.desktop"
+        desktop_dest = desktop_dir / "org.alexandria.recall.desktop"
+
+        if desktop_source.exists():
+            shutil.copy2(desktop_source, desktop_dest)
+            click.echo(f"Installed desktop file: {desktop_dest}")
+
+        # Install man page
+        man_dir = Path.home() / ".local" / "share" / "man" / "man1"
+        man_dir.mkdir(parents=True, exist_ok=True)
+
+        man_source = PROJECT_ROOT / "man" / "alexandria.1"
+        man_dest = man_dir / "alexandria.1"
+
+        if man_source.exists():
+            shutil.copy2(man_source, man_dest)
+            click.echo(f"Installed man page: {man_dest}")
+
+        # Download NLTK data for tagging, so the daemon never has to
+        from alexandria.core.text_processor import (
+            NLTK_AVAILABLE,
+            download_nltk_data,
+            nltk_data_dir,
+        )
+
+        if NLTK_AVAILABLE:
+            click.echo("Downloading NLTK data...")
+            failed = download_nltk_data()
+            if failed:
+                click.echo(
+                    f"Warning: could not download NLTK data: {', '.join(failed)}",
+                    err=True,
+                )
+            else:
+                click.echo(f"Installed NLTK data: {nltk_data_dir()}")
+        else:
+            click.echo("NLTK not available, skipping NLTK data download")
+
+        click.echo("\nTo enable the service:")
+        click.echo("  systemctl --user enable alexandria.service")
+        click.echo("  systemctl --user start alexandria.service")
+        click.echo("\nTo view the manual:")
+        click.echo("  man alexandria")
+
+    except Exception as e:
+        click.echo(f"Installation error: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,67 @@
+"""`alexandria search` command."""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import click
+
+
+@click.command("search")
+@click.argument("query", required=True)
+@click.option("--limit", default=10, help="Maximum number of results")
+def cmd(query, limit):
+    """Search memories by text content."""
+    try:
+        from alexandria.config import Config
+        from alexandria.core.fts import fts_query
+
+        config = Config()
+        db_path = config.database_path
+
+        # Query SQLite directly: the ORM is far more expensive to import
+        # than this one-shot lookup is to run.
+        rows = []
+        if Path(db_path).exists():
+            with sqlite3.connect(db_path) as conn:
+                try:
+                    # Same index and MATCH expression as MemoryDB and the GUI
+                    rows = conn.execute(
+                        "SELECT memories.id, memories.timestamp,"
+                        " memories.application_name, memories.window_title,"
+                        " substr(memories.ocr_text, 1, 101) FROM memories"
+                        " JOIN memories_fts ON memories.id = memories_fts.rowid"
+                        " WHERE memories_fts MATCH ? AND memories.is_private = 0"
+                        " ORDER BY memories_fts.rank, memories.timestamp DESC"
+                        " LIMIT ?",
+                        (fts_query(query), limit),
+                    ).fetchall()
+                except sqlite3.OperationalError:
+                    # No FTS index (or no searchable terms): substring match
+                    pattern = f"%{query}%"
+                    rows = conn.execute(
+                        "SELECT id, timestamp, application_name, window_title,"
+                        " substr(ocr_text, 1, 101) FROM memories"
+                        " WHERE (ocr_text LIKE ? OR application_name LIKE ?"
+                        " OR window_title LIKE ?) AND is_private = 0"
+                        " ORDER BY timestamp DESC LIMIT ?",
+                        (pattern, pattern, pattern, limit),
+                    ).fetchall()
+
+        if not rows:
+            click.echo("No memories found.")
+            return
+
+        click.echo(f"Found {len(rows)} memories:")
+        for memory_id, timestamp, application_name, window_title, ocr_text in rows:
+            click.echo(f"  {memory_id}: {timestamp} - {application_name or 'Unknown'}")
+            if window_title:
+                click.echo(f"    Title: {window_title}")
+            if ocr_text:
+                preview = ocr_text[:100] + "..." if len(ocr_text) > 100 else ocr_text
+                click.echo(f"    Text: {preview}")
+            click.echo()
+
+    except Exception as e:
+        click.echo(f"Search error: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,40 @@
+"""`alexandria status` command."""
+
+import sys
+
+import click
+
+
+@click.command("status")
+def cmd():
+    """Show Alexandria daemon status."""
+    try:
+        from alexandria.config import Config
+        from alexandria.service.daemon import get_status
+
+        # Only the configuration and database are needed here
+        status_info = get_status(Config())
+
+        click.echo("Alexandria Status:")
+        click.echo(f"  Running: {status_info['running']}")
+        click.echo(f"  Config: {status_info['config_file']}")
+        click.echo(f"  Database: {status_info['database_path']}")
+        click.echo(f"  Screenshots: {status_info['screenshots_dir']}")
+        click.echo(f"  Backend: {status_info['screenshot_backend']}")
+        click.echo(f"  OCR Enabled: {status_info['ocr_enabled']}")
+        click.echo(f"  Interval: {status_info['interval_minutes']} minutes")
+
+        stats = status_info["statistics"]
+        click.echo("\nStatistics:")
+        click.echo(f"  Total Memories: {stats['total_memories']}")
+        click.echo(f"  Private Memories: {stats['private_memories']}")
+        click.echo(f"  Memories with Text: {stats['memories_with_text']}")
+
+        if stats["oldest_memory"]:
+            click.echo(f"  Oldest Memory: {stats['oldest_memory']}")
+        if stats["newest_memory"]:
+            click.echo(f"  Newest Memory: {stats['newest_memory']}")
+
+    except Exception as e:
+        click.echo(f"Error getting status: {e}", err=True)
+        sys.exit(1)
@@ -1,7 +1,10 @@
 """Configuration management for Alexandria."""
 
+import copy
 import json
 import logging
+import os
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -31,6 +34,7 @@ class Config:
             "language": "eng",
             "confidence_threshold": 60,
             "preprocess_image": True,
+            "store_structured_data": True,  # word/line/paragraph boxes
         },
         "privacy": {
             "blur_sensitive_info": True,
@@ -50,35 +54,50 @@ class Config:
     }
 
     def __init__(self):
-        XDGDirs.ensure_dirs()
+        # Nothing touches the disk here; the config file is read on first
+        # access and directories are only created by ensure_ready().
         self.config_file = XDGDirs.config_home() / "config.json"
-        self._config = self._load_config()
+
+    @cached_property
+    def _config(self) -> Dict[str, Any]:
+        config = self._load_config()
 
         # Set database path if not configured
-        if not self._config["storage"]["database_path"]:
-            self._config["storage"]["database_path"] = str(
+        if not config["storage"]["database_path"]:
+            config["storage"]["database_path"] = str(
                 XDGDirs.data_home() / "memories.db"
             )
 
+        return config
+
+    def ensure_ready(self) -> None:
+        """Create the XDG directories and a default config file if missing.
+
+        Only needed by commands that write to disk (the daemon, GUI and
+        installer); read-only commands can use Config without it.
+        """
+        XDGDirs.ensure_dirs()
+        if not self.config_file.exists():
+            self.save_config(self.DEFAULT_CONFIG)
+
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from file or create default."""
+        """Load configuration from file, falling back to the defaults."""
+        config = copy.deepcopy(self.DEFAULT_CONFIG)
+
         if self.config_file.exists():
             try:
                 with open(self.config_file, "r") as f:
                     user_config = json.load(f)
 
                 # Merge with defaults
-                config = self.DEFAULT_CONFIG.copy()
                 self._deep_update(config, user_config)
-                return config
 
             except (json.JSONDecodeError, IOError) as e:
                 logger.error(f"Failed to load config: {e}")
                 logger.info("Using default configuration")
+                config = copy.deepcopy(self.DEFAULT_CONFIG)
 
-        # Create default config file
-        self.save_config(self.DEFAULT_CONFIG)
-        return self.DEFAULT_CONFIG.copy()
+        return config
 
     def _deep_update(
         self, base_dict: Dict[str, Any], update_dict: Dict[str, Any]
@@ -111,17 +130,29 @@ class Config:
         if config is None:
             config = self._config
 
+        # Write to a temporary file and rename it over the old one, so a
+        # crash mid-write can never leave a truncated config behind.
+        tmp_file = self.config_file.with_suffix(".json.tmp")
         try:
-            with open(self.config_file, "w") as f:
+            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w") as f:
                 json.dump(config, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
             logger.info(f"Configuration saved to {self.config_file}")
         except IOError as e:
             logger.error(f"Failed to save config: {e}")
+            tmp_file.unlink(missing_ok=True)
 
     def save(self) -> None:
         """Save current configuration."""
         self.save_config()
 
+    def reload(self) -> None:
+        """Re-read the config file on next access."""
+        self.__dict__.pop("_config", None)
+
     @property
     def screenshot_interval(self) -> int:
         """Get screenshot interval in minutes."""
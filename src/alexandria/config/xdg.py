@@ -1,61 +1,84 @@
 """XDG Base Directory specification implementation."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
+APP_NAME = "alexandria"
+
+# The environment is read once per process; the directories cannot move
+# underneath a running instance.
+
+
+@lru_cache(maxsize=1)
+def _config_home() -> Path:
+    xdg_config = os.environ.get("XDG_CONFIG_HOME")
+    if xdg_config:
+        return Path(xdg_config) / APP_NAME
+    return Path.home() / ".config" / APP_NAME
+
+
+@lru_cache(maxsize=1)
+def _data_home() -> Path:
+    xdg_data = os.environ.get("XDG_DATA_HOME")
+    if xdg_data:
+        return Path(xdg_data) / APP_NAME
+    return Path.home() / ".local" / "share" / APP_NAME
+
+
+@lru_cache(maxsize=1)
+def _cache_home() -> Path:
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache:
+        return Path(xdg_cache) / APP_NAME
+    return Path.home() / ".cache" / APP_NAME
+
+
+@lru_cache(maxsize=1)
+def _runtime_dir() -> Path:
+    xdg_runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if not xdg_runtime:
+        # Fallback to temp directory
+        return Path("/tmp") / f"{APP_NAME}-{os.getuid()}"
+    return Path(xdg_runtime) / APP_NAME
+
+
+def _ensure_dirs() -> None:
+    # Not memoized: the runtime directory lives on a tmpfs that can be
+    # wiped while the daemon runs, so it is recreated on every call
+    for directory in (_config_home(), _data_home(), _cache_home(), _runtime_dir()):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    # Set proper permissions for runtime directory
+    os.chmod(_runtime_dir(), 0o700)
+
 
 class XDGDirs:
     """XDG Base Directory specification for Alexandria."""
 
-    APP_NAME = "alexandria"
+    APP_NAME = APP_NAME
 
     @classmethod
     def config_home(cls) -> Path:
         """Return XDG_CONFIG_HOME/alexandria directory."""
-        xdg_config = os.environ.get("XDG_CONFIG_HOME")
-        if xdg_config:
-            return Path(xdg_config) / cls.APP_NAME
-        return Path.home() / ".config" / cls.APP_NAME
+        return _config_home()
 
     @classmethod
     def data_home(cls) -> Path:
         """Return XDG_DATA_HOME/alexandria directory."""
-        xdg_data = os.environ.get("XDG_DATA_HOME")
-        if xdg_data:
-            return Path(xdg_data) / cls.APP_NAME
-        return Path.home() / ".local" / "share" / cls.APP_NAME
+        return _data_home()
 
     @classmethod
     def cache_home(cls) -> Path:
         """Return XDG_CACHE_HOME/alexandria directory."""
-        xdg_cache = os.environ.get("XDG_CACHE_HOME")
-        if xdg_cache:
-            return Path(xdg_cache) / cls.APP_NAME
-        return Path.home() / ".cache" / cls.APP_NAME
+        return _cache_home()
 
     @classmethod
     def runtime_dir(cls) -> Path:
         """Return XDG_RUNTIME_DIR/alexandria directory."""
-        xdg_runtime = os.environ.get("XDG_RUNTIME_DIR")
-        if not xdg_runtime:
-            # Fallback to temp directory
-            return Path("/tmp") / f"{cls.APP_NAME}-{os.getuid()}"
-        return Path(xdg_runtime) / cls.APP_NAME
+        return _runtime_dir()
 
     @classmethod
     def ensure_dirs(cls) -> None:
         """Create all necessary directories."""
-        dirs = [
-            cls.config_home(),
-            cls.data_home(),
-            cls.cache_home(),
-            cls.runtime_dir(),
-        ]
-
-        for directory in dirs:
-            directory.mkdir(parents=True, exist_ok=True)
-
-        # Set proper permissions for runtime directory
-        runtime = cls.runtime_dir()
-        if runtime.exists():
-            os.chmod(runtime, 0o700)
+        _ensure_dirs()
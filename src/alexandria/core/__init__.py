@@ -1,16 +1,43 @@
 """Core functionality for Alexandria."""
 
-from .models import Memory, MemoryDB
-from .screenshot import ScreenshotCapture
-from .ocr import OCRProcessor
-from .wayland_info import WaylandWindowInfo
-from .text_processor import TextProcessor
+import importlib
 
 __all__ = [
+    "Frame",
     "Memory",
     "MemoryDB",
+    "MemorySummary",
     "ScreenshotCapture",
     "OCRProcessor",
     "WaylandWindowInfo",
     "TextProcessor",
 ]
+
+# Submodules are imported on first access, so that the database models can
+# be used without loading OpenCV, Tesseract or NLTK.
+_LAZY = {
+    "Frame": ".frame",
+    "Memory": ".models",
+    "MemoryDB": ".models",
+    "MemorySummary": ".models",
+    "ScreenshotCapture": ".screenshot",
+    "OCRProcessor": ".ocr",
+    "WaylandWindowInfo": ".wayland_info",
+    "TextProcessor": ".text_processor",
+}
+
+
+def __getattr__(name):
+    """Import public names lazily (PEP 562)."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(__all__)
@@ -0,0 +1,54 @@
+"""Decoded screenshot shared between analysis, OCR and thumbnailing."""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Optional
+
+import cv2
+import numpy as np
+
+
+@dataclass
+class Frame:
+    """A decoded screenshot and the buffers derived from it.
+
+    The image is decoded and converted to grayscale once; every consumer
+    reads the same arrays, which must be treated as read-only.
+    """
+
+    bgr: np.ndarray
+    path: Optional[Path] = None
+    gray: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.gray = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2GRAY)
+
+    @classmethod
+    def load(cls, path: Path) -> "Frame":
+        """Decode an image file."""
+        bgr = cv2.imread(str(path))
+        if bgr is None:
+            raise ValueError(f"Could not read image: {path}")
+        return cls(bgr, Path(path))
+
+    @classmethod
+    def decode(cls, data: bytes, path: Optional[Path] = None) -> "Frame":
+        """Decode an encoded image held in memory."""
+        bgr = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if bgr is None:
+            raise ValueError("Could not decode image data")
+        return cls(bgr, path)
+
+    @cached_property
+    def edges(self) -> np.ndarray:
+        """Canny edge map of the full-resolution grayscale image."""
+        return cv2.Canny(self.gray, 50, 150)
+
+    @property
+    def width(self) -> int:
+        return self.bgr.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.bgr.shape[0]
@@ -0,0 +1,12 @@
+"""Full-text search helpers with no ORM dependency."""
+
+
+def fts_query(query: str) -> str:
+    """Convert free-form search text into a safe FTS5 MATCH expression.
+
+    Every whitespace-separated term becomes a quoted prefix phrase, so
+    punctuation in the query cannot be parsed as FTS5 syntax and partial
+    words still match.
+    """
+    terms = query.split()
+    return " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
@@ -2,8 +2,9 @@
 
 import datetime
 import json
+import logging
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, NamedTuple, Optional, Dict, Any, Tuple
 
 from sqlalchemy import (
     create_engine,
@@ -14,12 +15,154 @@ from sqlalchemy import (
     Text,
     Boolean,
     Float,
+    Index,
+    column,
+    event,
+    func,
+    or_,
+    select,
+    text,
 )
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 
+from .fts import fts_query
+from .shared_files import unreferenced_files
+
+logger = logging.getLogger(__name__)
+
 Base = declarative_base()
 
+# External-content FTS5 index over the OCR text, application name and window
+# title of memories, kept in sync by triggers
+FTS_SCHEMA = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+        ocr_text,
+        application_name,
+        window_title,
+        content='memories',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS memories_fts_ai AFTER INSERT ON memories BEGIN
+        INSERT INTO memories_fts(rowid, ocr_text, application_name, window_title)
+        VALUES (new.id, new.ocr_text, new.application_name, new.window_title);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS memories_fts_ad AFTER DELETE ON memories BEGIN
+        INSERT INTO memories_fts(
+            memories_fts, rowid, ocr_text, application_name, window_title
+        )
+        VALUES (
+            'delete', old.id, old.ocr_text, old.application_name, old.window_title
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS memories_fts_au
+    AFTER UPDATE OF ocr_text, application_name, window_title ON memories BEGIN
+        INSERT INTO memories_fts(
+            memories_fts, rowid, ocr_text, application_name, window_title
+        )
+        VALUES (
+            'delete', old.id, old.ocr_text, old.application_name, old.window_title
+        );
+        INSERT INTO memories_fts(rowid, ocr_text, application_name, window_title)
+        VALUES (new.id, new.ocr_text, new.application_name, new.window_title);
+    END
+    """,
+]
+
+# Removes an index created before application names and window titles were
+# indexed, so it can be recreated with all columns
+FTS_DROP = [
+    "DROP TRIGGER IF EXISTS memories_fts_ai",
+    "DROP TRIGGER IF EXISTS memories_fts_ad",
+    "DROP TRIGGER IF EXISTS memories_fts_au",
+    "DROP TABLE IF EXISTS memories_fts",
+]
+
+# Row counters for get_statistics, maintained by triggers so that status
+# queries never need a full-table COUNT(*)
+COUNTERS_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS memory_counters (
+        name TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    )
+    """,
+    """
+    INSERT OR IGNORE INTO memory_counters (name, value)
+    SELECT 'total', COUNT(*) FROM memories
+    """,
+    """
+    INSERT OR IGNORE INTO memory_counters (name, value)
+    SELECT 'private', COUNT(*) FROM memories WHERE is_private = 1
+    """,
+    """
+    INSERT OR IGNORE INTO memory_counters (name, value)
+    SELECT 'with_text', COUNT(*) FROM memories WHERE has_text = 1
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS memory_counters_ai AFTER INSERT ON memories BEGIN
+        UPDATE memory_counters SET value = value + 1 WHERE name = 'total';
+        UPDATE memory_counters SET value = value + 1
+        WHERE name = 'private' AND new.is_private = 1;
+        UPDATE memory_counters SET value = value + 1
+        WHERE name = 'with_text' AND new.has_text = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS memory_counters_ad AFTER DELETE ON memories BEGIN
+        UPDATE memory_counters SET value = value - 1 WHERE name = 'total';
+        UPDATE memory_counters SET value = value - 1
+        WHERE name = 'private' AND old.is_private = 1;
+        UPDATE memory_counters SET value = value - 1
+        WHERE name = 'with_text' AND old.has_text = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS memory_counters_au
+    AFTER UPDATE OF is_private, has_text ON memories BEGIN
+        UPDATE memory_counters
+        SET value = value + (new.is_private = 1) - (old.is_private = 1)
+        WHERE name = 'private';
+        UPDATE memory_counters
+        SET value = value + (new.has_text = 1) - (old.has_text = 1)
+        WHERE name = 'with_text';
+    END
+    """,
+]
+
+# Applied to every new SQLite connection: WAL lets the GUI and CLI read while
+# the daemon writes, and a larger page cache plus mmap keeps hot pages in RAM.
+# auto_vacuum only takes effect on a new database, so it must come first;
+# existing databases are converted by MemoryDB._enable_incremental_vacuum().
+SQLITE_PRAGMAS = [
+    "PRAGMA auto_vacuum=INCREMENTAL",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=30000000000",
+    "PRAGMA busy_timeout=5000",
+]
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class Memory(Base):
     """Database model for a screenshot memory."""
@@ -55,54 +198,193 @@ class Memory(Base):
     has_text = Column(Boolean, default=False)
     dominant_colors = Column(Text, nullable=True)  # JSON array of hex colors
 
+    __table_args__ = (
+        # Serves the "not private, newest first" listing without a sort step
+        Index("ix_memories_private_timestamp", is_private, timestamp.desc()),
+        Index("ix_memories_has_text", has_text),
+        # Date range lookups in get_statistics and retention cleanup
+        Index("ix_memories_timestamp", timestamp),
+    )
+
     def __repr__(self):
         return f"<Memory(id={self.id}, timestamp={self.timestamp}, path={self.screenshot_path})>"
 
+    def _decode_json(self, raw: Optional[str], cache_attr: str, default):
+        """Decode a JSON column, reusing the last result while the raw text is unchanged."""
+        cached = self.__dict__.get(cache_attr)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+
+        value = default
+        if raw:
+            try:
+                value = json.loads(raw)
+            except json.JSONDecodeError:
+                pass
+
+        self.__dict__[cache_attr] = (raw, value)
+        return value
+
     @property
     def tags_list(self) -> List[str]:
-        """Get tags as a list."""
-        if not self.tags:
-            return []
-        try:
-            return json.loads(self.tags)
-        except json.JSONDecodeError:
-            return []
+        """Get tags as a list (a fresh copy; editing it does not touch the cache)."""
+        return list(self._decode_json(self.tags, "_tags_cache", ()))
 
     @tags_list.setter
     def tags_list(self, tags: List[str]):
         """Set tags from a list."""
         self.tags = json.dumps(tags)
+        self.__dict__["_tags_cache"] = (self.tags, tuple(tags))
 
     @property
     def ocr_data_dict(self) -> Dict[str, Any]:
         """Get OCR data as a dictionary."""
-        if not self.ocr_data:
-            return {}
-        try:
-            return json.loads(self.ocr_data)
-        except json.JSONDecodeError:
-            return {}
+        return self._decode_json(self.ocr_data, "_ocr_data_cache", {})
 
     @ocr_data_dict.setter
     def ocr_data_dict(self, data: Dict[str, Any]):
         """Set OCR data from a dictionary."""
         self.ocr_data = json.dumps(data)
+        self.__dict__["_ocr_data_cache"] = (self.ocr_data, data)
+
+
+class MemorySummary(NamedTuple):
+    """Read-only projection of a memory for list views.
+
+    Mapped Memory objects carry a per-instance __dict__ and SQLAlchemy
+    instance state; list views only need these few columns.
+    """
+
+    id: int
+    timestamp: datetime.datetime
+    application_name: Optional[str]
+    window_title: Optional[str]
+    ocr_preview: Optional[str]
+    screenshot_path: str
+    thumbnail_path: Optional[str]
+    tags: Optional[str]
+
+    @property
+    def tags_list(self) -> List[str]:
+        """Get tags as a list."""
+        if self.tags:
+            try:
+                return json.loads(self.tags)
+            except json.JSONDecodeError:
+                pass
+        return []
 
 
 class MemoryDB:
     """Database manager for Alexandria memories."""
 
     def __init__(self, database_url: str):
-        self.engine = create_engine(database_url)
+        if database_url.startswith("sqlite"):
+            self.engine = create_engine(
+                database_url, connect_args={"check_same_thread": False}
+            )
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
+        else:
+            self.engine = create_engine(database_url)
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
         )
+        self.fts_enabled = False
+        self.counters_enabled = False
         self.create_tables()
 
     def create_tables(self):
         """Create all database tables."""
         Base.metadata.create_all(bind=self.engine)
 
+        # create_all skips indexes on tables that already exist
+        for index in Memory.__table__.indexes:
+            index.create(bind=self.engine, checkfirst=True)
+
+        if self.engine.dialect.name == "sqlite":
+            self._enable_incremental_vacuum()
+            self._create_fts_index()
+            self._create_counters()
+
+    def _enable_incremental_vacuum(self):
+        """Switch a database created without auto_vacuum to INCREMENTAL.
+
+        The pragma alone is ignored once tables exist; a one-time VACUUM
+        rebuilds the file so _compact() can return free pages to the disk.
+        """
+        try:
+            with self.engine.connect().execution_options(
+                isolation_level="AUTOCOMMIT"
+            ) as conn:
+                if conn.exec_driver_sql("PRAGMA auto_vacuum").scalar() != 0:
+                    return
+                logger.info("Enabling incremental auto_vacuum (one-time VACUUM)")
+                conn.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.exec_driver_sql("VACUUM")
+        except OperationalError as e:
+            logger.warning(f"Failed to enable incremental auto_vacuum: {e}")
+
+    def _create_counters(self):
+        """Create the trigger-maintained row counters used by get_statistics."""
+        try:
+            with self.engine.begin() as conn:
+                for statement in COUNTERS_SCHEMA:
+                    conn.execute(text(statement))
+            self.counters_enabled = True
+        except OperationalError as e:
+            logger.warning(f"Failed to create memory counters: {e}")
+            self.counters_enabled = False
+
+    def _create_fts_index(self):
+        """Create the FTS5 index for text search, if SQLite supports it."""
+        try:
+            with self.engine.begin() as conn:
+                existing_sql = conn.execute(
+                    text(
+                        "SELECT sql FROM sqlite_master "
+                        "WHERE type = 'table' AND name = 'memories_fts'"
+                    )
+                ).scalar()
+
+                if existing_sql is not None and "window_title" not in existing_sql:
+                    for statement in FTS_DROP:
+                        conn.execute(text(statement))
+                    existing_sql = None
+
+                for statement in FTS_SCHEMA:
+                    conn.execute(text(statement))
+
+                # Index rows written before the FTS table existed
+                if existing_sql is None:
+                    conn.execute(
+                        text("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+                    )
+
+            self.fts_enabled = True
+        except OperationalError as e:
+            logger.warning(f"FTS5 unavailable, falling back to LIKE search: {e}")
+            self.fts_enabled = False
+
+    def _use_fts(self, search_text: str) -> bool:
+        """Whether search_text can be answered from the FTS index."""
+        return self.fts_enabled and bool(search_text.split())
+
+    def _fts_match(self, search_text: str):
+        """Build a subquery of memory IDs whose indexed text matches search_text."""
+        return (
+            text("SELECT rowid FROM memories_fts WHERE memories_fts MATCH :fts")
+            .bindparams(fts=fts_query(search_text))
+            .columns(column("rowid", Integer))
+        )
+
+    def _like_match(self, search_text: str):
+        """Substring match over the indexed columns, for when FTS can't be used."""
+        return or_(
+            Memory.ocr_text.contains(search_text),
+            Memory.application_name.contains(search_text),
+            Memory.window_title.contains(search_text),
+        )
+
     def get_session(self) -> Session:
         """Get a database session."""
         return self.SessionLocal()
@@ -115,11 +397,53 @@ class MemoryDB:
             session.refresh(memory)
             return memory
 
+    def add_memories(self, memories: List[Memory]) -> List[Memory]:
+        """Add several memories in a single transaction."""
+        with self.get_session() as session:
+            session.add_all(memories)
+            session.commit()
+            for memory in memories:
+                session.refresh(memory)
+            return memories
+
     def get_memory(self, memory_id: int) -> Optional[Memory]:
         """Get a memory by ID."""
         with self.get_session() as session:
             return session.query(Memory).filter(Memory.id == memory_id).first()
 
+    def _filter_memories(
+        self,
+        statement,
+        start_date: Optional[datetime.datetime] = None,
+        end_date: Optional[datetime.datetime] = None,
+        search_text: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        exclude_private: bool = True,
+    ):
+        """Apply the common memory filters to a Query or Core select()."""
+        if exclude_private:
+            statement = statement.filter(Memory.is_private == False)
+
+        if start_date:
+            statement = statement.filter(Memory.timestamp >= start_date)
+
+        if end_date:
+            statement = statement.filter(Memory.timestamp <= end_date)
+
+        if search_text:
+            if self._use_fts(search_text):
+                statement = statement.filter(
+                    Memory.id.in_(self._fts_match(search_text))
+                )
+            else:
+                statement = statement.filter(self._like_match(search_text))
+
+        if tags:
+            for tag in tags:
+                statement = statement.filter(Memory.tags.contains(f'"{tag}"'))
+
+        return statement
+
     def get_memories(
         self,
         limit: int = 100,
@@ -132,23 +456,14 @@ class MemoryDB:
     ) -> List[Memory]:
         """Get memories with optional filtering."""
         with self.get_session() as session:
-            query = session.query(Memory)
-
-            if exclude_private:
-                query = query.filter(Memory.is_private == False)
-
-            if start_date:
-                query = query.filter(Memory.timestamp >= start_date)
-
-            if end_date:
-                query = query.filter(Memory.timestamp <= end_date)
-
-            if search_text:
-                query = query.filter(Memory.ocr_text.contains(search_text))
-
-            if tags:
-                for tag in tags:
-                    query = query.filter(Memory.tags.contains(f'"{tag}"'))
+            query = self._filter_memories(
+                session.query(Memory),
+                start_date=start_date,
+                end_date=end_date,
+                search_text=search_text,
+                tags=tags,
+                exclude_private=exclude_private,
+            )
 
             return (
                 query.order_by(Memory.timestamp.desc())
@@ -157,12 +472,64 @@ class MemoryDB:
                 .all()
             )
 
+    def get_memories_summary(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        start_date: Optional[datetime.datetime] = None,
+        end_date: Optional[datetime.datetime] = None,
+        search_text: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        exclude_private: bool = True,
+        preview_length: int = 120,
+    ) -> List[MemorySummary]:
+        """Get lightweight rows for list views, with the same filters as get_memories."""
+        statement = select(
+            Memory.id,
+            Memory.timestamp,
+            Memory.application_name,
+            Memory.window_title,
+            func.substr(Memory.ocr_text, 1, preview_length).label("ocr_preview"),
+            Memory.screenshot_path,
+            Memory.thumbnail_path,
+            Memory.tags,
+        )
+        statement = self._filter_memories(
+            statement,
+            start_date=start_date,
+            end_date=end_date,
+            search_text=search_text,
+            tags=tags,
+            exclude_private=exclude_private,
+        )
+        statement = (
+            statement.order_by(Memory.timestamp.desc()).offset(offset).limit(limit)
+        )
+
+        with self.get_session() as session:
+            return [MemorySummary._make(row) for row in session.execute(statement)]
+
     def search_memories(self, query: str, limit: int = 50) -> List[Memory]:
-        """Search memories by text content."""
+        """Search memories by text content, best matches first."""
         with self.get_session() as session:
+            if self._use_fts(query):
+                statement = text(
+                    "SELECT memories.* FROM memories "
+                    "JOIN memories_fts ON memories.id = memories_fts.rowid "
+                    "WHERE memories_fts MATCH :fts AND memories.is_private = 0 "
+                    "ORDER BY memories_fts.rank, memories.timestamp DESC "
+                    "LIMIT :limit"
+                )
+                return (
+                    session.query(Memory)
+                    .from_statement(statement)
+                    .params(fts=fts_query(query), limit=limit)
+                    .all()
+                )
+
             return (
                 session.query(Memory)
-                .filter(Memory.ocr_text.contains(query))
+                .filter(self._like_match(query))
                 .filter(Memory.is_private == False)
                 .order_by(Memory.timestamp.desc())
                 .limit(limit)
@@ -183,59 +550,117 @@ class MemoryDB:
         with self.get_session() as session:
             memory = session.query(Memory).filter(Memory.id == memory_id).first()
             if memory:
-                # Delete associated files
-                if Path(memory.screenshot_path).exists():
-                    Path(memory.screenshot_path).unlink()
-                if memory.thumbnail_path and Path(memory.thumbnail_path).exists():
-                    Path(memory.thumbnail_path).unlink()
-
+                paths = [(memory.screenshot_path, memory.thumbnail_path)]
                 session.delete(memory)
                 session.commit()
+
+                # Delete associated files
+                self._unlink_unreferenced(session, paths)
                 return True
             return False
 
+    @staticmethod
+    def _unlink_unreferenced(session, paths) -> None:
+        """Delete the files of deleted memories that no other memory uses."""
+        for path in unreferenced_files(session.connection().exec_driver_sql, paths):
+            Path(path).unlink(missing_ok=True)
+
     def cleanup_old_memories(self, days: int) -> int:
         """Delete memories older than specified days."""
         cutoff_date = datetime.datetime.utcnow() - datetime.timedelta(days=days)
 
         with self.get_session() as session:
             old_memories = (
-                session.query(Memory).filter(Memory.timestamp < cutoff_date).all()
+                session.query(Memory)
+                .filter(Memory.timestamp < cutoff_date)
+                .with_entities(Memory.screenshot_path, Memory.thumbnail_path)
+                .all()
             )
 
-            count = 0
-            for memory in old_memories:
-                # Delete associated files
-                if Path(memory.screenshot_path).exists():
-                    Path(memory.screenshot_path).unlink()
-                if memory.thumbnail_path and Path(memory.thumbnail_path).exists():
-                    Path(memory.thumbnail_path).unlink()
+            count = (
+                session.query(Memory)
+                .filter(Memory.timestamp < cutoff_date)
+                .delete(synchronize_session=False)
+            )
+            session.commit()
 
-                session.delete(memory)
-                count += 1
+            # Delete associated files
+            self._unlink_unreferenced(session, old_memories)
 
-            session.commit()
-            return count
+        if count and self.engine.dialect.name == "sqlite":
+            self._compact()
+
+        return count
+
+    def _compact(self):
+        """Release free pages and refresh query planner statistics."""
+        connection = self.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            # incremental_vacuum frees one page per result row, so drain it
+            cursor.execute("PRAGMA incremental_vacuum").fetchall()
+            cursor.execute("PRAGMA optimize")
+            connection.commit()
+        except Exception as e:
+            logger.warning(f"Database compaction failed: {e}")
+        finally:
+            connection.close()
+
+    def get_memory_census(self) -> Tuple[int, int]:
+        """Return (number of memories, highest memory id), both cheaply.
+
+        Comparing two censuses tells whether memories were deleted in between:
+        without deletions the count grows by exactly the rows above the old
+        highest id (see count_memories_after()).
+        """
+        with self.get_session() as session:
+            if self.counters_enabled:
+                total = session.execute(
+                    text("SELECT value FROM memory_counters WHERE name = 'total'")
+                ).scalar()
+            else:
+                total = session.query(func.count(Memory.id)).scalar()
+            highest = session.query(func.max(Memory.id)).scalar()
+            return total or 0, highest or 0
+
+    def count_memories_after(self, memory_id: int) -> int:
+        """Count memories with an id above memory_id (a primary key range scan)."""
+        with self.get_session() as session:
+            return (
+                session.query(func.count(Memory.id))
+                .filter(Memory.id > memory_id)
+                .scalar()
+            )
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics."""
         with self.get_session() as session:
-            total_memories = session.query(Memory).count()
-            private_memories = (
-                session.query(Memory).filter(Memory.is_private == True).count()
-            )
-            memories_with_text = (
-                session.query(Memory).filter(Memory.has_text == True).count()
-            )
+            if self.counters_enabled:
+                counters = dict(
+                    session.execute(
+                        text("SELECT name, value FROM memory_counters")
+                    ).all()
+                )
+                total_memories = counters.get("total", 0)
+                private_memories = counters.get("private", 0)
+                memories_with_text = counters.get("with_text", 0)
+            else:
+                total_memories = session.query(Memory).count()
+                private_memories = (
+                    session.query(Memory).filter(Memory.is_private == True).count()
+                )
+                memories_with_text = (
+                    session.query(Memory).filter(Memory.has_text == True).count()
+                )
 
             # Get date range
-            oldest = session.query(Memory).order_by(Memory.timestamp.asc()).first()
-            newest = session.query(Memory).order_by(Memory.timestamp.desc()).first()
+            oldest = session.query(func.min(Memory.timestamp)).scalar()
+            newest = session.query(func.max(Memory.timestamp)).scalar()
 
             return {
                 "total_memories": total_memories,
                 "private_memories": private_memories,
                 "memories_with_text": memories_with_text,
-                "oldest_memory": oldest.timestamp if oldest else None,
-                "newest_memory": newest.timestamp if newest else None,
+                "oldest_memory": oldest,
+                "newest_memory": newest,
             }
@@ -1,36 +1,142 @@
 """OCR processing functionality."""
 
+import hashlib
 import logging
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import json
 
+# A resident Tesseract instance should not spawn its own OpenMP thread pool
+# on top of the daemon's threads; must be set before libtesseract loads.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 import pytesseract
-from PIL import Image, ImageEnhance, ImageFilter
+from PIL import Image
 import cv2
 import numpy as np
 
+from .frame import Frame
 from .text_processor import TextProcessor
 
 logger = logging.getLogger(__name__)
 
+try:
+    from tesserocr import PyTessBaseAPI, PSM, RIL, iterate_level
+
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+
+# Common sensitive patterns
+SENSITIVE_KEYWORDS = [
+    # Authentication
+    "password",
+    "passwd",
+    "pwd",
+    "login",
+    "username",
+    "pin",
+    # Financial
+    "credit card",
+    "debit card",
+    "bank account",
+    "routing number",
+    "ssn",
+    "social security",
+    # Personal identifiers
+    "driver license",
+    "passport",
+    "id number",
+    "employee id",
+    # Common form fields
+    "confirm password",
+    "current password",
+    "new password",
+    # URLs that might be sensitive
+    "token",
+    "api key",
+    "secret",
+]
+
+# All keywords in one case-insensitive pattern, so the text is scanned once
+SENSITIVE_KEYWORDS_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in SENSITIVE_KEYWORDS), re.IGNORECASE
+)
+
+# Credit card number or SSN (basic), as one alternation for a single pass
+SENSITIVE_NUMBER_RE = re.compile(
+    r"\b(?:\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}|\d{3}[-.]?\d{2}[-.]?\d{4})\b"
+)
+
 
 class OCRProcessor:
     """OCR processing using Tesseract."""
 
+    # Number of recent OCR results kept, keyed by image content
+    CACHE_SIZE = 32
+
+    # Longest image side handed to Tesseract. Larger screenshots are scaled
+    # down first (roughly 300 DPI over six inches of text); images whose
+    # longest side is below MIN_DIMENSION are scaled up.
+    MAX_DIMENSION = 1800
+    MIN_DIMENSION = 1000
+
     def __init__(self, config):
         self.config = config
         self.language = config.get("ocr", "language")
         self.confidence_threshold = config.get("ocr", "confidence_threshold")
         self.preprocess_enabled = config.get("ocr", "preprocess_image")
-
-        # Initialize text processor for advanced keyword extraction
-        self.text_processor = TextProcessor()
+        self.structure_enabled = config.get("ocr", "store_structured_data")
+
+        # Keep one Tesseract engine loaded for the lifetime of the processor
+        # when tesserocr is installed; otherwise fall back to pytesseract,
+        # which spawns a tesseract process per image.
+        self.api = None
+        self._api_lock = threading.Lock()
+
+        # Recent raw OCR results keyed by a hash of the (preprocessed) image,
+        # so an unchanged screen is not recognised twice
+        self._cache: "OrderedDict[bytes, Dict[str, list]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        if TESSEROCR_AVAILABLE:
+            try:
+                self.api = PyTessBaseAPI(lang=self.language, psm=PSM.SINGLE_BLOCK)
+                logger.info("Using resident tesserocr engine")
+            except RuntimeError as e:
+                logger.warning(f"tesserocr initialization failed, using pytesseract: {e}")
 
         # Verify Tesseract is available
-        if not self._check_tesseract_available():
+        if self.api is None and not self._check_tesseract_available():
             raise RuntimeError("Tesseract OCR is not available")
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Release the resident Tesseract engine, if any."""
+        api = getattr(self, "api", None)
+        if api is not None:
+            self.api = None
+            api.End()
+
+    @cached_property
+    def text_processor(self) -> TextProcessor:
+        """Text processor for advanced keyword extraction, created on first use."""
+        return TextProcessor()
+
     def _check_tesseract_available(self) -> bool:
         """Check if Tesseract is available."""
         try:
@@ -39,29 +145,208 @@ class OCRProcessor:
         except Exception:
             return False
 
-    def process_image(self, image_path: Path) -> Dict[str, any]:
-        """Process image with OCR and return results."""
-        try:
-            # Load image
-            image = Image.open(image_path)
+    def _image_key(self, image: Union[Path, Frame]) -> bytes:
+        """Hash image content together with the settings that affect OCR output.
+
+        The source is hashed rather than the preprocessed image, so an
+        unchanged screen skips preprocessing as well as recognition.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.language}:{self.preprocess_enabled}:".encode())
+        if isinstance(image, Frame):
+            # Preprocessing only reads the grayscale buffer
+            pixels = image.gray if self.preprocess_enabled else image.bgr
+            digest.update(f"{pixels.shape}".encode())
+            digest.update(np.ascontiguousarray(pixels))
+        else:
+            digest.update(Path(image).read_bytes())
+        return digest.digest()
+
+    def _run_ocr_cached(
+        self, images: Sequence[Union[Path, Frame]]
+    ) -> List[Dict[str, list]]:
+        """Run OCR on images, reusing results for identical recent images."""
+        keys = [self._image_key(image) for image in images]
+        results: List[Optional[Dict[str, list]]] = [None] * len(images)
+
+        with self._cache_lock:
+            for i, key in enumerate(keys):
+                ocr_data = self._cache.get(key)
+                if ocr_data is not None:
+                    self._cache.move_to_end(key)
+                    logger.debug("OCR cache hit")
+                    results[i] = ocr_data
+
+        misses = [i for i, ocr_data in enumerate(results) if ocr_data is None]
+        if misses:
+            recognised = self._run_ocr_batch(
+                [self._prepare_image(images[i]) for i in misses]
+            )
 
-            # Preprocess if enabled
-            if self.preprocess_enabled:
-                image = self._preprocess_image(image)
+            with self._cache_lock:
+                for i, ocr_data in zip(misses, recognised):
+                    results[i] = ocr_data
+                    self._cache[keys[i]] = ocr_data
+                while len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+
+        return results
+
+    def _run_ocr_batch(self, images: Sequence[Image.Image]) -> List[Dict[str, list]]:
+        """Run Tesseract on several images.
+
+        The resident engine recognises them one after another. Without it
+        the images go to a single tesseract process through a list file,
+        instead of one process each.
+        """
+        if self.api is not None or len(images) == 1:
+            return [self._run_ocr(image) for image in images]
+
+        with tempfile.TemporaryDirectory(prefix="alexandria-ocr-") as tmp:
+            paths = []
+            for i, image in enumerate(images):
+                path = Path(tmp) / f"{i}.png"
+                image.save(path)
+                paths.append(str(path))
+
+            list_path = Path(tmp) / "images.txt"
+            list_path.write_text("\n".join(paths) + "\n")
 
-            # Perform OCR with detailed data
             ocr_data = pytesseract.image_to_data(
+                str(list_path),
+                lang=self.language,
+                output_type=pytesseract.Output.DICT,
+                config="--psm 6",  # Assume a single uniform block of text
+            )
+
+        # Rows are numbered by page, one page per listed image
+        results = [{key: [] for key in ocr_data} for _ in images]
+        for row, page_num in enumerate(ocr_data["page_num"]):
+            page = results[int(page_num) - 1]
+            for key, values in ocr_data.items():
+                page[key].append(values[row])
+        return results
+
+    def _run_ocr(self, image: Image.Image) -> Dict[str, list]:
+        """Run Tesseract on an image and return word-level data.
+
+        The result has the same column layout as
+        ``pytesseract.image_to_data(..., output_type=Output.DICT)``.
+        """
+        if self.api is None:
+            return pytesseract.image_to_data(
                 image,
                 lang=self.language,
                 output_type=pytesseract.Output.DICT,
                 config="--psm 6",  # Assume a single uniform block of text
             )
 
+        ocr_data = {
+            key: []
+            for key in (
+                "block_num",
+                "par_num",
+                "line_num",
+                "text",
+                "conf",
+                "left",
+                "top",
+                "width",
+                "height",
+            )
+        }
+
+        # PyTessBaseAPI is not thread-safe
+        with self._api_lock:
+            self.api.SetImage(image)
+            self.api.Recognize()
+            iterator = self.api.GetIterator()
+            if iterator is None:
+                return ocr_data
+
+            # Number blocks, paragraphs and lines monotonically so that a
+            # change in number always marks a new group.
+            block_num = par_num = line_num = 0
+            for word in iterate_level(iterator, RIL.WORD):
+                if word.IsAtBeginningOf(RIL.BLOCK):
+                    block_num += 1
+                if word.IsAtBeginningOf(RIL.PARA):
+                    par_num += 1
+                if word.IsAtBeginningOf(RIL.TEXTLINE):
+                    line_num += 1
+
+                bbox = word.BoundingBox(RIL.WORD)
+                if bbox is None:
+                    continue
+                x1, y1, x2, y2 = bbox
+
+                ocr_data["block_num"].append(block_num)
+                ocr_data["par_num"].append(par_num)
+                ocr_data["line_num"].append(line_num)
+                ocr_data["text"].append(word.GetUTF8Text(RIL.WORD) or "")
+                ocr_data["conf"].append(word.Confidence(RIL.WORD))
+                ocr_data["left"].append(x1)
+                ocr_data["top"].append(y1)
+                ocr_data["width"].append(x2 - x1)
+                ocr_data["height"].append(y2 - y1)
+
+        return ocr_data
+
+    def process_image(
+        self, image: Union[Path, Frame], structured: Optional[bool] = None
+    ) -> Dict[str, any]:
+        """Process image with OCR and return results.
+
+        ``image`` is a file path or an already decoded frame.
+
+        Word/line/paragraph data is only built when ``structured`` is true
+        (default: the ``store_structured_data`` setting); otherwise
+        ``structured_data`` is an empty dict.
+        """
+        return self.process_images([image], structured)[0]
+
+    def process_images(
+        self, images: Sequence[Union[Path, Frame]], structured: Optional[bool] = None
+    ) -> List[Dict[str, any]]:
+        """Process several images with OCR in one batch.
+
+        Returns one result per image, as from ``process_image()``.
+        """
+        if structured is None:
+            structured = self.structure_enabled
+
+        try:
+            # Perform OCR with detailed data
+            batch = self._run_ocr_cached(images)
+        except Exception as e:
+            logger.error(f"OCR processing failed: {e}")
+            return [self._empty_result() for _ in images]
+
+        return [self._build_result(ocr_data, structured) for ocr_data in batch]
+
+    def _prepare_image(self, image: Union[Path, Frame]) -> Image.Image:
+        """Load (unless already decoded) and preprocess an image for OCR."""
+        # Preprocessing starts from the frame's shared grayscale buffer
+        if isinstance(image, Frame):
+            if self.preprocess_enabled:
+                return self._preprocess_image(image.gray)
+            return Image.fromarray(image.bgr[..., ::-1])
+
+        image = Image.open(image)
+
+        # Preprocess if enabled
+        if self.preprocess_enabled:
+            image = self._preprocess_image(image)
+        return image
+
+    def _build_result(self, ocr_data: Dict[str, list], structured: bool) -> Dict[str, any]:
+        """Turn raw word-level OCR data into a result dict."""
+        try:
             # Extract text with confidence filtering
             text, confidence = self._extract_text_with_confidence(ocr_data)
 
             # Get structured OCR data
-            structured_data = self._structure_ocr_data(ocr_data)
+            structured_data = self._structure_ocr_data(ocr_data) if structured else {}
 
             # Detect sensitive information
             has_sensitive = self._detect_sensitive_info(text)
@@ -77,147 +362,155 @@ class OCRProcessor:
             }
 
         except Exception as e:
-            logger.error(f"OCR processing failed for {image_path}: {e}")
-            return {
-                "text": "",
-                "confidence": 0,
-                "has_text": False,
-                "has_sensitive": False,
-                "structured_data": {},
-                "word_count": 0,
-                "character_count": 0,
-            }
-
-    def _preprocess_image(self, image: Image.Image) -> Image.Image:
-        """Preprocess image to improve OCR accuracy."""
+            logger.error(f"OCR processing failed: {e}")
+            return self._empty_result()
+
+    @staticmethod
+    def _empty_result() -> Dict[str, any]:
+        return {
+            "text": "",
+            "confidence": 0,
+            "has_text": False,
+            "has_sensitive": False,
+            "structured_data": {},
+            "word_count": 0,
+            "character_count": 0,
+        }
+
+    def _preprocess_image(self, image: Union[Image.Image, np.ndarray]) -> Image.Image:
+        """Preprocess image (or a grayscale array) to improve OCR accuracy."""
         try:
             # Convert to grayscale if not already
-            if image.mode != "L":
-                image = image.convert("L")
-
-            # Enhance contrast
-            enhancer = ImageEnhance.Contrast(image)
-            image = enhancer.enhance(1.5)
+            if isinstance(image, np.ndarray):
+                gray = image
+            else:
+                if image.mode != "L":
+                    image = image.convert("L")
+                gray = np.asarray(image, dtype=np.uint8)
+
+            # Scale down oversized screenshots before any filtering; OCR time
+            # grows linearly with pixel count
+            height, width = gray.shape
+            longest = max(width, height)
+            if longest > self.MAX_DIMENSION:
+                scale_factor = self.MAX_DIMENSION / longest
+                new_size = (int(width * scale_factor), int(height * scale_factor))
+                gray = cv2.resize(gray, new_size, interpolation=cv2.INTER_AREA)
 
-            # Enhance sharpness
-            enhancer = ImageEnhance.Sharpness(image)
-            image = enhancer.enhance(2.0)
+            # Enhance contrast (x1.5 around the mean) and sharpness (x2 unsharp
+            # mask) in a single pass. Both are linear, so
+            #   sharp = 2 * C - blur(C), with C = 1.5 * gray - 0.5 * mean
+            # folds into 3 * gray - 1.5 * blur(gray) - 0.5 * mean.
+            mean = float(gray.mean())
+            blurred = cv2.GaussianBlur(gray, (0, 0), 1.0)
+            enhanced = cv2.addWeighted(gray, 3.0, blurred, -1.5, -0.5 * mean)
 
             # Apply slight blur to reduce noise
-            image = image.filter(ImageFilter.MedianFilter(size=3))
+            enhanced = cv2.medianBlur(enhanced, 3)
 
             # Scale up if image is too small
-            width, height = image.size
-            if width < 1000 or height < 1000:
-                scale_factor = max(1000 / width, 1000 / height)
+            height, width = enhanced.shape
+            longest = max(width, height)
+            if longest < self.MIN_DIMENSION:
+                scale_factor = self.MIN_DIMENSION / longest
                 new_size = (int(width * scale_factor), int(height * scale_factor))
-                image = image.resize(new_size, Image.Resampling.LANCZOS)
+                enhanced = cv2.resize(
+                    enhanced, new_size, interpolation=cv2.INTER_LANCZOS4
+                )
 
-            return image
+            return Image.fromarray(enhanced)
 
         except Exception as e:
             logger.warning(f"Image preprocessing failed: {e}")
+            if isinstance(image, np.ndarray):
+                return Image.fromarray(image)
             return image
 
+    def _kept_words(self, ocr_data: Dict) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Select the words that pass the confidence threshold.
+
+        Returns the indices of kept rows, their stripped text and their
+        integer confidences.
+        """
+        conf = np.asarray(ocr_data["conf"], dtype=np.float64).astype(np.int64)
+        texts = np.char.strip(np.asarray(ocr_data["text"], dtype=str))
+
+        keep = (conf >= self.confidence_threshold) & (np.char.str_len(texts) > 0)
+        indices = np.flatnonzero(keep)
+        return indices, texts[indices], conf[indices]
+
     def _extract_text_with_confidence(self, ocr_data: Dict) -> Tuple[str, float]:
         """Extract text with confidence filtering."""
-        words = []
-        confidences = []
-
-        for i, conf in enumerate(ocr_data["conf"]):
-            if int(conf) >= self.confidence_threshold:
-                text = ocr_data["text"][i].strip()
-                if text:
-                    words.append(text)
-                    confidences.append(int(conf))
+        _, words, confidences = self._kept_words(ocr_data)
 
-        full_text = " ".join(words)
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+        full_text = " ".join(words.tolist())
+        avg_confidence = float(confidences.mean()) if confidences.size else 0
 
         return full_text, avg_confidence
 
     def _structure_ocr_data(self, ocr_data: Dict) -> Dict:
         """Structure OCR data into a more useful format."""
         try:
-            words = []
-            lines = []
-            paragraphs = []
-
-            current_line = []
-            current_paragraph = []
-
-            prev_line_num = None
-            prev_par_num = None
-
-            for i in range(len(ocr_data["text"])):
-                conf = int(ocr_data["conf"][i])
-                text = ocr_data["text"][i].strip()
-
-                if conf >= self.confidence_threshold and text:
-                    word_data = {
-                        "text": text,
-                        "confidence": conf,
-                        "left": ocr_data["left"][i],
-                        "top": ocr_data["top"][i],
-                        "width": ocr_data["width"][i],
-                        "height": ocr_data["height"][i],
-                    }
-                    words.append(word_data)
-
-                    line_num = ocr_data["line_num"][i]
-                    par_num = ocr_data["par_num"][i]
-
-                    # Track lines
-                    if prev_line_num is not None and line_num != prev_line_num:
-                        if current_line:
-                            lines.append(
-                                {
-                                    "text": " ".join([w["text"] for w in current_line]),
-                                    "words": current_line,
-                                    "bbox": self._get_bounding_box(current_line),
-                                }
-                            )
-                            current_line = []
-
-                    current_line.append(word_data)
-
-                    # Track paragraphs
-                    if prev_par_num is not None and par_num != prev_par_num:
-                        if current_paragraph:
-                            paragraphs.append(
-                                {
-                                    "text": " ".join(
-                                        [w["text"] for w in current_paragraph]
-                                    ),
-                                    "words": current_paragraph,
-                                    "bbox": self._get_bounding_box(current_paragraph),
-                                }
-                            )
-                            current_paragraph = []
-
-                    current_paragraph.append(word_data)
-
-                    prev_line_num = line_num
-                    prev_par_num = par_num
-
-            # Add final line and paragraph
-            if current_line:
-                lines.append(
-                    {
-                        "text": " ".join([w["text"] for w in current_line]),
-                        "words": current_line,
-                        "bbox": self._get_bounding_box(current_line),
-                    }
-                )
-
-            if current_paragraph:
-                paragraphs.append(
-                    {
-                        "text": " ".join([w["text"] for w in current_paragraph]),
-                        "words": current_paragraph,
-                        "bbox": self._get_bounding_box(current_paragraph),
-                    }
+            indices, texts, confidences = self._kept_words(ocr_data)
+
+            def column(name):
+                return np.asarray(ocr_data[name], dtype=np.int64)[indices]
+
+            left, top = column("left"), column("top")
+            width, height = column("width"), column("height")
+            right, bottom = left + width, top + height
+
+            words = [
+                {
+                    "text": text,
+                    "confidence": conf,
+                    "left": x,
+                    "top": y,
+                    "width": w,
+                    "height": h,
+                }
+                for text, conf, x, y, w, h in zip(
+                    texts.tolist(),
+                    confidences.tolist(),
+                    left.tolist(),
+                    top.tolist(),
+                    width.tolist(),
+                    height.tolist(),
                 )
+            ]
+
+            def group_by(numbers: np.ndarray) -> List[Dict]:
+                """Split words into runs of equal line/paragraph number."""
+                if not words:
+                    return []
+
+                starts = np.concatenate(([0], np.flatnonzero(np.diff(numbers)) + 1))
+                ends = np.append(starts[1:], len(words))
+
+                lefts = np.minimum.reduceat(left, starts).tolist()
+                tops = np.minimum.reduceat(top, starts).tolist()
+                rights = np.maximum.reduceat(right, starts).tolist()
+                bottoms = np.maximum.reduceat(bottom, starts).tolist()
+
+                groups = []
+                for i, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+                    members = words[start:end]
+                    groups.append(
+                        {
+                            "text": " ".join([w["text"] for w in members]),
+                            "words": members,
+                            "bbox": {
+                                "left": lefts[i],
+                                "top": tops[i],
+                                "width": rights[i] - lefts[i],
+                                "height": bottoms[i] - tops[i],
+                            },
+                        }
+                    )
+                return groups
+
+            lines = group_by(column("line_num"))
+            paragraphs = group_by(column("par_num"))
 
             return {
                 "words": words,
@@ -232,78 +525,14 @@ class OCRProcessor:
             logger.error(f"OCR data structuring failed: {e}")
             return {}
 
-    def _get_bounding_box(self, elements: List[Dict]) -> Dict[str, int]:
-        """Calculate bounding box for a list of text elements."""
-        if not elements:
-            return {"left": 0, "top": 0, "width": 0, "height": 0}
-
-        lefts = [e["left"] for e in elements]
-        tops = [e["top"] for e in elements]
-        rights = [e["left"] + e["width"] for e in elements]
-        bottoms = [e["top"] + e["height"] for e in elements]
-
-        left = min(lefts)
-        top = min(tops)
-        right = max(rights)
-        bottom = max(bottoms)
-
-        return {"left": left, "top": top, "width": right - left, "height": bottom - top}
-
     def _detect_sensitive_info(self, text: str) -> bool:
         """Detect potentially sensitive information in text."""
         if not text:
             return False
 
-        text_lower = text.lower()
-
-        # Common sensitive patterns
-        sensitive_patterns = [
-            # Authentication
-            "password",
-            "passwd",
-            "pwd",
-            "login",
-            "username",
-            "pin",
-            # Financial
-            "credit card",
-            "debit card",
-            "bank account",
-            "routing number",
-            "ssn",
-            "social security",
-            # Personal identifiers
-            "driver license",
-            "passport",
-            "id number",
-            "employee id",
-            # Common form fields
-            "confirm password",
-            "current password",
-            "new password",
-            # URLs that might be sensitive
-            "token",
-            "api key",
-            "secret",
-        ]
-
-        for pattern in sensitive_patterns:
-            if pattern in text_lower:
-                return True
-
-        # Check for credit card number patterns (basic)
-        import re
-
-        credit_card_pattern = r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b"
-        if re.search(credit_card_pattern, text):
-            return True
-
-        # Check for SSN pattern (basic)
-        ssn_pattern = r"\b\d{3}[-.]?\d{2}[-.]?\d{4}\b"
-        if re.search(ssn_pattern, text):
-            return True
-
-        return False
+        return bool(
+            SENSITIVE_KEYWORDS_RE.search(text) or SENSITIVE_NUMBER_RE.search(text)
+        )
 
     def extract_keywords(self, text: str) -> List[str]:
         """Extract potential keywords/tags from text using advanced NLTK processing."""
@@ -4,23 +4,105 @@ import json
 import logging
 import subprocess
 import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Union
 import os
 
 from PIL import Image
 import cv2
 import numpy as np
 
+from .frame import Frame
 from .wayland_info import WaylandWindowInfo
 
 logger = logging.getLogger(__name__)
 
+LOGIND_BUS_NAME = "org.freedesktop.login1"
+
+
+class LockedHintWatcher:
+    """Tracks logind's LockedHint for this user's session.
+
+    A background thread subscribes to the session's property changes, so
+    reading ``locked`` costs nothing. It stays False when logind cannot be
+    reached.
+    """
+
+    def __init__(self):
+        self.locked = False
+        self._thread = threading.Thread(
+            target=self._run, name="alexandria-lock-watch", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        from gi.repository import Gio, GLib
+
+        # Signals are dispatched on this thread's own main context
+        context = GLib.MainContext.new()
+        context.push_thread_default()
+        try:
+            bus = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+            # "auto" is the caller's session, or the user's display session;
+            # change signals are only emitted on the session's real path
+            (session_path,) = bus.call_sync(
+                LOGIND_BUS_NAME,
+                "/org/freedesktop/login1",
+                "org.freedesktop.login1.Manager",
+                "GetSession",
+                GLib.Variant("(s)", ("auto",)),
+                GLib.VariantType.new("(o)"),
+                Gio.DBusCallFlags.NONE,
+                -1,
+                None,
+            ).unpack()
+            proxy = Gio.DBusProxy.new_sync(
+                bus,
+                Gio.DBusProxyFlags.NONE,
+                None,
+                LOGIND_BUS_NAME,
+                session_path,
+                "org.freedesktop.login1.Session",
+                None,
+            )
+        except GLib.Error as e:
+            logger.debug(f"logind session unavailable: {e}")
+            return
+
+        hint = proxy.get_cached_property("LockedHint")
+        if hint is None:
+            return
+        self.locked = hint.unpack()
+
+        proxy.connect("g-properties-changed", self._on_properties_changed)
+        GLib.MainLoop.new(context, False).run()
+
+    def _on_properties_changed(self, proxy, changed, invalidated):
+        hint = changed.lookup_value("LockedHint", None)
+        if hint is not None:
+            self.locked = hint.unpack()
+
 
 class ScreenshotCapture:
     """Screenshot capture using Wayland-native tools."""
 
+    # Longest side used for text detection, and the edge density above
+    # which an image is considered likely to contain text
+    TEXT_DETECTION_SIZE = 512
+    TEXT_EDGE_DENSITY = 0.05
+
+    # Sample every Nth row and column when looking for dominant colors
+    COLOR_SAMPLE_STEP = 4
+
+    # Seconds for which subprocess probe results are reused
+    LOCK_CHECK_TTL = 1.0
+    OUTPUTS_TTL = 10.0
+
+    LOCK_PROCESSES = ["swaylock", "waylock", "gtklock"]
+
     def __init__(self, config):
         self.config = config
         self.screenshot_backend = config.get("wayland", "screenshot_backend")
@@ -30,6 +112,11 @@ class ScreenshotCapture:
         # Initialize Wayland window information gatherer
         self.window_info = WaylandWindowInfo()
 
+        # (time.monotonic() of the probe, result) for cached probes
+        self._lock_cache: Optional[Tuple[float, bool]] = None
+        self._locked_hint: Optional[LockedHintWatcher] = None
+        self._outputs_cache: Optional[Tuple[float, List[str]]] = None
+
         # Verify backend availability
         if not self._check_backend_available():
             raise RuntimeError(
@@ -47,7 +134,17 @@ class ScreenshotCapture:
             return False
 
     def _get_wayland_outputs(self) -> List[str]:
-        """Get list of available Wayland outputs."""
+        """Get list of available Wayland outputs (cached for a few seconds)."""
+        now = time.monotonic()
+        if self._outputs_cache and now - self._outputs_cache[0] < self.OUTPUTS_TTL:
+            return self._outputs_cache[1]
+
+        outputs = self._probe_wayland_outputs()
+        self._outputs_cache = (now, outputs)
+        return outputs
+
+    def _probe_wayland_outputs(self) -> List[str]:
+        """Query the compositor for its enabled outputs."""
         try:
             if self.screenshot_backend == "grim":
                 # grim uses wlr-randr for output listing
@@ -65,8 +162,14 @@ class ScreenshotCapture:
             logger.warning("Could not get Wayland outputs list")
             return []
 
-    def _build_screenshot_command(self, output_file: str) -> List[str]:
-        """Build the screenshot command based on configuration."""
+    def _build_screenshot_command(
+        self, output_file: str, to_stdout: bool = False
+    ) -> List[str]:
+        """Build the screenshot command based on configuration.
+
+        With ``to_stdout`` the image is written to standard output; the
+        encoding options are still chosen from ``output_file``.
+        """
         if self.screenshot_backend == "grim":
             cmd = ["grim"]
 
@@ -94,7 +197,7 @@ class ScreenshotCapture:
                 if quality:
                     cmd.extend(["-q", str(quality)])
 
-            cmd.append(output_file)
+            cmd.append("-" if to_stdout else output_file)
             return cmd
 
         else:
@@ -133,29 +236,100 @@ class ScreenshotCapture:
             logger.error(f"Screenshot capture error: {e}")
             return None
 
+    def capture_screenshot_image(self, output_dir: Path) -> Optional[Frame]:
+        """Capture a screenshot and return it as a decoded frame.
+
+        The encoded image is read from the backend's stdout, saved unchanged
+        for the archive and decoded once in memory, so callers can analyse
+        it without reading the file back.
+        """
+        timestamp = datetime.now()
+        filename = f"screenshot_{timestamp.strftime('%Y%m%d_%H%M%S')}.png"
+        output_file = output_dir / filename
+
+        try:
+            # Ensure output directory exists
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            # Build and execute screenshot command
+            cmd = self._build_screenshot_command(str(output_file), to_stdout=True)
+
+            logger.debug(f"Executing screenshot command: {' '.join(cmd)}")
+            result = subprocess.run(cmd, capture_output=True, timeout=10)
+
+            if result.returncode != 0 or not result.stdout:
+                error_msg = result.stderr.decode() if result.stderr else "Unknown error"
+                logger.error(f"Screenshot capture failed: {error_msg}")
+                return None
+
+            frame = Frame.decode(result.stdout, output_file)
+
+            output_file.write_bytes(result.stdout)
+            logger.info(f"Screenshot captured: {output_file}")
+            return frame
+
+        except subprocess.TimeoutExpired:
+            logger.error("Screenshot capture timed out")
+            return None
+        except Exception as e:
+            logger.error(f"Screenshot capture error: {e}")
+            return None
+
     def create_thumbnail(
-        self, image_path: Path, thumbnail_path: Path, size: Tuple[int, int] = (200, 150)
+        self,
+        image: Union[Path, Frame],
+        thumbnail_path: Path,
+        size: Tuple[int, int] = (200, 150),
     ) -> bool:
-        """Create a thumbnail of the screenshot."""
+        """Create a thumbnail of the screenshot (a file path or decoded frame).
+
+        The format follows the suffix of ``thumbnail_path``; JPEG
+        thumbnails are written at quality 85.
+        """
         try:
-            with Image.open(image_path) as img:
-                # Create thumbnail maintaining aspect ratio
-                img.thumbnail(size, Image.Resampling.LANCZOS)
+            frame = image if isinstance(image, Frame) else Frame.load(image)
+            img = frame.bgr
+
+            # Shrink maintaining aspect ratio (never enlarge); INTER_AREA
+            # averages whole source pixels, which suits large reductions
+            height, width = img.shape[:2]
+            scale = min(size[0] / width, size[1] / height)
+            if scale < 1:
+                img = cv2.resize(
+                    img,
+                    (max(1, round(width * scale)), max(1, round(height * scale))),
+                    interpolation=cv2.INTER_AREA,
+                )
 
-                # Save thumbnail
-                thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
-                img.save(thumbnail_path, "PNG", optimize=True)
+            # Save thumbnail; OpenCV picks the encoder from the suffix
+            thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
+            params = []
+            if thumbnail_path.suffix.lower() in (".jpg", ".jpeg"):
+                params = [cv2.IMWRITE_JPEG_QUALITY, 85]
+            if not cv2.imwrite(str(thumbnail_path), img, params):
+                raise ValueError(f"Could not write {thumbnail_path}")
 
-                logger.debug(f"Thumbnail created: {thumbnail_path}")
-                return True
+            logger.debug(f"Thumbnail created: {thumbnail_path}")
+            return True
 
         except Exception as e:
             logger.error(f"Thumbnail creation failed: {e}")
             return False
 
-    def get_image_metadata(self, image_path: Path) -> dict:
-        """Extract metadata from the screenshot."""
+    def get_image_metadata(self, image: Union[Path, Frame]) -> dict:
+        """Extract metadata from the screenshot (a file path or decoded frame)."""
         try:
+            # A frame already knows its size; only the file size is needed
+            if isinstance(image, Frame):
+                return {
+                    "width": image.width,
+                    "height": image.height,
+                    "format": image.path.suffix.lstrip(".").upper(),
+                    "mode": "RGB",  # frames are always decoded to 3 channels
+                    "file_size": image.path.stat().st_size,
+                }
+
+            image_path = image
             with Image.open(image_path) as img:
                 return {
                     "width": img.width,
@@ -168,27 +342,25 @@ class ScreenshotCapture:
             logger.error(f"Failed to extract image metadata: {e}")
             return {}
 
-    def analyze_image_content(self, image_path: Path) -> dict:
-        """Analyze image content for dominant colors and features."""
-        try:
-            # Load image with OpenCV
-            img = cv2.imread(str(image_path))
-            if img is None:
-                return {}
+    def analyze_image_content(self, image: Union[Path, Frame]) -> dict:
+        """Analyze image content for dominant colors and features.
 
-            # Convert BGR to RGB
-            img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        ``image`` is a file path or an already decoded frame.
+        """
+        try:
+            frame = image if isinstance(image, Frame) else Frame.load(image)
 
-            # Get dominant colors
-            dominant_colors = self._get_dominant_colors(img_rgb)
+            # Get dominant colors; the RGB image is a reversed-channel view
+            # of the BGR pixels rather than a copy
+            dominant_colors = self._get_dominant_colors(frame.bgr[..., ::-1])
 
-            # Basic image analysis
-            has_text_regions = self._detect_text_regions(img)
+            # Basic image analysis on the frame's shared grayscale buffer
+            has_text_regions = self._detect_text_regions(frame.gray)
 
             return {
                 "dominant_colors": dominant_colors,
                 "has_potential_text": has_text_regions,
-                "image_complexity": self._calculate_complexity(img),
+                "image_complexity": self._calculate_complexity(frame.edges),
             }
 
         except Exception as e:
@@ -198,26 +370,33 @@ class ScreenshotCapture:
     def _get_dominant_colors(self, img: np.ndarray, k: int = 5) -> List[str]:
         """Extract dominant colors from the image."""
         try:
-            # Reshape image to be a list of pixels
-            data = img.reshape((-1, 3))
-
-            # Apply k-means clustering
-            criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 20, 1.0)
-            _, labels, centers = cv2.kmeans(
-                data.astype(np.float32),
-                k,
-                None,
-                criteria,
-                10,
-                cv2.KMEANS_RANDOM_CENTERS,
-            )
-
-            # Convert centers to hex colors
+            # Quantize to 5 bits per channel and count each 15-bit color key;
+            # screenshots are dominated by flat regions, so a histogram finds
+            # the same colors as clustering at a fraction of the cost. The
+            # keys are built in place in one uint16 buffer to avoid a
+            # temporary array per channel and per operation. Dominant colors
+            # cover large areas, so a sparse pixel grid is representative.
+            step = self.COLOR_SAMPLE_STEP
+            img = img[::step, ::step]
+            keys = np.right_shift(img[..., 0], 3, dtype=np.uint16)
+            for channel in (1, 2):
+                keys <<= 5
+                keys |= img[..., channel] >> 3
+            counts = np.bincount(keys.ravel(), minlength=1 << 15)
+
+            k = min(k, np.count_nonzero(counts))
+            if k == 0:
+                return []
+            top = np.argpartition(counts, -k)[-k:]
+            top = top[np.argsort(counts[top])[::-1]]
+
+            # Decode each bucket back to the midpoint of its RGB range
             hex_colors = []
-            for center in centers:
-                color = tuple(int(c) for c in center)
-                hex_color = f"#{color[0]:02x}{color[1]:02x}{color[2]:02x}"
-                hex_colors.append(hex_color)
+            for key in top:
+                r = ((key >> 10) & 0x1F) << 3 | 4
+                g = ((key >> 5) & 0x1F) << 3 | 4
+                b = (key & 0x1F) << 3 | 4
+                hex_colors.append(f"#{r:02x}{g:02x}{b:02x}")
 
             return hex_colors
 
@@ -225,60 +404,58 @@ class ScreenshotCapture:
             logger.error(f"Dominant color extraction failed: {e}")
             return []
 
-    def _detect_text_regions(self, img: np.ndarray) -> bool:
-        """Detect if image likely contains text."""
+    def _detect_text_regions(self, gray: np.ndarray) -> bool:
+        """Detect if a grayscale image likely contains text."""
         try:
-            # Convert to grayscale
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+            # Text only needs a yes/no answer, so work on a small copy
+            scale = self.TEXT_DETECTION_SIZE / max(gray.shape[:2])
+            if scale < 1:
+                gray = cv2.resize(
+                    gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+                )
 
-            # Apply edge detection
+            # Rendered text leaves a high density of edges; flat UI does not
             edges = cv2.Canny(gray, 50, 150, apertureSize=3)
+            density = cv2.countNonZero(edges) / edges.size
 
-            # Find contours
-            contours, _ = cv2.findContours(
-                edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
-            )
-
-            # Look for text-like rectangular regions
-            text_regions = 0
-            for contour in contours:
-                x, y, w, h = cv2.boundingRect(contour)
-                aspect_ratio = w / h if h > 0 else 0
-
-                # Text regions typically have certain aspect ratios and sizes
-                if 0.2 < aspect_ratio < 20 and w > 10 and h > 5:
-                    text_regions += 1
-
-            return text_regions > 10  # Threshold for "likely contains text"
+            return density > self.TEXT_EDGE_DENSITY
 
         except Exception:
             return False
 
-    def _calculate_complexity(self, img: np.ndarray) -> float:
-        """Calculate image complexity based on edge density."""
+    def _calculate_complexity(self, edges: np.ndarray) -> float:
+        """Calculate image complexity from a Canny edge map."""
         try:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            edges = cv2.Canny(gray, 50, 150)
-            return np.sum(edges) / (img.shape[0] * img.shape[1] * 255)
+            return cv2.countNonZero(edges) / edges.size
         except Exception:
             return 0.0
 
     def is_screen_locked(self) -> bool:
         """Check if the screen is locked (basic detection)."""
-        try:
-            # Check for common lock screen processes
-            lock_processes = ["swaylock", "waylock", "gtklock"]
+        # Desktops that report locking to logind are answered from the
+        # watched LockedHint; the process probe covers standalone lockers
+        if self._locked_hint is None:
+            self._locked_hint = LockedHintWatcher()
+        if self._locked_hint.locked:
+            return True
 
-            for process in lock_processes:
-                result = subprocess.run(
-                    ["pgrep", process], capture_output=True, timeout=2
-                )
-                if result.returncode == 0:
-                    return True
+        now = time.monotonic()
+        if self._lock_cache and now - self._lock_cache[0] < self.LOCK_CHECK_TTL:
+            return self._lock_cache[1]
 
-            return False
+        try:
+            # Check for common lock screen processes with a single pgrep
+            result = subprocess.run(
+                ["pgrep", "|".join(self.LOCK_PROCESSES)],
+                capture_output=True,
+                timeout=2,
+            )
+            locked = result.returncode == 0
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+            locked = False
+
+        self._lock_cache = (now, locked)
+        return locked
 
     def get_active_window_info(self) -> dict:
         """Get information about the currently active window."""
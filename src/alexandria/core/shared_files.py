@@ -0,0 +1,45 @@
+"""Screenshot and thumbnail files shared between memories.
+
+Captures of an unchanged screen point at the same files, so a file may only
+be removed once no remaining memory refers to it. This module has no ORM
+dependency so that the plain-sqlite3 CLI commands can use it too.
+"""
+
+from typing import Callable, Iterable, Iterator, Optional, Set, Tuple
+
+# (screenshot_path, thumbnail_path) of a deleted memory
+PathRow = Tuple[Optional[str], Optional[str]]
+
+# Paths looked up per query; SQLite before 3.32 allows only 999 parameters
+QUERY_CHUNK_SIZE = 500
+
+
+def unreferenced_files(
+    execute: Callable[[str, tuple], Iterator[tuple]], rows: Iterable[PathRow]
+) -> Set[str]:
+    """Return the files of deleted memories that no remaining memory uses.
+
+    ``execute(sql, params)`` runs a qmark-style query against the memories
+    table (``sqlite3.Connection.execute`` or SQLAlchemy's
+    ``Connection.exec_driver_sql``) and must see the rows already deleted.
+    """
+    rows = list(rows)
+    unreferenced = set()
+    for column, paths in (
+        ("screenshot_path", {s for s, _ in rows if s}),
+        ("thumbnail_path", {t for _, t in rows if t}),
+    ):
+        candidates = sorted(paths)
+        for start in range(0, len(candidates), QUERY_CHUNK_SIZE):
+            chunk = candidates[start : start + QUERY_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            paths -= {
+                path
+                for (path,) in execute(
+                    f"SELECT DISTINCT {column} FROM memories"
+                    f" WHERE {column} IN ({placeholders})",
+                    tuple(chunk),
+                )
+            }
+        unreferenced |= paths
+    return unreferenced
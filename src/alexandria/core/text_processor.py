@@ -1,34 +1,279 @@
 """Advanced text processing and tagging for Alexandria using NLTK."""
 
+import importlib.util
 import logging
 import re
 import string
-from typing import List, Set, Dict, Optional
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import List, Set, Dict, Optional, Tuple
 from pathlib import Path
 
+from ..config.xdg import XDGDirs
+
 logger = logging.getLogger(__name__)
 
-try:
+# NLTK is only imported once a TextProcessor sets it up; importing it
+# registers dozens of lazy corpora and is too slow for processes that never
+# tag text
+NLTK_AVAILABLE = importlib.util.find_spec("nltk") is not None
+
+# NLTK data used here: (resource probed with nltk.data.find, package name)
+NLTK_RESOURCES = [
+    ("corpora/stopwords", "stopwords"),
+    ("corpora/wordnet", "wordnet"),
+    ("taggers/averaged_perceptron_tagger", "averaged_perceptron_tagger"),
+]
+
+# Variants of the above needed by newer NLTK releases; fetched when available
+NLTK_EXTRA_PACKAGES = [
+    "averaged_perceptron_tagger_eng",
+]
+
+
+def nltk_data_dir() -> Path:
+    """Directory that ``alexandria install`` downloads NLTK data into."""
+    return XDGDirs.data_home() / "nltk_data"
+
+
+def download_nltk_data() -> List[str]:
+    """Download the NLTK data used for tagging; returns packages that failed.
+
+    Run once at install time; the daemon never downloads at runtime.
+    """
     import nltk
-    from nltk.tokenize import word_tokenize, sent_tokenize
-    from nltk.corpus import stopwords
+
+    target = nltk_data_dir()
+    target.mkdir(parents=True, exist_ok=True)
+
+    failed = []
+    for _, package in NLTK_RESOURCES:
+        if not nltk.download(package, download_dir=str(target), quiet=True):
+            failed.append(package)
+
+    for package in NLTK_EXTRA_PACKAGES:
+        try:
+            nltk.download(package, download_dir=str(target), quiet=True)
+        except Exception:
+            pass
+
+    return failed
+
+
+# Set once the NLTK data has been found in this process
+_nltk_data_ready = False
+
+# Application name cleanup in one pass: drop common suffixes, reverse-DNS
+# prefixes and trailing version numbers, and turn separators into spaces
+APP_CLEAN_RE = re.compile(
+    r"(?P<suffix>\.(?:exe|app|desktop)$)"
+    r"|(?P<prefix>^(?:org|com|net)\.)"
+    r"|(?P<version>[-_]?\d+(?:\.\d+)*$)"
+    r"|(?P<separator>[-_.])"
+)
+
+
+def _app_clean_replacement(match: re.Match) -> str:
+    return " " if match.lastgroup == "separator" else ""
+
+
+# Window geometry such as "1920x1080+0+0"
+GEOMETRY_RE = re.compile(r"(\d+)x(\d+)")
+
+# Window area upper bounds (e.g. 640x480, 1024x768, 1920x1080) and the
+# category for each band; anything larger is "xlarge"
+WINDOW_SIZE_AREAS = (300_000, 1_000_000, 2_000_000)
+WINDOW_SIZE_CATEGORIES = ("small", "medium", "large", "xlarge")
+
+# Maps every ASCII punctuation character to a space
+PUNCTUATION_TABLE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+# Penn Treebank proper noun tags; runs of these form named entities
+PROPER_NOUN_TAGS = frozenset({"NNP", "NNPS"})
+
+# Penn Treebank tag prefix -> WordNet POS (adjective, verb, adverb)
+TAG_TO_WORDNET_POS = {"J": "a", "V": "v", "R": "r"}
+
+# Words for basic keyword extraction (3+ letters) and sentiment analysis
+KEYWORD_RE = re.compile(r"\b[a-zA-Z]{3,}\b")
+WORD_RE = re.compile(r"\b[a-zA-Z]+\b")
+
+# Basic stop words for keyword extraction without NLTK
+BASIC_STOP_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "from",
+        "up",
+        "about",
+        "into",
+        "through",
+        "during",
+        "before",
+        "after",
+        "above",
+        "below",
+        "out",
+        "off",
+        "down",
+        "under",
+        "again",
+        "further",
+        "then",
+        "once",
+        "here",
+        "there",
+        "when",
+        "where",
+        "why",
+        "how",
+        "all",
+        "any",
+        "both",
+        "each",
+        "few",
+        "more",
+        "most",
+        "other",
+        "some",
+        "such",
+        "only",
+        "own",
+        "same",
+        "than",
+        "too",
+        "very",
+        "can",
+        "will",
+        "just",
+        "should",
+        "now",
+        "this",
+        "that",
+        "these",
+        "those",
+    }
+)
+
+# Simple keyword-based sentiment vocabulary
+POSITIVE_WORDS = frozenset(
+    {
+        "good",
+        "great",
+        "excellent",
+        "amazing",
+        "wonderful",
+        "fantastic",
+        "success",
+        "successful",
+        "complete",
+        "completed",
+        "done",
+        "finished",
+        "yes",
+        "correct",
+        "right",
+        "perfect",
+        "awesome",
+        "love",
+        "like",
+    }
+)
+
+NEGATIVE_WORDS = frozenset(
+    {
+        "bad",
+        "terrible",
+        "awful",
+        "horrible",
+        "error",
+        "fail",
+        "failed",
+        "wrong",
+        "incorrect",
+        "problem",
+        "issue",
+        "bug",
+        "crash",
+        "broken",
+        "no",
+        "not",
+        "never",
+        "hate",
+        "dislike",
+        "impossible",
+    }
+)
+
+
+# Word -> +1 (positive) or -1 (negative) for a single lookup per word
+SENTIMENT_SCORES = {
+    **dict.fromkeys(POSITIVE_WORDS, 1),
+    **dict.fromkeys(NEGATIVE_WORDS, -1),
+}
+
+
+@lru_cache(maxsize=1)
+def _get_lemmatizer() -> "WordNetLemmatizer":
+    """Return the process-wide lemmatizer with WordNet loaded up front."""
+    from nltk.corpus import wordnet
     from nltk.stem import WordNetLemmatizer
-    from nltk.tag import pos_tag
-    from nltk.chunk import ne_chunk
-    from nltk.tree import Tree
 
-    NLTK_AVAILABLE = True
-except ImportError:
-    NLTK_AVAILABLE = False
-    logger.warning("NLTK not available, falling back to basic text processing")
+    # WordNet is a lazy corpus; load it here rather than on the first token
+    wordnet.ensure_loaded()
+    return WordNetLemmatizer()
+
+
+@lru_cache(maxsize=16384)
+def _lemmatize(word: str, pos: str = "n") -> str:
+    """Lemmatize with WordNet, memoizing the frequent repeats."""
+    return _get_lemmatizer().lemmatize(word, pos)
 
 
 class TextProcessor:
     """Advanced text processing with NLTK for tag generation."""
 
+    # Penn Treebank tags kept as keywords: nouns, verbs, and adjectives
+    INTERESTING_POS = frozenset(
+        {
+            "NN",
+            "NNS",
+            "NNP",
+            "NNPS",
+            "VB",
+            "VBD",
+            "VBG",
+            "VBN",
+            "VBP",
+            "VBZ",
+            "JJ",
+            "JJR",
+            "JJS",
+        }
+    )
+
+    # Texts shorter than this (or with fewer spaces, i.e. under ~3 words),
+    # typically window titles, gain nothing from POS tagging
+    MIN_TAGGED_TEXT_LENGTH = 20
+    MIN_TAGGED_TEXT_SPACES = 2
+
     def __init__(self):
         self.nltk_ready = False
         self.lemmatizer = None
+        self._lemmatize = None
         self.stop_words = set()
 
         if NLTK_AVAILABLE:
@@ -36,257 +281,218 @@ class TextProcessor:
         else:
             logger.warning("NLTK not available, using basic processing")
 
+        # The same app ids and window classes recur on every capture, and
+        # the same words on every screen
+        self._clean_app_name = lru_cache(maxsize=4096)(self._clean_app_name)
+        self._keyword_for = lru_cache(maxsize=65536)(self._keyword_for)
+
     def _setup_nltk(self):
-        """Set up NLTK components and download required data."""
+        """Set up NLTK components from locally installed data."""
+        global _nltk_data_ready
+
         try:
-            # Try to use existing data first
-            try:
-                nltk.data.find("tokenizers/punkt")
-                nltk.data.find("corpora/stopwords")
-                nltk.data.find("corpora/wordnet")
-                nltk.data.find("taggers/averaged_perceptron_tagger")
-                nltk.data.find("chunkers/maxent_ne_chunker")
-                nltk.data.find("corpora/words")
-            except LookupError:
-                # Download required NLTK data
-                logger.info("Downloading required NLTK data...")
-                nltk.download("punkt", quiet=True)
-                nltk.download("stopwords", quiet=True)
-                nltk.download("wordnet", quiet=True)
-                nltk.download("averaged_perceptron_tagger", quiet=True)
-                nltk.download("maxent_ne_chunker", quiet=True)
-                nltk.download("words", quiet=True)
-                # Also download the newer tagger if available
-                try:
-                    nltk.download("averaged_perceptron_tagger_eng", quiet=True)
-                    nltk.download("maxent_ne_chunker_tab", quiet=True)
-                except:
-                    pass
-
-            # Initialize components
-            self.lemmatizer = WordNetLemmatizer()
+            # The data only has to be located once per process
+            if not _nltk_data_ready:
+                self._find_nltk_data()
+                _nltk_data_ready = True
+
+            from nltk.corpus import stopwords
+
+            # Initialize components; the lemmatizer and its cache are shared
+            # by every TextProcessor in the process
+            self.lemmatizer = _get_lemmatizer()
+            self._lemmatize = _lemmatize
             self.stop_words = set(stopwords.words("english"))
             self.nltk_ready = True
             logger.info("NLTK initialized successfully")
 
+        except LookupError as e:
+            logger.warning(
+                f"{e}; run 'alexandria install' to download it. "
+                "Using basic processing"
+            )
+            self.nltk_ready = False
         except Exception as e:
             logger.error(f"Failed to initialize NLTK: {e}")
             self.nltk_ready = False
 
+    def _find_nltk_data(self):
+        """Check that the required NLTK data is installed.
+
+        Searches Alexandria's own data directory before NLTK's defaults and
+        raises LookupError naming the missing packages; nothing is
+        downloaded here, so startup never blocks on the network.
+        """
+        import nltk
+
+        data_dir = str(nltk_data_dir())
+        if data_dir not in nltk.data.path:
+            nltk.data.path.insert(0, data_dir)
+
+        missing = []
+        for resource, package in NLTK_RESOURCES:
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                missing.append(package)
+
+        if missing:
+            raise LookupError(f"NLTK data not installed: {', '.join(missing)}")
+
     def extract_keywords_from_text(
         self, text: str, max_keywords: int = 15
     ) -> List[str]:
         """Extract and lemmatize keywords from OCR text."""
-        if not text or not text.strip():
-            return []
+        return self.extract_keywords_from_texts([text], max_keywords)[0]
+
+    def extract_keywords_from_texts(
+        self, texts: List[str], max_keywords: int = 15
+    ) -> List[List[str]]:
+        """Extract keywords from several texts, one list per text.
+
+        NLTK loads its tagger model on every call, so tagging
+        a batch together pays that cost once instead of once per text.
+        Empty and short texts never reach NLTK.
+        """
+        results = [[] for _ in texts]
+        indices = []
+        for i, text in enumerate(texts):
+            if not text or text.isspace():
+                continue
+            if self.nltk_ready and not self._is_short_text(text):
+                indices.append(i)
+            else:
+                results[i] = self._extract_keywords_basic(text, max_keywords)
+
+        if indices:
+            keywords = self._extract_keywords_nltk(
+                [texts[i] for i in indices], max_keywords
+            )
+            for i, text_keywords in zip(indices, keywords):
+                results[i] = text_keywords
 
-        if self.nltk_ready:
-            return self._extract_keywords_nltk(text, max_keywords)
-        else:
-            return self._extract_keywords_basic(text, max_keywords)
+        return results
 
-    def _extract_keywords_nltk(self, text: str, max_keywords: int) -> List[str]:
-        """Extract keywords using NLTK with lemmatization."""
-        try:
-            # Tokenize and clean text
-            tokens = word_tokenize(text.lower())
+    def _is_short_text(self, text: str) -> bool:
+        return (
+            len(text) < self.MIN_TAGGED_TEXT_LENGTH
+            or text.count(" ") < self.MIN_TAGGED_TEXT_SPACES
+        )
 
-            # Remove punctuation and non-alphabetic tokens
-            tokens = [token for token in tokens if token.isalpha() and len(token) > 2]
+    def _extract_keywords_nltk(
+        self, texts: List[str], max_keywords: int
+    ) -> List[List[str]]:
+        """Extract keywords from a batch of texts using NLTK with lemmatization."""
+        from nltk.tag import pos_tag_sents
 
-            # Remove stop words
-            tokens = [token for token in tokens if token not in self.stop_words]
+        try:
+            # Tokenize and tag the original-case texts once; the same tags
+            # drive keyword filtering, lemmatization and named entity
+            # detection. Punctuation is blanked out first so OCR noise such as
+            # "|", "--" or "..." never becomes tokens to tag. Without
+            # punctuation the tokens are just the whitespace-separated words
+            # (OCR text is the recognised words joined by spaces), so NLTK's
+            # sentence and Treebank tokenizers are not needed.
+            tokenized = [text.translate(PUNCTUATION_TABLE).split() for text in texts]
 
             # Part-of-speech tagging with error handling
             try:
-                pos_tags = pos_tag(tokens)
+                tagged_texts = pos_tag_sents(tokenized)
             except LookupError as e:
                 logger.warning(
                     f"POS tagging failed: {e}, falling back to basic processing"
                 )
-                return self._extract_keywords_basic(text, max_keywords)
-
-            # Keep only nouns, verbs, and adjectives
-            interesting_pos = {
-                "NN",
-                "NNS",
-                "NNP",
-                "NNPS",
-                "VB",
-                "VBD",
-                "VBG",
-                "VBN",
-                "VBP",
-                "VBZ",
-                "JJ",
-                "JJR",
-                "JJS",
-            }
-            filtered_tokens = [
-                token for token, pos in pos_tags if pos in interesting_pos
-            ]
-
-            # Lemmatize tokens
-            lemmatized = []
-            for token in filtered_tokens:
-                try:
-                    # Get the appropriate POS for lemmatization
-                    pos = self._get_wordnet_pos(pos_tags, token)
-                    lemma = self.lemmatizer.lemmatize(token, pos)
-                    lemmatized.append(lemma)
-                except Exception as e:
-                    # If lemmatization fails, use the original token
-                    lemmatized.append(token)
+                return [self._extract_keywords_basic(t, max_keywords) for t in texts]
 
             # Extract named entities with error handling
             try:
-                named_entities = self._extract_named_entities(text)
+                named_entities = self._extract_named_entities(tagged_texts)
             except Exception as e:
                 logger.debug(f"Named entity extraction failed: {e}")
-                named_entities = []
-
-            # Combine and count frequency
-            all_keywords = lemmatized + named_entities
-            keyword_freq = {}
-            for keyword in all_keywords:
-                keyword_freq[keyword] = keyword_freq.get(keyword, 0) + 1
+                named_entities = [[] for _ in texts]
 
-            # Sort by frequency and return top keywords
-            sorted_keywords = sorted(
-                keyword_freq.items(), key=lambda x: x[1], reverse=True
-            )
-            return [keyword for keyword, freq in sorted_keywords[:max_keywords]]
+            return [
+                self._rank_keywords(pos_tags, entities, max_keywords)
+                for pos_tags, entities in zip(tagged_texts, named_entities)
+            ]
 
         except Exception as e:
             logger.error(f"Error in NLTK keyword extraction: {e}")
-            return self._extract_keywords_basic(text, max_keywords)
+            return [self._extract_keywords_basic(t, max_keywords) for t in texts]
 
-    def _extract_keywords_basic(self, text: str, max_keywords: int) -> List[str]:
-        """Basic keyword extraction without NLTK."""
-        # Simple word extraction and filtering
-        words = re.findall(r"\b[a-zA-Z]{3,}\b", text.lower())
-
-        # Basic stop words
-        basic_stop_words = {
-            "the",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "from",
-            "up",
-            "about",
-            "into",
-            "through",
-            "during",
-            "before",
-            "after",
-            "above",
-            "below",
-            "out",
-            "off",
-            "down",
-            "under",
-            "again",
-            "further",
-            "then",
-            "once",
-            "here",
-            "there",
-            "when",
-            "where",
-            "why",
-            "how",
-            "all",
-            "any",
-            "both",
-            "each",
-            "few",
-            "more",
-            "most",
-            "other",
-            "some",
-            "such",
-            "only",
-            "own",
-            "same",
-            "than",
-            "too",
-            "very",
-            "can",
-            "will",
-            "just",
-            "should",
-            "now",
-            "this",
-            "that",
-            "these",
-            "those",
-        }
-
-        # Filter words
-        filtered_words = [word for word in words if word not in basic_stop_words]
-
-        # Count frequency
-        word_freq = {}
-        for word in filtered_words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-
-        # Sort by frequency
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, freq in sorted_words[:max_keywords]]
-
-    def _get_wordnet_pos(self, pos_tags: List[tuple], token: str) -> str:
-        """Convert POS tag to WordNet POS for lemmatization."""
-        # Find the POS tag for the token
-        pos = None
-        for word, tag in pos_tags:
-            if word == token:
-                pos = tag
-                break
-
-        if not pos:
-            return "n"  # Default to noun
-
-        # Convert to WordNet POS
-        if pos.startswith("J"):
-            return "a"  # Adjective
-        elif pos.startswith("V"):
-            return "v"  # Verb
-        elif pos.startswith("R"):
-            return "r"  # Adverb
-        else:
-            return "n"  # Noun (default)
+    def _rank_keywords(
+        self, pos_tags: List[tuple], named_entities: List[str], max_keywords: int
+    ) -> List[str]:
+        """Pick the most frequent lemmatized keywords and named entities."""
+        # The per-token decision is memoized per (token, tag) pair, so the
+        # loop itself runs in C through map/filter and Counter
+        keyword_freq = Counter(filter(None, map(self._keyword_for, pos_tags)))
+        keyword_freq.update(named_entities)
+
+        # Return the most frequent keywords
+        return [keyword for keyword, freq in keyword_freq.most_common(max_keywords)]
+
+    def _keyword_for(self, tagged: Tuple[str, str]) -> Optional[str]:
+        """Return the keyword lemma for a (token, POS tag) pair, or None.
+
+        Keeps alphabetic nouns, verbs and adjectives that are not stop words,
+        lemmatized with their known POS.
+        """
+        token, pos = tagged
+        if pos not in self.INTERESTING_POS:
+            return None
+        token = token.lower()
+        if len(token) <= 2 or not token.isalpha() or token in self.stop_words:
+            return None
 
-    def _extract_named_entities(self, text: str) -> List[str]:
-        """Extract named entities from text."""
         try:
-            tokens = word_tokenize(text)
-            pos_tags = pos_tag(tokens)
-            chunks = ne_chunk(pos_tags)
-
-            entities = []
-            for chunk in chunks:
-                if isinstance(chunk, Tree):
-                    # This is a named entity
-                    entity = " ".join([token for token, pos in chunk.leaves()])
-                    entities.append(entity.lower())
+            # WordNet POS from the tag's first letter, noun by default
+            return self._lemmatize(token, TAG_TO_WORDNET_POS.get(pos[:1], "n"))
+        except Exception as e:
+            # If lemmatization fails, use the original token
+            return token
 
-            return entities
+    def _extract_keywords_basic(self, text: str, max_keywords: int) -> List[str]:
+        """Basic keyword extraction without NLTK."""
+        # Extract, filter and count words in a single streaming pass
+        word_freq = Counter(
+            word
+            for word in map(itemgetter(0), KEYWORD_RE.finditer(text.lower()))
+            if word not in BASIC_STOP_WORDS
+        )
+        return [word for word, freq in word_freq.most_common(max_keywords)]
+
+    def _extract_named_entities(
+        self, tagged_texts: List[List[tuple]]
+    ) -> List[List[str]]:
+        """Extract named entities from POS-tagged texts, one list per text.
+
+        An entity is a run of consecutive proper nouns (NNP/NNPS), which is
+        close to what NLTK's maxent chunker finds in screen text at a small
+        fraction of its cost.
+        """
+        results = []
+        for pos_tags in tagged_texts:
+            runs = groupby(pos_tags, key=lambda tagged: tagged[1] in PROPER_NOUN_TAGS)
+            results.append(
+                [
+                    " ".join(token for token, pos in run).lower()
+                    for is_proper_noun, run in runs
+                    if is_proper_noun
+                ]
+            )
 
-        except Exception as e:
-            logger.error(f"Error extracting named entities: {e}")
-            return []
+        return results
 
     def generate_window_app_tags(self, window_info: Dict) -> List[str]:
         """Generate tags from window and application information."""
+        size_category = self._categorize_window_size(window_info.get("geometry", ""))
+        return self._window_app_tags(window_info, size_category)
+
+    def _window_app_tags(
+        self, window_info: Dict, size_category: Optional[str]
+    ) -> List[str]:
+        """Generate window/app tags given the precomputed size category."""
         tags = []
 
         # Process application name
@@ -299,7 +505,7 @@ class TextProcessor:
 
                 # Add lemmatized version if different
                 if self.nltk_ready and self.lemmatizer:
-                    lemmatized = self.lemmatizer.lemmatize(app_clean.lower())
+                    lemmatized = self._lemmatize(app_clean.lower())
                     if lemmatized != app_clean.lower():
                         tags.append(f"app:{lemmatized}")
 
@@ -328,8 +534,6 @@ class TextProcessor:
         if geometry:
             tags.append(f"geometry:{geometry}")
 
-            # Extract size category
-            size_category = self._categorize_window_size(geometry)
             if size_category:
                 tags.append(f"size:{size_category}")
 
@@ -340,16 +544,9 @@ class TextProcessor:
         if not app_name:
             return ""
 
-        # Remove common suffixes and prefixes
-        cleaned = app_name.lower()
-        cleaned = re.sub(r"\.(exe|app|desktop)$", "", cleaned)
-        cleaned = re.sub(r"^(org\.|com\.|net\.)", "", cleaned)
-
-        # Remove version numbers
-        cleaned = re.sub(r"[-_]?\d+(\.\d+)*$", "", cleaned)
-
-        # Replace separators with spaces for keyword extraction
-        cleaned = re.sub(r"[-_.]", " ", cleaned)
+        # Remove common suffixes, prefixes and version numbers, and replace
+        # separators with spaces for keyword extraction
+        cleaned = APP_CLEAN_RE.sub(_app_clean_replacement, app_name.lower())
 
         # Get the main part (usually the first word)
         words = cleaned.split()
@@ -357,118 +554,99 @@ class TextProcessor:
             main_word = words[0]
             # Lemmatize if possible
             if self.nltk_ready and self.lemmatizer:
-                main_word = self.lemmatizer.lemmatize(main_word)
+                main_word = self._lemmatize(main_word)
             return main_word
 
-        return cleaned
+        return cleaned.strip()
 
-    def _categorize_window_size(self, geometry: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _categorize_window_size(geometry: str) -> Optional[str]:
         """Categorize window size based on geometry string."""
         try:
             # Parse geometry string like "1920x1080+0+0"
-            match = re.match(r"(\d+)x(\d+)", geometry)
+            match = GEOMETRY_RE.match(geometry)
             if match:
                 width, height = int(match.group(1)), int(match.group(2))
                 area = width * height
 
                 # Categorize by area
-                if area < 300000:  # < 300k pixels (e.g., 640x480)
-                    return "small"
-                elif area < 1000000:  # < 1M pixels (e.g., 1024x768)
-                    return "medium"
-                elif area < 2000000:  # < 2M pixels (e.g., 1920x1080)
-                    return "large"
-                else:
-                    return "xlarge"
+                return WINDOW_SIZE_CATEGORIES[bisect_right(WINDOW_SIZE_AREAS, area)]
 
         except Exception:
             pass
 
         return None
 
+    @staticmethod
+    def _categorize_window_sizes(geometries: List[str]) -> List[Optional[str]]:
+        """Categorize a batch of geometry strings in one vectorized pass."""
+        import numpy as np
+
+        matches = [GEOMETRY_RE.match(geometry or "") for geometry in geometries]
+        dims = np.array(
+            [match.groups() if match else ("0", "0") for match in matches],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+
+        # Same banding as bisect_right in _categorize_window_size
+        bands = np.digitize(dims[:, 0] * dims[:, 1], WINDOW_SIZE_AREAS)
+        return [
+            WINDOW_SIZE_CATEGORIES[band] if match else None
+            for match, band in zip(matches, bands.tolist())
+        ]
+
     def generate_content_tags(
         self, ocr_text: str, window_info: Dict, max_total_tags: int = 20
     ) -> List[str]:
         """Generate comprehensive tags from OCR text and window information."""
-        all_tags = []
-
-        # Extract keywords from OCR text
-        if ocr_text:
-            text_keywords = self.extract_keywords_from_text(ocr_text, max_keywords=10)
-            all_tags.extend(text_keywords)
+        return self.generate_content_tags_batch(
+            [(ocr_text, window_info)], max_total_tags
+        )[0]
+
+    def generate_content_tags_batch(
+        self, items: List[Tuple[str, Dict]], max_total_tags: int = 20
+    ) -> List[List[str]]:
+        """Generate tags for several (OCR text, window info) pairs at once."""
+        # Extract keywords from all OCR texts in one batch
+        text_keywords = self.extract_keywords_from_texts(
+            [ocr_text for ocr_text, _ in items], max_keywords=10
+        )
+
+        # A lone geometry is answered from the memoized scalar lookup; the
+        # vectorized pass only pays off for a real batch
+        geometries = [window_info.get("geometry", "") for _, window_info in items]
+        if len(geometries) > 1:
+            size_categories = self._categorize_window_sizes(geometries)
+        else:
+            size_categories = [self._categorize_window_size(g) for g in geometries]
 
-        # Add window/app information tags
-        window_tags = self.generate_window_app_tags(window_info)
-        all_tags.extend(window_tags)
+        results = []
+        for keywords, size_category, (_, window_info) in zip(
+            text_keywords, size_categories, items
+        ):
+            # Add window/app information tags
+            all_tags = keywords + self._window_app_tags(window_info, size_category)
 
-        # Add timestamp-based tags (could be added by caller)
+            # Add timestamp-based tags (could be added by caller)
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_tags = []
-        for tag in all_tags:
-            if tag not in seen:
-                seen.add(tag)
-                unique_tags.append(tag)
+            # Remove duplicates while preserving order, and limit the total
+            results.append(list(dict.fromkeys(all_tags))[:max_total_tags])
 
-        # Limit total number of tags
-        return unique_tags[:max_total_tags]
+        return results
 
     def analyze_text_sentiment(self, text: str) -> Dict[str, float]:
         """Basic sentiment analysis (could be enhanced with additional libraries)."""
         if not text:
             return {"sentiment": "neutral", "confidence": 0.0}
 
-        # Simple keyword-based sentiment analysis
-        positive_words = {
-            "good",
-            "great",
-            "excellent",
-            "amazing",
-            "wonderful",
-            "fantastic",
-            "success",
-            "successful",
-            "complete",
-            "completed",
-            "done",
-            "finished",
-            "yes",
-            "correct",
-            "right",
-            "perfect",
-            "awesome",
-            "love",
-            "like",
-        }
-
-        negative_words = {
-            "bad",
-            "terrible",
-            "awful",
-            "horrible",
-            "error",
-            "fail",
-            "failed",
-            "wrong",
-            "incorrect",
-            "problem",
-            "issue",
-            "bug",
-            "crash",
-            "broken",
-            "no",
-            "not",
-            "never",
-            "hate",
-            "dislike",
-            "impossible",
-        }
-
-        words = re.findall(r"\b[a-zA-Z]+\b", text.lower())
-
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
+        # Map every word to its score and drop the neutral ones; map and
+        # filter run the per-word loop in C
+        scores = list(
+            filter(None, map(SENTIMENT_SCORES.get, WORD_RE.findall(text.lower())))
+        )
+        positive_count = scores.count(1)
+        negative_count = scores.count(-1)
         total_sentiment_words = positive_count + negative_count
 
         if total_sentiment_words == 0:
@@ -3,100 +3,436 @@
 import json
 import logging
 import os
+import shutil
+import socket
+import struct
 import subprocess
-from typing import Dict, Optional, List
+import threading
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, List, Set, Tuple, Union
 import time
 
 logger = logging.getLogger(__name__)
 
+# orjson parses the large Sway trees several times faster; its decode error
+# subclasses json.JSONDecodeError, so either parser's errors are caught alike
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Window details: pid is an int (None when unknown), the rest are strings
+WindowInfo = Mapping[str, Union[str, int, None]]
+
+# Returned whenever no window can be identified; read-only so it can be
+# shared, the public getters hand out copies
+EMPTY_WINDOW_INFO = MappingProxyType(
+    {
+        "title": "",
+        "app_id": "",
+        "window_class": "",
+        "pid": None,
+        "workspace": "",
+        "geometry": "",
+    }
+)
+
+# Command-line tools used to query compositors
+COMPOSITOR_TOOLS = ("swaymsg", "hyprctl", "gdbus")
+
+# Sway IPC framing: magic string, payload length, message type
+SWAY_IPC_MAGIC = b"i3-ipc"
+SWAY_IPC_HEADER = struct.Struct("=6sII")
+SWAY_IPC_SUBSCRIBE = 2
+SWAY_IPC_GET_TREE = 4
+SWAY_IPC_EVENT = 0x80000000  # set in the type of event messages
+
+# Compositors answer in milliseconds; a wedged one should not stall a
+# capture for long
+QUERY_TIMEOUT = 0.5
+DBUS_TIMEOUT_MS = int(QUERY_TIMEOUT * 1000)
+
+# Hyprland events after which the focused window or its details may differ
+HYPRLAND_WINDOW_EVENTS = frozenset(
+    {
+        b"activewindow",
+        b"activewindowv2",
+        b"windowtitle",
+        b"windowtitlev2",
+        b"workspace",
+        b"workspacev2",
+        b"focusedmon",
+        b"focusedmonv2",
+        b"movewindow",
+        b"movewindowv2",
+        b"openwindow",
+        b"closewindow",
+        b"fullscreen",
+        b"changefloatingmode",
+    }
+)
+
+# XDG_CURRENT_DESKTOP names (lowercased) -> compositor
+DESKTOP_COMPOSITORS = {
+    "gnome": "gnome",
+    "kde": "kde",
+    "plasma": "kde",
+    "wlroots": "wlroots",
+}
+
+# Compositor process names in detection order
+COMPOSITOR_PROCESSES = (
+    ("sway", "sway"),
+    ("Hyprland", "hyprland"),
+    ("gnome-shell", "gnome"),
+    ("kwin_wayland", "kde"),
+)
+
+
+def _running_process_names() -> Set[str]:
+    """Return the names of all running processes.
+
+    Reads /proc/<pid>/comm directly rather than spawning pgrep once per
+    candidate; falls back to a single ps call where /proc is unavailable.
+    """
+    names = set()
+    try:
+        pids = [entry for entry in os.listdir("/proc") if entry.isdigit()]
+    except OSError:
+        try:
+            result = subprocess.run(
+                ["ps", "-eo", "comm="],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=1,
+            )
+            return {line.strip() for line in result.stdout.splitlines()}
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return names
+
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/comm") as f:
+                names.add(f.read().strip())
+        except OSError:
+            # Process exited or is not readable
+            continue
+
+    return names
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes from a stream socket."""
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise OSError("Connection closed by compositor")
+        buf += chunk
+    return bytes(buf)
+
+
+def _hyprland_socket_path(name: str = ".socket.sock") -> Optional[str]:
+    """Locate one of Hyprland's sockets for the current instance.
+
+    ".socket.sock" serves requests; ".socket2.sock" streams events.
+    """
+    signature = os.getenv("HYPRLAND_INSTANCE_SIGNATURE")
+    if not signature:
+        return None
+
+    # Hyprland moved its sockets from /tmp to XDG_RUNTIME_DIR in 0.40
+    candidates = [f"/tmp/hypr/{signature}/{name}"]
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        candidates.insert(0, f"{runtime_dir}/hypr/{signature}/{name}")
+
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+# Keyed on the environment that identifies the session, so repeated
+# constructions within a process skip the environment checks and /proc scan
+@lru_cache(maxsize=8)
+def _detect_compositor(
+    swaysock: Optional[str],
+    hyprland_signature: Optional[str],
+    qtile_xephyr: Optional[str],
+    current_desktop: Optional[str],
+) -> str:
+    # Check environment variables
+    if swaysock:
+        return "sway"
+    elif hyprland_signature:
+        return "hyprland"
+    elif qtile_xephyr:
+        return "qtile"
+    elif current_desktop:
+        # XDG_CURRENT_DESKTOP is a colon-separated list of desktop names
+        for desktop in current_desktop.lower().split(":"):
+            if desktop in DESKTOP_COMPOSITORS:
+                return DESKTOP_COMPOSITORS[desktop]
+
+    # Try to detect by process name
+    running = _running_process_names()
+    for process_name, compositor in COMPOSITOR_PROCESSES:
+        if process_name in running:
+            return compositor
+
+    return "unknown"
+
 
 class WaylandWindowInfo:
     """Gather window information from Wayland compositors."""
 
+    # Queries repeated within this many seconds reuse the previous answer
+    WINDOW_INFO_TTL = 0.1
+    # While compositor events are watched, answers stay valid until an event
+    # reports a change; resizes send no event, so they still expire
+    WATCHED_INFO_TTL = 5.0
+
     def __init__(self):
         self.compositor_type = self._detect_compositor()
         logger.info(f"Detected Wayland compositor: {self.compositor_type}")
 
+        # Absolute tool paths, resolved once; None when a tool is missing
+        self._bin = {tool: shutil.which(tool) for tool in COMPOSITOR_TOOLS}
+
+        # Compositor IPC sockets, used in preference to the tools above
+        self._sway_sock: Optional[socket.socket] = None
+        self._hyprland_socket = _hyprland_socket_path()
+        self._session_bus = None
+
+        # (time.monotonic() of the query, result) for cached queries
+        self._active_cache: Optional[Tuple[float, WindowInfo]] = None
+        self._list_cache: Optional[Tuple[float, List[WindowInfo]]] = None
+        self._tree_cache: Optional[Tuple[float, Optional[Dict]]] = None
+
+        # Bumped on every compositor event; queries that raced an event are
+        # not cached
+        self._generation = 0
+        self._watching = False
+        self._start_event_watcher()
+
     def _detect_compositor(self) -> str:
         """Detect the running Wayland compositor."""
-        # Check environment variables
-        if os.getenv("SWAYSOCK"):
-            return "sway"
-        elif os.getenv("HYPRLAND_INSTANCE_SIGNATURE"):
-            return "hyprland"
-        elif os.getenv("QTILE_XEPHYR"):
-            return "qtile"
-        elif os.getenv("XDG_CURRENT_DESKTOP"):
-            desktop = os.getenv("XDG_CURRENT_DESKTOP", "").lower()
-            if "gnome" in desktop:
-                return "gnome"
-            elif "kde" in desktop or "plasma" in desktop:
-                return "kde"
-            elif "wlroots" in desktop:
-                return "wlroots"
-
-        # Try to detect by process name
+        return _detect_compositor(
+            os.getenv("SWAYSOCK"),
+            os.getenv("HYPRLAND_INSTANCE_SIGNATURE"),
+            os.getenv("QTILE_XEPHYR"),
+            os.getenv("XDG_CURRENT_DESKTOP"),
+        )
+
+    def _cache_ttl(self) -> float:
+        return self.WATCHED_INFO_TTL if self._watching else self.WINDOW_INFO_TTL
+
+    def _invalidate_caches(self):
+        """Drop cached answers after the compositor reported a change."""
+        self._generation += 1
+        self._active_cache = self._list_cache = self._tree_cache = None
+
+    def _start_event_watcher(self):
+        """Watch compositor events in the background, where supported."""
+        if self.compositor_type == "sway":
+            path, target = os.getenv("SWAYSOCK"), self._watch_sway_events
+        elif self.compositor_type == "hyprland":
+            path = _hyprland_socket_path(".socket2.sock")
+            target = self._watch_hyprland_events
+        else:
+            return
+
+        if path:
+            self._watching = True
+            threading.Thread(
+                target=target,
+                args=(path,),
+                name="alexandria-window-events",
+                daemon=True,
+            ).start()
+
+    def _watch_sway_events(self, path: str):
+        """Invalidate cached answers on every Sway window or workspace event."""
         try:
-            result = subprocess.run(
-                ["pgrep", "-x", "sway"], capture_output=True, timeout=2
-            )
-            if result.returncode == 0:
-                return "sway"
-
-            result = subprocess.run(
-                ["pgrep", "-x", "Hyprland"], capture_output=True, timeout=2
-            )
-            if result.returncode == 0:
-                return "hyprland"
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(path)
+                payload = b'["window", "workspace"]'
+                sock.sendall(
+                    SWAY_IPC_HEADER.pack(
+                        SWAY_IPC_MAGIC, len(payload), SWAY_IPC_SUBSCRIBE
+                    )
+                    + payload
+                )
+                while True:
+                    _, length, msg_type = SWAY_IPC_HEADER.unpack(
+                        _recv_exact(sock, SWAY_IPC_HEADER.size)
+                    )
+                    _recv_exact(sock, length)
+                    if msg_type & SWAY_IPC_EVENT:
+                        self._invalidate_caches()
+        except OSError as e:
+            logger.debug(f"Stopped watching Sway events: {e}")
+        finally:
+            self._watching = False
+            self._invalidate_caches()
+
+    def _watch_hyprland_events(self, path: str):
+        """Invalidate cached answers on Hyprland focus and window events."""
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(path)
+                # Events arrive one per line as "name>>data"
+                for line in sock.makefile("rb"):
+                    if line.split(b">>", 1)[0] in HYPRLAND_WINDOW_EVENTS:
+                        self._invalidate_caches()
+        except OSError as e:
+            logger.debug(f"Stopped watching Hyprland events: {e}")
+        finally:
+            self._watching = False
+            self._invalidate_caches()
+
+    def _sway_ipc(self, msg_type: int, payload: bytes = b"") -> Optional[bytes]:
+        """Exchange one message over the Sway IPC socket.
+
+        The connection is opened on first use and kept for later calls.
+        Returns None when no socket is advertised; raises OSError when the
+        exchange fails, after dropping the connection.
+        """
+        if self._sway_sock is None:
+            path = os.getenv("SWAYSOCK")
+            if not path:
+                return None
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(QUERY_TIMEOUT)
+            try:
+                sock.connect(path)
+            except OSError:
+                sock.close()
+                raise
+            self._sway_sock = sock
 
-            result = subprocess.run(
-                ["pgrep", "-x", "gnome-shell"], capture_output=True, timeout=2
+        try:
+            self._sway_sock.sendall(
+                SWAY_IPC_HEADER.pack(SWAY_IPC_MAGIC, len(payload), msg_type) + payload
             )
-            if result.returncode == 0:
-                return "gnome"
-
-            result = subprocess.run(
-                ["pgrep", "-x", "kwin_wayland"], capture_output=True, timeout=2
+            magic, length, _ = SWAY_IPC_HEADER.unpack(
+                _recv_exact(self._sway_sock, SWAY_IPC_HEADER.size)
             )
-            if result.returncode == 0:
-                return "kde"
-
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+            if magic != SWAY_IPC_MAGIC:
+                raise OSError("Unexpected Sway IPC reply")
+            return _recv_exact(self._sway_sock, length)
+        except OSError:
+            self._sway_sock.close()
+            self._sway_sock = None
+            raise
+
+    def _get_sway_tree(self) -> Optional[Dict]:
+        """Return the Sway layout tree, shared by queries in the same tick."""
+        now = time.monotonic()
+        cache = self._tree_cache
+        if cache and now - cache[0] < self._cache_ttl():
+            return cache[1]
+
+        generation = self._generation
+        tree = self._fetch_sway_tree()
+        if generation == self._generation:
+            self._tree_cache = (now, tree)
+        return tree
+
+    def _fetch_sway_tree(self) -> Optional[Dict]:
+        """Fetch the Sway layout tree, over IPC when possible."""
+        try:
+            reply = self._sway_ipc(SWAY_IPC_GET_TREE)
+            if reply is not None:
+                return json_loads(reply)
+        except OSError as e:
+            logger.debug(f"Sway IPC failed, falling back to swaymsg: {e}")
+
+        if not self._bin["swaymsg"]:
+            return None
+
+        result = subprocess.run(
+            [self._bin["swaymsg"], "-t", "get_tree"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=QUERY_TIMEOUT,
+        )
+        if result.returncode == 0:
+            return json_loads(result.stdout)
+        return None
 
-        return "unknown"
+    def _hyprland_query(self, command: str):
+        """Run a Hyprland query returning JSON, over IPC when possible.
+
+        Hyprland serves one request per connection on its request socket.
+        """
+        if self._hyprland_socket:
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.settimeout(QUERY_TIMEOUT)
+                    sock.connect(self._hyprland_socket)
+                    sock.sendall(f"j/{command}".encode("utf-8"))
+                    chunks = []
+                    while chunk := sock.recv(65536):
+                        chunks.append(chunk)
+                return json_loads(b"".join(chunks))
+            except OSError as e:
+                logger.debug(f"Hyprland IPC failed, falling back to hyprctl: {e}")
+
+        if not self._bin["hyprctl"]:
+            return None
+
+        result = subprocess.run(
+            [self._bin["hyprctl"], command, "-j"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=QUERY_TIMEOUT,
+        )
+        if result.returncode == 0:
+            return json_loads(result.stdout)
+        return None
 
-    def get_active_window_info(self) -> Dict[str, Optional[str]]:
+    def get_active_window_info(self) -> WindowInfo:
         """Get information about the currently active window."""
+        now = time.monotonic()
+        cache = self._active_cache
+        if cache and now - cache[0] < self._cache_ttl():
+            return dict(cache[1])
+
+        generation = self._generation
         if self.compositor_type == "sway":
-            return self._get_sway_window_info()
+            info = self._get_sway_window_info()
         elif self.compositor_type == "hyprland":
-            return self._get_hyprland_window_info()
+            info = self._get_hyprland_window_info()
         elif self.compositor_type == "gnome":
-            return self._get_gnome_window_info()
+            info = self._get_gnome_window_info()
         elif self.compositor_type == "kde":
-            return self._get_kde_window_info()
+            info = self._get_kde_window_info()
         else:
-            return self._get_generic_window_info()
+            info = self._get_generic_window_info()
+
+        if generation == self._generation:
+            self._active_cache = (now, info)
+        return dict(info)
 
-    def _get_sway_window_info(self) -> Dict[str, Optional[str]]:
+    def _get_sway_window_info(self) -> WindowInfo:
         """Get window info from Sway compositor."""
         try:
-            result = subprocess.run(
-                ["swaymsg", "-t", "get_tree"], capture_output=True, text=True, timeout=5
-            )
-
-            if result.returncode == 0:
-                tree = json.loads(result.stdout)
-                focused_window = self._find_focused_window(tree)
+            tree = self._get_sway_tree()
+            if tree:
+                focused_window, workspace = self._find_focused_window(tree)
 
                 if focused_window:
                     return {
                         "title": focused_window.get("name", ""),
                         "app_id": focused_window.get("app_id", ""),
                         "window_class": focused_window.get("window_class", ""),
-                        "pid": str(focused_window.get("pid", "")),
-                        "workspace": self._get_sway_workspace(tree),
+                        "pid": focused_window.get("pid"),
+                        "workspace": workspace,
                         "geometry": self._format_geometry(
                             focused_window.get("rect", {})
                         ),
@@ -112,27 +448,19 @@ class WaylandWindowInfo:
             logger.debug(f"Failed to get Sway window info: {e}")
             return self._empty_window_info()
 
-    def _get_hyprland_window_info(self) -> Dict[str, Optional[str]]:
+    def _get_hyprland_window_info(self) -> WindowInfo:
         """Get window info from Hyprland compositor."""
         try:
             # Get active window
-            result = subprocess.run(
-                ["hyprctl", "activewindow", "-j"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode == 0:
-                window = json.loads(result.stdout)
-
+            window = self._hyprland_query("activewindow")
+            if window:
                 return {
                     "title": window.get("title", ""),
                     "app_id": window.get("class", ""),
                     "window_class": window.get("class", ""),
-                    "pid": str(window.get("pid", "")),
+                    "pid": window.get("pid"),
                     "workspace": window.get("workspace", {}).get("name", ""),
-                    "geometry": f"{window.get('size', [0, 0])[0]}x{window.get('size', [0, 0])[1]}+{window.get('at', [0, 0])[0]}+{window.get('at', [0, 0])[1]}",
+                    "geometry": self._format_hyprland_geometry(window),
                 }
 
             return self._empty_window_info()
@@ -145,13 +473,16 @@ class WaylandWindowInfo:
             logger.debug(f"Failed to get Hyprland window info: {e}")
             return self._empty_window_info()
 
-    def _get_gnome_window_info(self) -> Dict[str, Optional[str]]:
+    def _get_gnome_window_info(self) -> WindowInfo:
         """Get window info from GNOME Shell."""
+        if not self._bin["gdbus"]:
+            return self._empty_window_info()
+
         try:
             # Try using gdbus to get window info from GNOME Shell
             result = subprocess.run(
                 [
-                    "gdbus",
+                    self._bin["gdbus"],
                     "call",
                     "--session",
                     "--dest",
@@ -162,9 +493,10 @@ class WaylandWindowInfo:
                     "org.gnome.Shell.Eval",
                     "global.get_window_actors().filter(a => a.meta_window.has_focus())[0]?.meta_window",
                 ],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                timeout=5,
+                timeout=QUERY_TIMEOUT,
             )
 
             if result.returncode == 0:
@@ -174,7 +506,7 @@ class WaylandWindowInfo:
                     "title": "GNOME Window",  # Would need more complex parsing
                     "app_id": "unknown",
                     "window_class": "unknown",
-                    "pid": "",
+                    "pid": None,
                     "workspace": "",
                     "geometry": "",
                 }
@@ -185,130 +517,91 @@ class WaylandWindowInfo:
             logger.debug(f"Failed to get GNOME window info: {e}")
             return self._empty_window_info()
 
-    def _get_kde_window_info(self) -> Dict[str, Optional[str]]:
+    def _get_kde_window_info(self) -> WindowInfo:
         """Get window info from KDE Plasma."""
-        try:
-            # Try using qdbus to get window info from KWin
-            result = subprocess.run(
-                ["qdbus", "org.kde.KWin", "/KWin", "org.kde.KWin.activeWindow"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode == 0:
-                window_id = result.stdout.strip()
-
-                # Get window title
-                title_result = subprocess.run(
-                    [
-                        "qdbus",
-                        "org.kde.KWin",
-                        f"/KWin/Window_{window_id}",
-                        "org.kde.KWin.Window.caption",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-
-                # Get window class
-                class_result = subprocess.run(
-                    [
-                        "qdbus",
-                        "org.kde.KWin",
-                        f"/KWin/Window_{window_id}",
-                        "org.kde.KWin.Window.resourceClass",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-
-                return {
-                    "title": (
-                        title_result.stdout.strip()
-                        if title_result.returncode == 0
-                        else ""
-                    ),
-                    "app_id": (
-                        class_result.stdout.strip()
-                        if class_result.returncode == 0
-                        else ""
-                    ),
-                    "window_class": (
-                        class_result.stdout.strip()
-                        if class_result.returncode == 0
-                        else ""
-                    ),
-                    "pid": "",
-                    "workspace": "",
-                    "geometry": "",
-                }
-
-            return self._empty_window_info()
-
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            logger.debug(f"Failed to get KDE window info: {e}")
-            return self._empty_window_info()
+        from gi.repository import GLib
 
-    def _get_generic_window_info(self) -> Dict[str, Optional[str]]:
-        """Fallback method for unknown compositors."""
         try:
-            # Try to get info from /proc/self/environ of focused application
-            # This is a very basic fallback
-            result = subprocess.run(
-                ["xprop", "-root", "_NET_ACTIVE_WINDOW"],
-                capture_output=True,
-                text=True,
-                timeout=2,
+            # Ask KWin for the active window, then fetch all of its
+            # properties in one call
+            (window_id,) = self._dbus_call(
+                "org.kde.KWin", "/KWin", "org.kde.KWin", "activeWindow"
             )
-
-            # Note: xprop won't work on pure Wayland, this is just a placeholder
-            # In practice, we'd need compositor-specific protocols
-
-            return self._empty_window_info()
-
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            logger.debug(f"Generic window info failed: {e}")
-            return self._empty_window_info()
-
-    def _find_focused_window(self, node: Dict) -> Optional[Dict]:
-        """Recursively find the focused window in Sway tree."""
-        if node.get("focused"):
-            return node
-
-        for child in node.get("nodes", []):
-            result = self._find_focused_window(child)
-            if result:
-                return result
-
-        for child in node.get("floating_nodes", []):
-            result = self._find_focused_window(child)
-            if result:
-                return result
-
-        return None
-
-    def _get_sway_workspace(self, tree: Dict) -> str:
-        """Get the current workspace name from Sway tree."""
-        try:
-            result = subprocess.run(
-                ["swaymsg", "-t", "get_workspaces"],
-                capture_output=True,
-                text=True,
-                timeout=2,
+            (properties,) = self._dbus_call(
+                "org.kde.KWin",
+                f"/KWin/Window_{window_id}",
+                "org.freedesktop.DBus.Properties",
+                "GetAll",
+                GLib.Variant("(s)", ("org.kde.KWin.Window",)),
             )
 
-            if result.returncode == 0:
-                workspaces = json.loads(result.stdout)
-                for ws in workspaces:
-                    if ws.get("focused"):
-                        return ws.get("name", "")
-        except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError):
-            pass
+            resource_class = properties.get("resourceClass", "")
+            return {
+                "title": properties.get("caption", ""),
+                "app_id": resource_class,
+                "window_class": resource_class,
+                "pid": None,
+                "workspace": "",
+                "geometry": "",
+            }
+
+        except (GLib.Error, ValueError) as e:
+            logger.debug(f"Failed to get KDE window info: {e}")
+            return self._empty_window_info()
 
-        return ""
+    def _dbus_call(
+        self,
+        bus_name: str,
+        object_path: str,
+        interface: str,
+        method: str,
+        parameters=None,
+    ) -> tuple:
+        """Call a method on the session bus and return the unpacked reply."""
+        from gi.repository import Gio
+
+        # One session bus connection serves every call
+        if self._session_bus is None:
+            self._session_bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+
+        reply = self._session_bus.call_sync(
+            bus_name,
+            object_path,
+            interface,
+            method,
+            parameters,
+            None,
+            Gio.DBusCallFlags.NONE,
+            DBUS_TIMEOUT_MS,
+            None,
+        )
+        return reply.unpack() if reply is not None else ()
+
+    def _get_generic_window_info(self) -> WindowInfo:
+        """Fallback method for unknown compositors.
+
+        There is no portable way to query the focused window on Wayland;
+        compositor-specific protocols would be needed.
+        """
+        return self._empty_window_info()
+
+    def _find_focused_window(
+        self, node: Dict
+    ) -> Tuple[Optional[Dict], str]:
+        """Find the focused window in Sway tree and its workspace name."""
+        queue = deque([(node, "")])
+        while queue:
+            current, workspace = queue.popleft()
+            if current.get("type") == "workspace":
+                workspace = current.get("name", "")
+            if current.get("focused"):
+                return current, workspace
+            for child in current.get("nodes", ()):
+                queue.append((child, workspace))
+            for child in current.get("floating_nodes", ()):
+                queue.append((child, workspace))
+
+        return None, ""
 
     def _format_geometry(self, rect: Dict) -> str:
         """Format geometry from rect dictionary."""
@@ -317,35 +610,40 @@ class WaylandWindowInfo:
 
         return f"{rect.get('width', 0)}x{rect.get('height', 0)}+{rect.get('x', 0)}+{rect.get('y', 0)}"
 
-    def _empty_window_info(self) -> Dict[str, Optional[str]]:
-        """Return empty window info dictionary."""
-        return {
-            "title": "",
-            "app_id": "",
-            "window_class": "",
-            "pid": "",
-            "workspace": "",
-            "geometry": "",
-        }
-
-    def get_window_list(self) -> List[Dict[str, Optional[str]]]:
+    def _format_hyprland_geometry(self, window: Dict) -> str:
+        """Format geometry from Hyprland's size and at pairs."""
+        width, height = window.get("size") or (0, 0)
+        x, y = window.get("at") or (0, 0)
+        return f"{width}x{height}+{x}+{y}"
+
+    def _empty_window_info(self) -> WindowInfo:
+        """Return the shared, read-only empty window info."""
+        return EMPTY_WINDOW_INFO
+
+    def get_window_list(self) -> List[WindowInfo]:
         """Get list of all windows (compositor-specific)."""
+        now = time.monotonic()
+        cache = self._list_cache
+        if cache and now - cache[0] < self._cache_ttl():
+            return [dict(window) for window in cache[1]]
+
+        generation = self._generation
         if self.compositor_type == "sway":
-            return self._get_sway_window_list()
+            windows = self._get_sway_window_list()
         elif self.compositor_type == "hyprland":
-            return self._get_hyprland_window_list()
+            windows = self._get_hyprland_window_list()
         else:
-            return []
+            windows = []
 
-    def _get_sway_window_list(self) -> List[Dict[str, Optional[str]]]:
+        if generation == self._generation:
+            self._list_cache = (now, windows)
+        return [dict(window) for window in windows]
+
+    def _get_sway_window_list(self) -> List[WindowInfo]:
         """Get all windows from Sway."""
         try:
-            result = subprocess.run(
-                ["swaymsg", "-t", "get_tree"], capture_output=True, text=True, timeout=5
-            )
-
-            if result.returncode == 0:
-                tree = json.loads(result.stdout)
+            tree = self._get_sway_tree()
+            if tree:
                 windows = []
                 self._collect_sway_windows(tree, windows)
                 return windows
@@ -356,49 +654,43 @@ class WaylandWindowInfo:
             return []
 
     def _collect_sway_windows(self, node: Dict, windows: List[Dict]):
-        """Recursively collect windows from Sway tree."""
-        if node.get("app_id") or node.get("window_class"):
-            windows.append(
-                {
-                    "title": node.get("name", ""),
-                    "app_id": node.get("app_id", ""),
-                    "window_class": node.get("window_class", ""),
-                    "pid": str(node.get("pid", "")),
-                    "workspace": "",
-                    "geometry": self._format_geometry(node.get("rect", {})),
-                }
-            )
-
-        for child in node.get("nodes", []):
-            self._collect_sway_windows(child, windows)
+        """Collect windows from Sway tree in depth-first order."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.get("app_id") or current.get("window_class"):
+                windows.append(
+                    {
+                        "title": current.get("name", ""),
+                        "app_id": current.get("app_id", ""),
+                        "window_class": current.get("window_class", ""),
+                        "pid": current.get("pid"),
+                        "workspace": "",
+                        "geometry": self._format_geometry(current.get("rect", {})),
+                    }
+                )
 
-        for child in node.get("floating_nodes", []):
-            self._collect_sway_windows(child, windows)
+            # Pushed in reverse so tiled children are visited before floating
+            # ones, each in tree order
+            stack.extend(reversed(current.get("floating_nodes", ())))
+            stack.extend(reversed(current.get("nodes", ())))
 
-    def _get_hyprland_window_list(self) -> List[Dict[str, Optional[str]]]:
+    def _get_hyprland_window_list(self) -> List[WindowInfo]:
         """Get all windows from Hyprland."""
         try:
-            result = subprocess.run(
-                ["hyprctl", "clients", "-j"], capture_output=True, text=True, timeout=5
-            )
-
-            if result.returncode == 0:
-                clients = json.loads(result.stdout)
-                windows = []
-
-                for client in clients:
-                    windows.append(
-                        {
-                            "title": client.get("title", ""),
-                            "app_id": client.get("class", ""),
-                            "window_class": client.get("class", ""),
-                            "pid": str(client.get("pid", "")),
-                            "workspace": client.get("workspace", {}).get("name", ""),
-                            "geometry": f"{client.get('size', [0, 0])[0]}x{client.get('size', [0, 0])[1]}+{client.get('at', [0, 0])[0]}+{client.get('at', [0, 0])[1]}",
-                        }
-                    )
-
-                return windows
+            clients = self._hyprland_query("clients")
+            if clients is not None:
+                return [
+                    {
+                        "title": client.get("title", ""),
+                        "app_id": client.get("class", ""),
+                        "window_class": client.get("class", ""),
+                        "pid": client.get("pid"),
+                        "workspace": client.get("workspace", {}).get("name", ""),
+                        "geometry": self._format_hyprland_geometry(client),
+                    }
+                    for client in clients
+                ]
 
             return []
 
@@ -1,11 +1,29 @@
 """About dialog for Alexandria GUI."""
 
-import gi
+import os
+from functools import lru_cache
 
-gi.require_version("Gtk", "3.0")
+# GTK is imported when the dialog is first built, not when this module is
+# imported with the rest of the GUI
+
+# Common logo locations, in order of preference
+LOGO_PATHS = (
+    "/usr/share/pixmaps/alexandria.png",
+    "/usr/share/icons/hicolor/128x128/apps/alexandria.png",
+    "/usr/local/share/pixmaps/alexandria.png",
+    "assets/alexandria.png",
+    "assets/logo.png",
+)
+
+
+# Logo scaled to dialog size, kept for later openings of the dialog
+_logo_pixbuf = None
 
-from gi.repository import Gtk, GdkPixbuf
-import os
+
+@lru_cache(maxsize=1)
+def find_logo_path():
+    """Try to find the application logo (looked up once per process)."""
+    return next((path for path in LOGO_PATHS if os.path.exists(path)), None)
 
 
 class AboutDialog:
@@ -17,6 +35,13 @@ class AboutDialog:
 
     def setup_dialog(self):
         """Set up the about dialog."""
+        global _logo_pixbuf
+
+        import gi
+
+        gi.require_version("Gtk", "3.0")
+        from gi.repository import Gtk, GdkPixbuf
+
         self.dialog = Gtk.AboutDialog()
         self.dialog.set_transient_for(self.parent_window)
         self.dialog.set_modal(True)
@@ -24,7 +49,6 @@ class AboutDialog:
         # Basic info
         self.dialog.set_program_name("Alexandria")
         self.dialog.set_version("0.1.0")
-        self.dialog.set_comments("Screenshot Recall Utility for Wayland")
         self.dialog.set_copyright("Copyright © 2025 Aabish Malik")
 
         # Description
@@ -59,12 +83,14 @@ Features:
         # Logo - try to load from icon theme or use default
         try:
             # Try to load custom logo
-            logo_path = self.find_logo_path()
-            if logo_path and os.path.exists(logo_path):
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    logo_path, 128, 128, True
-                )
-                self.dialog.set_logo(pixbuf)
+            logo_path = find_logo_path()
+            if logo_path:
+                # Decoded on first open only
+                if _logo_pixbuf is None:
+                    _logo_pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                        logo_path, 128, 128, True
+                    )
+                self.dialog.set_logo(_logo_pixbuf)
             else:
                 # Fallback to icon name
                 self.dialog.set_logo_icon_name("camera-photo")
@@ -72,23 +98,6 @@ Features:
             # Final fallback
             self.dialog.set_logo_icon_name("application-x-executable")
 
-    def find_logo_path(self):
-        """Try to find the application logo."""
-        # Common logo locations
-        possible_paths = [
-            "/usr/share/pixmaps/alexandria.png",
-            "/usr/share/icons/hicolor/128x128/apps/alexandria.png",
-            "/usr/local/share/pixmaps/alexandria.png",
-            "assets/alexandria.png",
-            "assets/logo.png",
-        ]
-
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-
-        return None
-
     def show(self):
         """Show the about dialog."""
         self.dialog.run()
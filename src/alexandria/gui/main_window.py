@@ -9,44 +9,90 @@ gi.require_version("GdkPixbuf", "2.0")
 import os
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
-from gi.repository import Gtk, Gdk, GdkPixbuf, GLib, Gio
+from gi.repository import Gtk, Gdk, GdkPixbuf, GLib, Gio, GObject
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
 from alexandria.config import Config
-from alexandria.core.models import MemoryDB, Memory
+from alexandria.core.models import MemoryDB, Memory, MemorySummary
 from alexandria.service.daemon import AlexandriaDaemon
 from alexandria.gui.theme import ThemeManager
 from alexandria.gui.preferences import PreferencesWindow
 from alexandria.gui.about import show_about
 
 
-class MemoryListItem:
+@lru_cache(maxsize=256)
+def _load_pixbuf(
+    path: str, mtime_ns: int, size: Optional[Tuple[int, int]]
+) -> GdkPixbuf.Pixbuf:
+    if size is None:
+        return GdkPixbuf.Pixbuf.new_from_file(path)
+    return GdkPixbuf.Pixbuf.new_from_file_at_scale(path, size[0], size[1], True)
+
+
+def load_pixbuf(path, size: Optional[Tuple[int, int]] = None) -> GdkPixbuf.Pixbuf:
+    """Decode an image, optionally scaled to fit size.
+
+    Decoded thumbnail-sized pixbufs (about 120 KB each) are kept in an LRU
+    cache keyed by path, modification time and size, so list reloads reuse
+    them until the file changes.
+    """
+    path = str(path)
+    return _load_pixbuf(path, os.stat(path).st_mtime_ns, size)
+
+
+class MemoryListItem(GObject.Object):
     """Represents a memory item in the list."""
 
-    def __init__(self, memory: Memory):
+    # Matches the thumbnails the daemon writes at capture time
+    THUMBNAIL_SIZE = (200, 150)
+
+    def __init__(self, memory: MemorySummary, thumbnails_dir: Optional[Path] = None):
+        super().__init__()
         self.memory = memory
+        self.tags = frozenset(memory.tags_list)
+        self.timestamp_text = memory.timestamp.strftime("%Y-%m-%d %H:%M:%S")
         self.thumbnail = None
-        self.load_thumbnail()
+        self.load_thumbnail(thumbnails_dir)
+
+    def load_thumbnail(self, thumbnails_dir: Optional[Path] = None):
+        """Load thumbnail image for the memory.
 
-    def load_thumbnail(self):
-        """Load thumbnail image for the memory."""
+        Thumbnails are already list-sized, so they are decoded without
+        scaling. A memory without one gets a thumbnail scaled from its
+        screenshot, saved to thumbnails_dir so this happens only once.
+        """
         try:
-            if self.memory.thumbnail_path and Path(self.memory.thumbnail_path).exists():
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    str(self.memory.thumbnail_path), 200, 150, True
-                )
-                self.thumbnail = pixbuf
-            elif (
-                self.memory.screenshot_path
-                and Path(self.memory.screenshot_path).exists()
-            ):
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    str(self.memory.screenshot_path), 200, 150, True
-                )
+            saved_path = None
+            if thumbnails_dir is not None:
+                saved_path = thumbnails_dir / f"thumb_{self.memory.id}.jpg"
+
+            # A missing file fails load_pixbuf's own stat, so no separate
+            # existence check is needed
+            for path in (self.memory.thumbnail_path, saved_path):
+                if path:
+                    try:
+                        self.thumbnail = load_pixbuf(path)
+                        return
+                    except (OSError, GLib.Error):
+                        pass
+
+            if self.memory.screenshot_path:
+                try:
+                    pixbuf = load_pixbuf(
+                        self.memory.screenshot_path, self.THUMBNAIL_SIZE
+                    )
+                except (OSError, GLib.Error):
+                    return
                 self.thumbnail = pixbuf
+
+                if saved_path is not None:
+                    saved_path.parent.mkdir(parents=True, exist_ok=True)
+                    pixbuf.savev(str(saved_path), "jpeg", ["quality"], ["85"])
         except Exception as e:
             print(f"Error loading thumbnail: {e}")
             self.thumbnail = None
@@ -55,21 +101,49 @@ class MemoryListItem:
 class AlexandriaGUI:
     """Main GUI application for Alexandria."""
 
+    # Delay before filter changes are applied, so bursts coalesce
+    FILTER_DELAY_MS = 150
+    # Most recent memories shown, with or without filters
+    MEMORY_LIST_LIMIT = 100
+    # Characters of OCR text shown in a list row
+    OCR_PREVIEW_LENGTH = 100
+
     def __init__(self):
         self.config = Config()
+        self.config.ensure_ready()
         # Create database URL from the config path
         db_path = self.config.database_path
         self.database_url = f"sqlite:///{db_path}"
         self.db = MemoryDB(self.database_url)
+        self.thumbnails_dir = self.config.cache_dir / "thumbnails"
+
+        # Image decoding never runs on the GTK main thread; GdkPixbuf
+        # releases the GIL, so list thumbnails decode in parallel
+        self.image_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="alexandria-images"
+        )
+        self._selected_memory_id: Optional[int] = None
+        # Pending details image decode
+        self._image_cancellable: Optional[Gio.Cancellable] = None
         self.daemon = AlexandriaDaemon()
         self.memories: List[MemoryListItem] = []
-        self.filtered_memories: List[MemoryListItem] = []
+        self._filter_source_id = 0
+        # Tags currently offered by the tag filter combo
+        self._combo_tags: Tuple[str, ...] = ()
+        # Tags currently listed in the details panel
+        self._shown_tags: Tuple[str, ...] = ()
+
+        # get_memories() keyword arguments for the current search and
+        # filters; set on the main thread, read by the loader thread
+        self._memory_filters: Dict[str, Any] = {}
+        self._reload_event = threading.Event()
 
         # Initialize theme manager
         self.theme_manager = ThemeManager()
 
         self.setup_ui()
         self.load_memories()
+        self.watch_database(db_path)
 
     def setup_ui(self):
         """Set up the main UI."""
@@ -199,7 +273,9 @@ class AlexandriaGUI:
         self.tag_combo = Gtk.ComboBoxText()
         self.tag_combo.append_text("All")
         self.tag_combo.set_active(0)
-        self.tag_combo.connect("changed", self.on_filter_changed)
+        self._tag_combo_handler = self.tag_combo.connect(
+            "changed", self.on_filter_changed
+        )
         search_box.pack_start(self.tag_combo, False, False, 0)
 
         parent.pack_start(search_box, False, False, 0)
@@ -217,6 +293,10 @@ class AlexandriaGUI:
         self.memory_listbox.connect("row-selected", self.on_memory_selected)
         self.memory_listbox.get_style_context().add_class("memory-list")
 
+        # Rows are created from the store whenever a query result is loaded
+        self.memory_store = Gio.ListStore.new(MemoryListItem)
+        self.memory_listbox.bind_model(self.memory_store, self.create_memory_row)
+
         scrolled.add(self.memory_listbox)
         parent.pack1(scrolled, False, False)
 
@@ -350,50 +430,136 @@ class AlexandriaGUI:
         """Load memories from database."""
 
         def load_thread():
-            """Thread to load memories from the database."""
+            """Thread to load memories matching the current filters."""
+            loaded_filters = None
+            loaded_ids = set()
+            newest = None
+            census = None
+
             while True:
+                self._reload_event.clear()
+                filters = self._memory_filters
+                incremental = filters is loaded_filters and newest is not None
+                if incremental and self._memories_deleted(census):
+                    # Retention or a manual cleanup removed rows; only a
+                    # full reload drops them from the list
+                    incremental = False
+                query = filters
+                if incremental:
+                    # Same filters as last time: only fetch what was added since
+                    start_date = filters.get("start_date")
+                    query = dict(
+                        filters,
+                        start_date=max(start_date, newest) if start_date else newest,
+                    )
+
                 try:
-                    with self.db.get_session() as session:
-                        memories = (
-                            session.query(Memory)
-                            .order_by(Memory.timestamp.desc())
-                            .limit(100)
-                            .all()
+                    census = self.db.get_memory_census()
+
+                    # Rows carry only what the list shows; the full memory
+                    # is read when one is selected
+                    memories = self.db.get_memories_summary(
+                        limit=self.MEMORY_LIST_LIMIT,
+                        exclude_private=False,
+                        preview_length=self.OCR_PREVIEW_LENGTH + 1,
+                        **query,
+                    )
+                    if incremental:
+                        memories = [m for m in memories if m.id not in loaded_ids]
+                    else:
+                        loaded_ids.clear()
+                        newest = None
+                    loaded_filters = filters
+                    loaded_ids.update(m.id for m in memories)
+                    if memories:
+                        newest = memories[0].timestamp
+
+                    memory_items = list(
+                        self.image_executor.map(
+                            partial(MemoryListItem, thumbnails_dir=self.thumbnails_dir),
+                            memories,
                         )
+                    )
 
-                        memory_items = []
-                        for memory in memories:
-                            item = MemoryListItem(memory)
-                            memory_items.append(item)
-
-                        GLib.idle_add(self.update_memory_list, memory_items)
+                    GLib.idle_add(
+                        self.update_memory_list, memory_items, filters, incremental
+                    )
                 except Exception as e:
                     GLib.idle_add(self.show_error, f"Error loading memories: {e}")
 
-                threading.Event().wait(10)  # Wait before next load
+                # Sleep until the filters change or the database is written
+                self._reload_event.wait()
 
         # Start loading memories in a separate thread
         threading.Thread(target=load_thread, daemon=True).start()
 
-    def update_memory_list(self, memory_items: List[MemoryListItem]):
-        """Update the memory list in the UI."""
-        self.memories = memory_items
-        self.filtered_memories = memory_items.copy()
-
-        # Clear existing items
-        for child in self.memory_listbox.get_children():
-            self.memory_listbox.remove(child)
+    def _memories_deleted(self, census) -> bool:
+        """Whether any memory was deleted since census was taken."""
+        if census is None:
+            return True
+        try:
+            total, highest = census
+            added = self.db.count_memories_after(highest)
+            return self.db.get_memory_census()[0] != total + added
+        except Exception:
+            return True
+
+    def watch_database(self, db_path: str):
+        """Reload the memory list whenever the database file is written.
+
+        The daemon runs in another process, so the GUI watches the database
+        (and its WAL) instead of polling it.
+        """
+        db_name = Path(db_path).name
+        self._db_files = {db_name, f"{db_name}-wal", f"{db_name}-journal"}
+        directory = Gio.File.new_for_path(str(Path(db_path).parent))
+        self._db_monitor = directory.monitor_directory(Gio.FileMonitorFlags.NONE, None)
+        self._db_monitor.connect("changed", self.on_database_changed)
+
+    def on_database_changed(self, monitor, file, other_file, event_type):
+        """Wake the loader thread when the database is written."""
+        if (
+            event_type
+            in (Gio.FileMonitorEvent.CHANGED, Gio.FileMonitorEvent.CHANGES_DONE_HINT)
+            and file.get_basename() in self._db_files
+        ):
+            self._reload_event.set()
+
+    def update_memory_list(
+        self,
+        memory_items: List[MemoryListItem],
+        filters: Dict[str, Any],
+        incremental: bool = False,
+    ):
+        """Update the memory list in the UI.
+
+        An incremental update prepends newly added memories to the list
+        instead of replacing it.
+        """
+        if filters is not self._memory_filters:
+            # Loaded for filters that have since changed
+            return
 
-        # Add new items
-        for item in self.filtered_memories:
-            row = self.create_memory_row(item)
-            self.memory_listbox.add(row)
+        if incremental:
+            if not memory_items:
+                return
+            # Existing rows are kept; the oldest ones drop off the end
+            self.memory_store.splice(0, 0, memory_items)
+            memory_items = (memory_items + self.memories)[: self.MEMORY_LIST_LIMIT]
+            excess = self.memory_store.get_n_items() - len(memory_items)
+            if excess > 0:
+                self.memory_store.splice(len(memory_items), excess, [])
+        else:
+            self.memory_store.splice(0, self.memory_store.get_n_items(), memory_items)
+        self.memories = memory_items
 
-        self.memory_listbox.show_all()
-        self.update_status(f"{len(self.memories)} memories loaded")
+        if filters:
+            self.update_status(f"{len(self.memories)} matching memories shown")
+        else:
+            self.update_status(f"{len(self.memories)} memories loaded")
 
-        # Update tag combo
-        self.update_tag_combo()
+            # Update tag combo from the unfiltered memories
+            self.update_tag_combo()
 
     def create_memory_row(self, item: MemoryListItem) -> Gtk.ListBoxRow:
         """Create a row widget for a memory item."""
@@ -415,14 +581,13 @@ class AlexandriaGUI:
         image.set_size_request(80, 60)
         box.pack_start(image, False, False, 0)
 
-        # Details
+        # Details; the .memory-list styles set the fonts of these labels
         details_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3)
 
         # Timestamp
         timestamp_label = Gtk.Label()
-        timestamp_label.set_text(item.memory.timestamp.strftime("%Y-%m-%d %H:%M:%S"))
+        timestamp_label.set_text(item.timestamp_text)
         timestamp_label.set_halign(Gtk.Align.START)
-        timestamp_label.get_style_context().add_class("heading")
         details_box.pack_start(timestamp_label, False, False, 0)
 
         # Application info
@@ -434,42 +599,47 @@ class AlexandriaGUI:
             app_label = Gtk.Label()
             app_label.set_text(app_text)
             app_label.set_halign(Gtk.Align.START)
-            app_label.get_style_context().add_class("dim-label")
             details_box.pack_start(app_label, False, False, 0)
 
         # OCR preview
-        if item.memory.ocr_text:
-            ocr_preview = (
-                item.memory.ocr_text[:100] + "..."
-                if len(item.memory.ocr_text) > 100
-                else item.memory.ocr_text
-            )
+        if item.memory.ocr_preview:
+            ocr_preview = item.memory.ocr_preview
+            if len(ocr_preview) > self.OCR_PREVIEW_LENGTH:
+                ocr_preview = ocr_preview[: self.OCR_PREVIEW_LENGTH] + "..."
             ocr_label = Gtk.Label()
             ocr_label.set_text(ocr_preview)
             ocr_label.set_halign(Gtk.Align.START)
             ocr_label.set_ellipsize(3)  # ELLIPSIZE_END
-            ocr_label.get_style_context().add_class("dim-label")
             details_box.pack_start(ocr_label, False, False, 0)
 
         box.pack_start(details_box, True, True, 0)
         row.add(box)
+        row.show_all()
 
         return row
 
     def update_tag_combo(self):
         """Update the tag filter combo with available tags."""
-        # Clear existing items except "All"
-        while self.tag_combo.get_active_text() != "All" and len(self.tag_combo) > 1:
-            self.tag_combo.remove(1)
-
         # Collect all unique tags
-        all_tags = set()
-        for item in self.memories:
-            all_tags.update(item.memory.tags_list)
-
-        # Add tags to combo
-        for tag in sorted(all_tags):
-            self.tag_combo.append_text(tag)
+        all_tags = tuple(sorted(set().union(*(item.tags for item in self.memories))))
+        if all_tags == self._combo_tags:
+            return
+        self._combo_tags = all_tags
+
+        # Refill the combo, keeping the selected tag if it is still offered;
+        # the intermediate changes are not filter changes
+        active_tag = self.tag_combo.get_active_text()
+        active = all_tags.index(active_tag) + 1 if active_tag in all_tags else 0
+        with self.tag_combo.handler_block(self._tag_combo_handler):
+            self.tag_combo.remove_all()
+            self.tag_combo.append_text("All")
+            for tag in all_tags:
+                self.tag_combo.append_text(tag)
+            self.tag_combo.set_active(active)
+
+        if active == 0 and active_tag != "All":
+            # The selected tag is gone
+            self.schedule_filters()
 
     def on_memory_selected(self, listbox, row):
         """Handle memory selection."""
@@ -483,43 +653,123 @@ class AlexandriaGUI:
         """Show details for the selected memory."""
         memory = item.memory
 
-        # Load image
-        try:
-            if memory.screenshot_path and Path(memory.screenshot_path).exists():
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    str(memory.screenshot_path), 600, 400, True
-                )
-                self.image_view.set_from_pixbuf(pixbuf)
-            else:
-                self.image_view.set_from_icon_name("image-missing", Gtk.IconSize.DIALOG)
-        except Exception as e:
-            print(f"Error loading image: {e}")
-            self.image_view.set_from_icon_name("image-missing", Gtk.IconSize.DIALOG)
+        # Load the image and the full memory off the main thread; only the
+        # latest selection is shown
+        self._selected_memory_id = memory.id
+        self.load_details_image(memory.screenshot_path)
+        self.size_label.set_text("")
+        self.filesize_label.set_text("")
+        self.ocr_textview.get_buffer().set_text("")
+        self.image_executor.submit(self._load_details_memory, memory.id)
 
         # Update info labels
-        self.timestamp_label.set_text(memory.timestamp.strftime("%Y-%m-%d %H:%M:%S"))
+        self.timestamp_label.set_text(item.timestamp_text)
         self.app_label.set_text(memory.application_name or "Unknown")
         self.window_label.set_text(memory.window_title or "Unknown")
 
-        if memory.image_width and memory.image_height:
+        # Update tags
+        self.update_tags_display(memory.tags_list)
+
+    def load_details_image(self, screenshot_path: Optional[str]):
+        """Decode the details image asynchronously.
+
+        The file is read and decoded on the GIO thread pool. A new selection
+        cancels the decode still running for the previous one.
+        """
+        if self._image_cancellable is not None:
+            self._image_cancellable.cancel()
+            self._image_cancellable = None
+
+        if not screenshot_path:
+            self.image_view.set_from_icon_name("image-missing", Gtk.IconSize.DIALOG)
+            return
+
+        self.image_view.set_from_icon_name("image-loading", Gtk.IconSize.DIALOG)
+        cancellable = Gio.Cancellable()
+        self._image_cancellable = cancellable
+        Gio.File.new_for_path(str(screenshot_path)).read_async(
+            GLib.PRIORITY_DEFAULT,
+            cancellable,
+            self._on_details_image_opened,
+            cancellable,
+        )
+
+    def _on_details_image_opened(self, file, result, cancellable):
+        try:
+            stream = file.read_finish(result)
+        except GLib.Error as e:
+            self._show_details_image(cancellable, None, e)
+            return
+
+        GdkPixbuf.Pixbuf.new_from_stream_at_scale_async(
+            stream,
+            600,
+            400,
+            True,
+            cancellable,
+            self._on_details_image_decoded,
+            cancellable,
+        )
+
+    def _on_details_image_decoded(self, stream, result, cancellable):
+        pixbuf = error = None
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_stream_finish(result)
+        except GLib.Error as e:
+            error = e
+        finally:
+            stream.close(None)
+
+        self._show_details_image(cancellable, pixbuf, error)
+
+    def _show_details_image(self, cancellable, pixbuf, error):
+        """Show a decoded details image, unless the selection has moved on."""
+        if cancellable.is_cancelled() or cancellable is not self._image_cancellable:
+            return
+        self._image_cancellable = None
+
+        if pixbuf is not None:
+            self.image_view.set_from_pixbuf(pixbuf)
+        else:
+            print(f"Error loading image: {error}")
+            self.image_view.set_from_icon_name("image-missing", Gtk.IconSize.DIALOG)
+
+    def _load_details_memory(self, memory_id: int):
+        """Load the full memory row; runs on the image executor."""
+        try:
+            memory = self.db.get_memory(memory_id)
+        except Exception as e:
+            print(f"Error loading memory: {e}")
+            memory = None
+
+        GLib.idle_add(self._show_details_memory, memory_id, memory)
+
+    def _show_details_memory(self, memory_id: int, memory: Optional[Memory]):
+        """Show the details only list rows lack, unless the selection has moved on."""
+        if memory_id != self._selected_memory_id:
+            return
+
+        if memory and memory.image_width and memory.image_height:
             self.size_label.set_text(f"{memory.image_width} × {memory.image_height}")
         else:
             self.size_label.set_text("Unknown")
 
-        if memory.file_size:
+        if memory and memory.file_size:
             self.filesize_label.set_text(self.format_file_size(memory.file_size))
         else:
             self.filesize_label.set_text("Unknown")
 
-        # Update OCR text
-        buffer = self.ocr_textview.get_buffer()
-        buffer.set_text(memory.ocr_text or "No text found")
-
-        # Update tags
-        self.update_tags_display(memory.tags_list)
+        ocr_text = memory.ocr_text if memory else None
+        self.ocr_textview.get_buffer().set_text(ocr_text or "No text found")
 
     def update_tags_display(self, tags: List[str]):
         """Update the tags display."""
+        tags = tuple(tags)
+        if tags == self._shown_tags:
+            # Most selection changes keep the same tags
+            return
+        self._shown_tags = tags
+
         # Clear existing tags
         for child in self.tags_listbox.get_children():
             self.tags_listbox.remove(child)
@@ -554,69 +804,78 @@ class AlexandriaGUI:
 
     def on_search_changed(self, entry):
         """Handle search text changes."""
+        # Gtk.SearchEntry already delays search-changed until typing pauses
         self.apply_filters()
 
     def on_filter_changed(self, combo):
         """Handle filter changes."""
+        self.schedule_filters()
+
+    def schedule_filters(self):
+        """Apply filters once a burst of changes has settled.
+
+        Scrolling through a combo emits "changed" for every entry passed;
+        those coalesce into a single filter pass.
+        """
+        if self._filter_source_id:
+            GLib.source_remove(self._filter_source_id)
+        self._filter_source_id = GLib.timeout_add(
+            self.FILTER_DELAY_MS, self._apply_scheduled_filters
+        )
+
+    def _apply_scheduled_filters(self):
+        self._filter_source_id = 0
         self.apply_filters()
+        return GLib.SOURCE_REMOVE
 
     def apply_filters(self):
         """Apply current search and filter settings."""
-        search_text = self.search_entry.get_text().lower()
-        date_filter = self.date_combo.get_active_text()
-        tag_filter = self.tag_combo.get_active_text()
+        if self._filter_source_id:
+            # Applied now; drop the pending pass
+            GLib.source_remove(self._filter_source_id)
+            self._filter_source_id = 0
 
-        filtered = []
-
-        for item in self.memories:
-            memory = item.memory
-
-            # Apply search filter
-            if search_text:
-                searchable_text = f"{memory.ocr_text or ''} {memory.application_name or ''} {memory.window_title or ''}".lower()
-                if search_text not in searchable_text:
-                    continue
-
-            # Apply date filter
-            if date_filter != "All":
-                now = datetime.now()
-                if date_filter == "Today":
-                    if memory.timestamp.date() != now.date():
-                        continue
-                elif date_filter == "Yesterday":
-                    yesterday = now.date() - timedelta(days=1)
-                    if memory.timestamp.date() != yesterday:
-                        continue
-                elif date_filter == "Last 7 days":
-                    week_ago = now - timedelta(days=7)
-                    if memory.timestamp < week_ago:
-                        continue
-                elif date_filter == "Last 30 days":
-                    month_ago = now - timedelta(days=30)
-                    if memory.timestamp < month_ago:
-                        continue
-
-            # Apply tag filter
-            if tag_filter != "All":
-                if tag_filter not in memory.tags_list:
-                    continue
-
-            filtered.append(item)
-
-        self.filtered_memories = filtered
-
-        # Update display
-        for child in self.memory_listbox.get_children():
-            self.memory_listbox.remove(child)
-
-        for item in self.filtered_memories:
-            row = self.create_memory_row(item)
-            self.memory_listbox.add(row)
-
-        self.memory_listbox.show_all()
-        self.update_status(
-            f"{len(self.filtered_memories)} of {len(self.memories)} memories shown"
-        )
+        # Searching and filtering run in SQL, over all memories rather than
+        # only the ones currently listed
+        filters = {}
+
+        search_text = self.search_entry.get_text().strip()
+        if search_text:
+            filters["search_text"] = search_text
+
+        start_date, end_date = self.date_filter_range(self.date_combo.get_active_text())
+        if start_date:
+            filters["start_date"] = start_date
+        if end_date:
+            filters["end_date"] = end_date
+
+        tag_filter = self.tag_combo.get_active_text()
+        if tag_filter and tag_filter != "All":
+            filters["tags"] = [tag_filter]
+
+        if filters != self._memory_filters:
+            self._memory_filters = filters
+            self._reload_event.set()
+            self.update_status("Searching...")
+
+    @staticmethod
+    def date_filter_range(
+        date_filter: Optional[str],
+    ) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Return the (start, end) timestamps selected by a date filter."""
+        now = datetime.now()
+        today = datetime.combine(now.date(), time.min)
+
+        if date_filter == "Today":
+            return today, None
+        elif date_filter == "Yesterday":
+            return today - timedelta(days=1), today - timedelta(microseconds=1)
+        elif date_filter == "Last 7 days":
+            return now - timedelta(days=7), None
+        elif date_filter == "Last 30 days":
+            return now - timedelta(days=30), None
+
+        return None, None
 
     def on_preferences_clicked(self, button):
         """Handle preferences menu item."""
@@ -634,7 +893,8 @@ class AlexandriaGUI:
             try:
                 self.daemon.capture_and_process_screenshot()
                 GLib.idle_add(self.update_status, "Screenshot captured")
-                GLib.idle_add(self.load_memories)  # Refresh list
+                # The loader thread fetches just the new memory
+                self._reload_event.set()
             except Exception as e:
                 GLib.idle_add(self.show_error, f"Capture failed: {e}")
 
@@ -675,6 +935,7 @@ class AlexandriaGUI:
 
     def on_quit(self, *args):
         """Handle application quit."""
+        self.image_executor.shutdown(wait=False)
         Gtk.main_quit()
 
     def run(self):
@@ -4,201 +4,252 @@ import gi
 
 gi.require_version("Gtk", "3.0")
 
-from gi.repository import Gtk, Gdk
+from gi.repository import Gtk, Gdk, Gio
 import os
+import re
+from typing import Optional, Set
+
+GNOME_INTERFACE_SCHEMA = "org.gnome.desktop.interface"
+
+_DARK_RE = re.compile("dark", re.IGNORECASE).search
+
+
+def _interface_settings() -> Optional[Gio.Settings]:
+    """Open the GNOME interface settings, if that schema is installed.
+
+    Gio.Settings.new() aborts the process for an unknown schema, so the
+    schema is looked up first.
+    """
+    source = Gio.SettingsSchemaSource.get_default()
+    schema = source.lookup(GNOME_INTERFACE_SCHEMA, True) if source else None
+    if schema is None:
+        return None
+    return Gio.Settings.new_full(schema, None, None)
+
+
+# Bytes, as Gtk.CssProvider.load_from_data() takes them
+CUSTOM_CSS = rb"""
+/* Alexandria custom styles */
+
+/* Header styling */
+headerbar {
+    background: @theme_bg_color;
+    border-bottom: 1px solid @borders;
+}
+
+/* Memory list styling */
+.memory-list {
+    background: @theme_base_color;
+}
+
+/* Row text: timestamp first, then application and OCR preview */
+.memory-list row > box > box > label:first-child {
+    font-weight: bold;
+    font-size: 1.1em;
+}
+
+.memory-list row > box > box > label:not(:first-child) {
+    opacity: 0.7;
+    font-size: 0.9em;
+}
+
+.memory-row {
+    padding: 8px;
+    border-bottom: 1px solid alpha(@borders, 0.5);
+}
+
+.memory-row:hover {
+    background: alpha(@theme_selected_bg_color, 0.1);
+}
+
+.memory-row:selected {
+    background: @theme_selected_bg_color;
+    color: @theme_selected_fg_color;
+}
+
+/* Typography */
+.heading {
+    font-weight: bold;
+    font-size: 1.1em;
+}
+
+.dim-label {
+    opacity: 0.7;
+    font-size: 0.9em;
+}
+
+/* Search bar */
+.search-bar {
+    background: alpha(@theme_bg_color, 0.95);
+    border-bottom: 1px solid @borders;
+    padding: 6px;
+}
+
+/* Details panel */
+.details-panel {
+    background: @theme_base_color;
+    padding: 12px;
+}
+
+/* Image frame */
+.image-frame {
+    border: 1px solid @borders;
+    border-radius: 6px;
+    background: @theme_base_color;
+}
+
+/* Tags */
+.tag-item {
+    background: alpha(@theme_selected_bg_color, 0.2);
+    border: 1px solid alpha(@theme_selected_bg_color, 0.4);
+    border-radius: 12px;
+    padding: 4px 8px;
+    margin: 2px;
+}
+
+/* Preferences */
+.pref-page {
+    padding: 12px;
+}
+
+.pref-frame-content {
+    padding: 6px 12px 12px 12px;
+}
+
+/* Buttons */
+button {
+    border-radius: 4px;
+}
+
+button.suggested-action {
+    background: @theme_selected_bg_color;
+    color: @theme_selected_fg_color;
+    border: none;
+}
+
+button.destructive-action {
+    background: #e74c3c;
+    color: white;
+    border: none;
+}
+
+/* Notebook tabs */
+notebook tab {
+    padding: 8px 16px;
+}
+
+/* Status bar */
+statusbar {
+    background: @theme_bg_color;
+    border-top: 1px solid @borders;
+    font-size: 0.9em;
+}
+
+/* Scrollbars */
+scrollbar {
+    background: transparent;
+}
+
+scrollbar slider {
+    background: alpha(@theme_fg_color, 0.3);
+    border-radius: 10px;
+    min-width: 6px;
+    min-height: 6px;
+}
+
+scrollbar slider:hover {
+    background: alpha(@theme_fg_color, 0.5);
+}
+"""
 
 
 class ThemeManager:
     """Manages theme and styling for the Alexandria GUI."""
 
+    # Parsed once per process and registered once per screen, however many
+    # ThemeManagers are created
+    _css_provider: Optional[Gtk.CssProvider] = None
+    _styled_screens: Set[Gdk.Screen] = set()
+
     def __init__(self):
-        self.css_provider = Gtk.CssProvider()
+        self._interface_settings = _interface_settings()
+        self._dark_theme: Optional[bool] = None
+        self._gtk_settings = Gtk.Settings.get_default()
+        self._gtk_settings.connect(
+            "notify::gtk-theme-name", self._forget_system_theme
+        )
+        if self._interface_settings is not None:
+            self._interface_settings.connect(
+                "changed::gtk-theme", self._forget_system_theme
+            )
         self.load_custom_styles()
         self.apply_styles()
 
     def load_custom_styles(self):
         """Load custom CSS styles."""
-        css = """
-        /* Alexandria custom styles */
-        
-        /* Header styling */
-        headerbar {
-            background: @theme_bg_color;
-            border-bottom: 1px solid @borders;
-        }
-        
-        /* Memory list styling */
-        .memory-list {
-            background: @theme_base_color;
-        }
-        
-        .memory-row {
-            padding: 8px;
-            border-bottom: 1px solid alpha(@borders, 0.5);
-        }
-        
-        .memory-row:hover {
-            background: alpha(@theme_selected_bg_color, 0.1);
-        }
-        
-        .memory-row:selected {
-            background: @theme_selected_bg_color;
-            color: @theme_selected_fg_color;
-        }
-        
-        /* Typography */
-        .heading {
-            font-weight: bold;
-            font-size: 1.1em;
-        }
-        
-        .dim-label {
-            opacity: 0.7;
-            font-size: 0.9em;
-        }
-        
-        /* Search bar */
-        .search-bar {
-            background: alpha(@theme_bg_color, 0.95);
-            border-bottom: 1px solid @borders;
-            padding: 6px;
-        }
-        
-        /* Details panel */
-        .details-panel {
-            background: @theme_base_color;
-            padding: 12px;
-        }
-        
-        /* Image frame */
-        .image-frame {
-            border: 1px solid @borders;
-            border-radius: 6px;
-            background: @theme_base_color;
-        }
-        
-        /* Tags */
-        .tag-item {
-            background: alpha(@theme_selected_bg_color, 0.2);
-            border: 1px solid alpha(@theme_selected_bg_color, 0.4);
-            border-radius: 12px;
-            padding: 4px 8px;
-            margin: 2px;
-        }
-        
-        /* Buttons */
-        button {
-            border-radius: 4px;
-        }
-        
-        button.suggested-action {
-            background: @theme_selected_bg_color;
-            color: @theme_selected_fg_color;
-            border: none;
-        }
-        
-        button.destructive-action {
-            background: #e74c3c;
-            color: white;
-            border: none;
-        }
-        
-        /* Notebook tabs */
-        notebook tab {
-            padding: 8px 16px;
-        }
-        
-        /* Status bar */
-        statusbar {
-            background: @theme_bg_color;
-            border-top: 1px solid @borders;
-            font-size: 0.9em;
-        }
-        
-        /* Scrollbars */
-        scrollbar {
-            background: transparent;
-        }
-        
-        scrollbar slider {
-            background: alpha(@theme_fg_color, 0.3);
-            border-radius: 10px;
-            min-width: 6px;
-            min-height: 6px;
-        }
-        
-        scrollbar slider:hover {
-            background: alpha(@theme_fg_color, 0.5);
-        }
-        """
-
-        self.css_provider.load_from_data(css.encode("utf-8"))
+        if ThemeManager._css_provider is None:
+            provider = Gtk.CssProvider()
+            provider.load_from_data(CUSTOM_CSS)
+            ThemeManager._css_provider = provider
+        self.css_provider = ThemeManager._css_provider
 
     def apply_styles(self):
         """Apply the custom styles to the default screen."""
         screen = Gdk.Screen.get_default()
+        if screen in ThemeManager._styled_screens:
+            return
+        ThemeManager._styled_screens.add(screen)
         Gtk.StyleContext.add_provider_for_screen(
             screen, self.css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
 
     def set_dark_theme(self, enable: bool):
         """Enable or disable dark theme."""
-        settings = Gtk.Settings.get_default()
-        settings.set_property("gtk-application-prefer-dark-theme", enable)
+        self._gtk_settings.set_property("gtk-application-prefer-dark-theme", enable)
+
+    def _get_interface_setting(self, key: str) -> Optional[str]:
+        """Read a GNOME interface setting, or None if it does not exist."""
+        settings = self._interface_settings
+        if settings is None or not settings.props.settings_schema.has_key(key):
+            return None
+        return settings.get_string(key)
+
+    def _forget_system_theme(self, *args):
+        self._dark_theme = None
 
     def detect_system_theme(self) -> bool:
-        """Detect if the system is using a dark theme."""
-        try:
-            # Check GTK theme setting
-            settings = Gtk.Settings.get_default()
-            theme_name = settings.get_property("gtk-theme-name")
+        """Detect if the system is using a dark theme.
 
-            if theme_name and "dark" in theme_name.lower():
-                return True
+        The result is cached until the GTK or GNOME theme setting changes.
+        """
+        if self._dark_theme is None:
+            self._dark_theme = self._detect_system_theme()
+        return self._dark_theme
 
+    def _detect_system_theme(self) -> bool:
+        try:
             # Check environment variables
-            gtk_theme = os.getenv("GTK_THEME", "")
-            if "dark" in gtk_theme.lower():
+            if _DARK_RE(os.environ.get("GTK_THEME", "")) is not None:
                 return True
 
-            # Check for GNOME dark mode preference
-            try:
-                import subprocess
-
-                result = subprocess.run(
-                    ["gsettings", "get", "org.gnome.desktop.interface", "gtk-theme"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                )
-                if result.returncode == 0 and "dark" in result.stdout.lower():
-                    return True
-            except:
-                pass
+            # Check GTK theme setting
+            theme_name = self._gtk_settings.get_property("gtk-theme-name")
+            if theme_name and _DARK_RE(theme_name) is not None:
+                return True
 
-            return False
+            # Check for GNOME dark mode preference
+            theme = self._get_interface_setting("gtk-theme")
+            return bool(theme) and _DARK_RE(theme) is not None
 
         except Exception:
             return False
 
     def get_system_accent_color(self) -> str:
         """Try to get the system accent color."""
-        try:
-            # Try to get GNOME accent color
-            import subprocess
-
-            result = subprocess.run(
-                ["gsettings", "get", "org.gnome.desktop.interface", "accent-color"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if result.returncode == 0:
-                color = result.stdout.strip().strip("'\"")
-                if color and color != "default":
-                    return color
-        except:
-            pass
+        # Try to get GNOME accent color (GNOME 47 and later)
+        color = self._get_interface_setting("accent-color")
+        if color and color != "default":
+            return color
 
         # Fallback to default blue
         return "#3584e4"
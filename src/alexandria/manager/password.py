@@ -1,44 +1,115 @@
-import secretstorage
 import keyring
-from secretstorage import dbus_init
+from keyring.backends import SecretService
+from keyring.backends.chainer import ChainerBackend
+from keyring.errors import PasswordDeleteError
+import logging
 import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Same attributes and label keyring's Secret Service backend uses, so a
+# password stored by either one is found by the other
+KEYRING_APPID = "Python keyring library"
+
+_bus = None
+_bus_lock = threading.Lock()
+
+
+def _get_bus():
+    """Return the process-wide D-Bus connection to the Secret Service."""
+    global _bus
+    with _bus_lock:
+        if _bus is None:
+            import secretstorage
+
+            _bus = secretstorage.dbus_init()
+        return _bus
+
+
+def _uses_secret_service(backend) -> bool:
+    """Whether passwords would be stored in the Secret Service."""
+    if isinstance(backend, ChainerBackend):
+        # The chainer stores through its highest-priority backend
+        backends = backend.backends
+        return bool(backends) and isinstance(backends[0], SecretService.Keyring)
+    return isinstance(backend, SecretService.Keyring)
 
 
 class PasswordManager:
     def __init__(self):
-        self.dbus = dbus_init()
-        self.collection = secretstorage.get_default_collection(self.dbus)
-        self.collection.unlock()
         self.service = "alexandria"
         self.username = os.getenv("USER", "default_user")
 
+        # The Secret Service is used directly over one shared D-Bus
+        # connection (keyring opens a new one per operation); any other
+        # configured backend goes through keyring
+        self.keyring = keyring.get_keyring()
+        self._secret_service = _uses_secret_service(self.keyring)
+        if not self._secret_service:
+            logger.debug(
+                f"Keyring backend {type(self.keyring).__name__} is not the "
+                "Secret Service; not sharing a D-Bus connection"
+            )
+
+    def _collection(self):
+        """Return the unlocked default Secret Service collection."""
+        import secretstorage
+
+        collection = secretstorage.get_default_collection(_get_bus())
+        if collection.is_locked():
+            collection.unlock()
+            if collection.is_locked():  # User dismissed the prompt
+                raise secretstorage.exceptions.LockedException(
+                    "Secret Service collection is locked"
+                )
+        return collection
+
+    def _items(self):
+        return self._collection().search_items(
+            {"username": self.username, "service": self.service}
+        )
+
     def save_password(self, password):
         """Save a password to the secret storage."""
-        item = secretstorage.Item.new(
-            self.collection, self.service, {"username": self.username}, password
+        if not self._secret_service:
+            self.keyring.set_password(self.service, self.username, password)
+            return True
+
+        self._collection().create_item(
+            f"Password for '{self.username}' on '{self.service}'",
+            {
+                "application": KEYRING_APPID,
+                "service": self.service,
+                "username": self.username,
+            },
+            password,
+            replace=True,
         )
-        item.create()
         return True
 
     def get_password(self):
         """Retrieve a password from the secret storage."""
-        items = self.collection.get_all_items()
-        for item in items:
-            if (
-                item.get_label() == self.service
-                and item.get_attributes().get("username") == self.username
-            ):
-                return item.get_secret()
+        if not self._secret_service:
+            return self.keyring.get_password(self.service, self.username)
+
+        for item in self._items():
+            if item.is_locked():
+                item.unlock()
+            return item.get_secret().decode("utf-8")
         return None
 
     def delete_password(self):
         """Delete a password from the secret storage."""
-        items = self.collection.get_all_items()
-        for item in items:
-            if (
-                item.get_label() == self.service
-                and item.get_attributes().get("username") == self.username
-            ):
-                item.delete()
-                return True
-        return False
+        if not self._secret_service:
+            try:
+                self.keyring.delete_password(self.service, self.username)
+            except PasswordDeleteError:
+                return False
+            return True
+
+        deleted = False
+        for item in self._items():
+            item.delete()
+            deleted = True
+        return deleted
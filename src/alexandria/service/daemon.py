@@ -1,52 +1,137 @@
 """Main daemon service for Alexandria screenshot capture."""
 
+import hashlib
 import json
 import logging
+import os
+import queue
+import re
 import signal
 import sys
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from pathlib import Path
 from threading import Event, Thread
 from typing import Optional
 
-import schedule
-
 from alexandria.config import Config, XDGDirs
-from alexandria.core import MemoryDB, ScreenshotCapture, OCRProcessor, Memory
-from alexandria.core.text_processor import TextProcessor
+from alexandria.core.models import Memory, MemoryDB
 
 logger = logging.getLogger(__name__)
 
+# orjson serializes several times faster; both produce a JSON str here
+try:
+    from orjson import dumps as _orjson_dumps
+
+    def json_dumps(obj) -> str:
+        return _orjson_dumps(obj).decode()
+
+except ImportError:
+    json_dumps = json.dumps
+
+# Common private applications
+PRIVATE_APPS = frozenset(
+    {
+        "firefox",
+        "chrome",
+        "chromium",
+        "brave",
+        "edge",  # Browsers (potentially private browsing)
+        "keepass",
+        "bitwarden",
+        "1password",  # Password managers
+        "telegram",
+        "signal",
+        "discord",
+        "slack",  # Messaging
+        "evolution",
+        "thunderbird",  # Email clients
+    }
+)
+
+# Any private application name, in one pattern for a single pass per field
+PRIVATE_APPS_RE = re.compile("|".join(re.escape(app) for app in sorted(PRIVATE_APPS)))
+
+# A capture's files are only shared with later identical captures while its
+# row is this far from the retention cutoff, so cleanup cannot delete the
+# row and unlink the files before the sharing row is saved
+REUSE_RETENTION_MARGIN = timedelta(hours=1)
+
+
+# Directories known to exist, so each is checked at most once per process
+_created_dirs = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (and its parents) unless it is known to exist."""
+    path = str(path)
+    if path in _created_dirs:
+        return
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+    _created_dirs.add(path)
+
 
 class AlexandriaDaemon:
     """Main daemon service for Alexandria."""
 
+    # Most queued captures handed to OCR at once
+    OCR_BATCH_SIZE = 8
+
     def __init__(self):
         self.config = Config()
+        self.config.ensure_ready()
         self.running = Event()
         self.running.set()
+        # Set by stop(); the main loop sleeps on it between jobs
+        self._stopping = Event()
 
         # Initialize components
         self._init_logging()
         self._init_database()
         self._init_screenshot_capture()
-        self._init_ocr_processor()
+        self._refresh_config_cache()
 
-        # Initialize text processor for advanced tagging
-        self.text_processor = TextProcessor()
+        # Image analysis and thumbnailing run here alongside OCR; all of
+        # them spend their time in OpenCV/Tesseract code that releases the GIL
+        self.executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="alexandria-analysis"
+        )
+
+        # Captures are handed to a worker for OCR, tagging and saving so a
+        # slow OCR pass never delays the next scheduled capture
+        self._work_q = queue.Queue(maxsize=8)
+        self._worker = Thread(
+            target=self._ocr_worker, name="alexandria-ocr", daemon=True
+        )
+        self._worker.start()
+
+        # Retention cleanup runs on its own low-priority thread, woken after
+        # saves and by the daily schedule
+        self._cleanup_event = Event()
+        self._cleanup_thread = Thread(
+            target=self._cleanup_loop, name="alexandria-cleanup", daemon=True
+        )
+        self._cleanup_thread.start()
+
+        # (frame hash, timestamp, screenshot path, analysis future, thumbnail
+        # future) of the last capture; reused while the screen does not change
+        self._last_capture = None
 
         # Setup directories
         self.screenshots_dir = self.config.data_dir / "screenshots"
         self.thumbnails_dir = self.config.cache_dir / "thumbnails"
 
         # Create directories
-        self.screenshots_dir.mkdir(parents=True, exist_ok=True)
-        self.thumbnails_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.screenshots_dir)
+        _ensure_dir(self.thumbnails_dir)
 
         # Setup signal handlers
         signal.signal(signal.SIGTERM, self._signal_handler)
         signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGHUP, self._reload_handler)
 
         logger.info("Alexandria daemon initialized")
 
@@ -57,7 +142,7 @@ class AlexandriaDaemon:
 
         # Setup file logging
         log_dir = XDGDirs.cache_home() / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(log_dir)
         log_file = log_dir / "alexandria-daemon.log"
 
         logging.basicConfig(
@@ -72,13 +157,15 @@ class AlexandriaDaemon:
         db_url = f"sqlite:///{db_path}"
 
         # Ensure database directory exists
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(Path(db_path).parent)
 
         self.db = MemoryDB(db_url)
         logger.info(f"Database initialized: {db_path}")
 
     def _init_screenshot_capture(self):
         """Initialize screenshot capture backend."""
+        from alexandria.core.screenshot import ScreenshotCapture
+
         try:
             self.screenshot_capture = ScreenshotCapture(self.config)
             compositor_type = self.screenshot_capture.get_compositor_type()
@@ -90,18 +177,50 @@ class AlexandriaDaemon:
             logger.error(f"Failed to initialize screenshot capture: {e}")
             self.screenshot_capture = None
 
-    def _init_ocr_processor(self):
-        """Initialize OCR processor."""
-        if self.config.get("ocr", "enabled"):
-            try:
-                self.ocr_processor = OCRProcessor(self.config)
-                logger.info("OCR processor initialized")
-            except RuntimeError as e:
-                logger.error(f"Failed to initialize OCR processor: {e}")
-                self.ocr_processor = None
-        else:
-            self.ocr_processor = None
+    @cached_property
+    def ocr_processor(self):
+        """OCR processor, created (and its engine loaded) on first use."""
+        if not self.config.get("ocr", "enabled"):
             logger.info("OCR processing disabled")
+            return None
+
+        from alexandria.core.ocr import OCRProcessor
+
+        try:
+            ocr_processor = OCRProcessor(self.config)
+        except RuntimeError as e:
+            logger.error(f"Failed to initialize OCR processor: {e}")
+            return None
+        logger.info("OCR processor initialized")
+        return ocr_processor
+
+    @cached_property
+    def text_processor(self):
+        """Text processor for advanced tagging, created on first use."""
+        from alexandria.core.text_processor import TextProcessor
+
+        return TextProcessor()
+
+    def _refresh_config_cache(self):
+        """Snapshot the settings read on every capture."""
+        self._auto_cleanup = bool(self.config.get("storage", "auto_cleanup"))
+        self._retention_days = self.config.get("storage", "retention_days") or 0
+        self._exclude_private_windows = bool(
+            self.config.get("privacy", "exclude_private_windows")
+        )
+
+        # Configured exclude patterns, as one alternation
+        excluded_windows = self.config.get("screenshot", "exclude_windows") or []
+        patterns = [p.lower() for p in excluded_windows if p]
+        self._exclude_re = (
+            re.compile("|".join(re.escape(p) for p in patterns)) if patterns else None
+        )
+
+    def _reload_handler(self, signum, frame):
+        """Re-read the configuration on SIGHUP."""
+        logger.info("Received SIGHUP, reloading configuration")
+        self.config.reload()
+        self._refresh_config_cache()
 
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
@@ -109,57 +228,223 @@ class AlexandriaDaemon:
         self.stop()
 
     def capture_and_process_screenshot(self):
-        """Capture and process a screenshot."""
+        """Capture and process a screenshot on the calling thread.
+
+        Retention cleanup also runs here rather than on the cleanup thread,
+        so a one-shot run has enforced it before the process exits.
+        """
+        capture = self._capture_screenshot()
+        if capture:
+            self._save_memories(
+                [self._process_capture(*capture)], inline_cleanup=True
+            )
+
+    def _capture_and_queue(self):
+        """Capture a screenshot and queue it for the OCR worker."""
+        capture = self._capture_screenshot()
+        if not capture:
+            return
+        try:
+            self._work_q.put_nowait(capture)
+        except queue.Full:
+            logger.warning("OCR backlog full, dropping screenshot")
+
+    def _ocr_worker(self):
+        """Process queued captures until a None sentinel arrives.
+
+        Whatever has piled up behind the first capture is taken in the same
+        batch, so OCR runs once for the whole backlog.
+        """
+        stopping = False
+        while not stopping:
+            batch = [self._work_q.get()]
+            while len(batch) < self.OCR_BATCH_SIZE:
+                try:
+                    batch.append(self._work_q.get_nowait())
+                except queue.Empty:
+                    break
+
+            if None in batch:
+                stopping = True
+                batch = batch[: batch.index(None)]
+
+            try:
+                self._process_batch(batch)
+            except Exception as e:
+                logger.error(f"Error processing screenshots: {e}")
+            finally:
+                for _ in range(len(batch) + stopping):
+                    self._work_q.task_done()
+
+    def _process_batch(self, captures):
+        """OCR and tag a batch of captures together, then save them at once."""
+        if not captures:
+            return
+
+        ocr_results = [None] * len(captures)
+        tags = [None] * len(captures)
+        if self.ocr_processor:
+            ocr_results = self.ocr_processor.process_images(
+                [capture[1] for capture in captures]
+            )
+
+            # Tag all texts at once so the POS tagger runs once per batch;
+            # on failure each capture is tagged on its own instead
+            try:
+                tags = self.text_processor.generate_content_tags_batch(
+                    [
+                        (ocr_result.get("text", ""), capture[2])
+                        for capture, ocr_result in zip(captures, ocr_results)
+                    ],
+                    max_total_tags=25,
+                )
+            except Exception as e:
+                logger.error(f"Error tagging screenshots: {e}")
+
+        self._save_memories(
+            [
+                self._process_capture(
+                    *capture, ocr_result=ocr_result, tags=capture_tags
+                )
+                for capture, ocr_result, capture_tags in zip(
+                    captures, ocr_results, tags
+                )
+            ]
+        )
+
+    def _save_memories(self, memories, inline_cleanup=False):
+        """Save processed memories, skipping any that failed."""
+        memories = [memory for memory in memories if memory is not None]
+        if not memories:
+            return
+
+        try:
+            for memory in self.db.add_memories(memories):
+                logger.info(f"Screenshot processed and saved: {memory.id}")
+
+            # Cleanup old screenshots if auto-cleanup is enabled
+            if self._auto_cleanup:
+                if inline_cleanup:
+                    self._cleanup_old_memories()
+                else:
+                    self._cleanup_event.set()
+
+        except Exception as e:
+            logger.error(f"Error saving screenshots: {e}")
+
+    def _capture_screenshot(self):
+        """Capture a screenshot and build its memory record.
+
+        Returns (memory, frame, window_info, analysis_future,
+        thumbnail_future), or None if nothing was captured.
+        """
         try:
             # Skip if screen is locked
             if self.screenshot_capture.is_screen_locked():
                 logger.debug("Screen is locked, skipping screenshot")
-                return
+                return None
 
-            # Capture screenshot
-            screenshot_path = self.screenshot_capture.capture_screenshot(
+            # Capture screenshot; the decoded pixels are shared by the
+            # analysis and OCR below instead of re-reading the file
+            frame = self.screenshot_capture.capture_screenshot_image(
                 self.screenshots_dir
             )
-            if not screenshot_path:
+            if not frame:
                 logger.warning("Failed to capture screenshot")
-                return
+                return None
+            screenshot_path = frame.path
 
             # Create memory record
             memory = Memory()
             memory.screenshot_path = str(screenshot_path)
-            memory.timestamp = datetime.utcnow()
+            # One clock read gives both the timestamp (naive UTC, as stored)
+            # and a unique file name stem
+            now_ns = time.time_ns()
+            memory.timestamp = datetime.fromtimestamp(
+                now_ns / 1e9, tz=timezone.utc
+            ).replace(tzinfo=None)
 
             # Get image metadata
-            metadata = self.screenshot_capture.get_image_metadata(screenshot_path)
+            metadata = self.screenshot_capture.get_image_metadata(frame)
             memory.image_width = metadata.get("width")
             memory.image_height = metadata.get("height")
             memory.file_size = metadata.get("file_size")
 
-            # Analyze image content
-            content_analysis = self.screenshot_capture.analyze_image_content(
-                screenshot_path
-            )
-            if content_analysis.get("dominant_colors"):
-                memory.dominant_colors = json.dumps(content_analysis["dominant_colors"])
-
             # Get window information (enhanced with Wayland support)
             window_info = self.screenshot_capture.get_active_window_info()
             memory.window_title = window_info.get("title")
             memory.application_name = window_info.get("app_id")
             memory.window_class = window_info.get("window_class")
 
-            # Create thumbnail
-            timestamp_str = memory.timestamp.strftime("%Y%m%d_%H%M%S")
-            thumbnail_path = self.thumbnails_dir / f"thumb_{timestamp_str}.png"
-
-            if self.screenshot_capture.create_thumbnail(
-                screenshot_path, thumbnail_path
+            # An unchanged screen shares the previous capture's files and
+            # analysis instead of storing and analysing the same pixels again
+            frame_key = hashlib.blake2b(frame.bgr, digest_size=16).digest()
+            last = self._last_capture
+            if (
+                last
+                and last[0] == frame_key
+                and self._can_reuse_capture(last[1], memory.timestamp)
+                and os.path.exists(last[2])
             ):
-                memory.thumbnail_path = str(thumbnail_path)
+                _, _, previous_path, analysis_future, thumbnail_future = last
+                screenshot_path.unlink(missing_ok=True)
+                memory.screenshot_path = previous_path
+            else:
+                # Analyze image content and create the thumbnail in the
+                # background while OCR runs
+                analysis_future = self.executor.submit(
+                    self.screenshot_capture.analyze_image_content, frame
+                )
+                thumbnail_path = self.thumbnails_dir / f"thumb_{now_ns}.jpg"
+                thumbnail_future = self.executor.submit(
+                    self._create_thumbnail, frame, thumbnail_path
+                )
+                self._last_capture = (
+                    frame_key,
+                    memory.timestamp,
+                    memory.screenshot_path,
+                    analysis_future,
+                    thumbnail_future,
+                )
+
+            return memory, frame, window_info, analysis_future, thumbnail_future
 
+        except Exception as e:
+            logger.error(f"Error capturing screenshot: {e}")
+            return None
+
+    def _can_reuse_capture(self, owner_timestamp, now) -> bool:
+        """Whether files owned by a capture at owner_timestamp may be shared."""
+        if self._retention_days <= 0:
+            return True
+        cutoff = now - timedelta(days=self._retention_days)
+        return owner_timestamp > cutoff + REUSE_RETENTION_MARGIN
+
+    def _create_thumbnail(self, frame, thumbnail_path: Path) -> Optional[str]:
+        """Write a thumbnail and return its path, or None on failure."""
+        if self.screenshot_capture.create_thumbnail(frame, thumbnail_path):
+            return str(thumbnail_path)
+        return None
+
+    def _process_capture(
+        self,
+        memory,
+        frame,
+        window_info,
+        analysis_future,
+        thumbnail_future,
+        ocr_result=None,
+        tags=None,
+    ):
+        """Run OCR and tagging (unless already done) on a capture.
+
+        Returns the completed memory, or None on failure.
+        """
+        try:
             # Process with OCR if enabled
             if self.ocr_processor:
-                ocr_result = self.ocr_processor.process_image(screenshot_path)
+                if ocr_result is None:
+                    ocr_result = self.ocr_processor.process_image(frame)
 
                 memory.ocr_text = ocr_result.get("text", "")
                 memory.ocr_confidence = ocr_result.get("confidence", 0)
@@ -167,78 +452,76 @@ class AlexandriaDaemon:
                 memory.is_sensitive = ocr_result.get("has_sensitive", False)
 
                 if ocr_result.get("structured_data"):
-                    memory.ocr_data = json.dumps(ocr_result["structured_data"])
+                    memory.ocr_data = json_dumps(ocr_result["structured_data"])
 
                 # Generate comprehensive tags using NLTK and window information
-                comprehensive_tags = self.text_processor.generate_content_tags(
-                    memory.ocr_text, window_info, max_total_tags=25
-                )
+                comprehensive_tags = tags
+                if comprehensive_tags is None:
+                    comprehensive_tags = self.text_processor.generate_content_tags(
+                        memory.ocr_text, window_info, max_total_tags=25
+                    )
                 memory.tags_list = comprehensive_tags
 
                 logger.debug(
-                    f"Generated {len(comprehensive_tags)} tags: {comprehensive_tags}"
+                    "Generated %d tags: %s", len(comprehensive_tags), comprehensive_tags
                 )
 
+            memory.thumbnail_path = thumbnail_future.result()
+
+            content_analysis = analysis_future.result()
+            if content_analysis.get("dominant_colors"):
+                memory.dominant_colors = json_dumps(content_analysis["dominant_colors"])
+
             # Mark as private if sensitive content detected
             if memory.is_sensitive or self._should_mark_private(window_info):
                 memory.is_private = True
 
-            # Save to database
-            saved_memory = self.db.add_memory(memory)
-
-            logger.info(f"Screenshot processed and saved: {saved_memory.id}")
-
-            # Cleanup old screenshots if auto-cleanup is enabled
-            if self.config.get("storage", "auto_cleanup"):
-                self._cleanup_old_memories()
+            return memory
 
         except Exception as e:
             logger.error(f"Error processing screenshot: {e}")
+            return None
 
     def _should_mark_private(self, window_info: dict) -> bool:
         """Determine if a screenshot should be marked as private."""
-        if not self.config.get("privacy", "exclude_private_windows"):
+        if not self._exclude_private_windows:
             return False
 
+        # Lowercase all three fields in one allocation; they are joined with
+        # NUL so no pattern can match across two
+        haystack = "\x00".join(
+            (
+                window_info.get("app_id", ""),
+                window_info.get("window_class", ""),
+                window_info.get("title", ""),
+            )
+        ).lower()
+
         # Check against excluded applications
-        excluded_windows = self.config.get("screenshot", "exclude_windows") or []
+        if self._exclude_re is not None and self._exclude_re.search(haystack):
+            return True
 
-        app_id = window_info.get("app_id", "").lower()
-        window_class = window_info.get("window_class", "").lower()
-        window_title = window_info.get("title", "").lower()
+        # Common private applications, matched in app id and class only
+        title_start = haystack.index("\x00", haystack.index("\x00") + 1)
+        return PRIVATE_APPS_RE.search(haystack, 0, title_start) is not None
 
-        for exclude_pattern in excluded_windows:
-            exclude_pattern = exclude_pattern.lower()
-            if (
-                exclude_pattern in app_id
-                or exclude_pattern in window_class
-                or exclude_pattern in window_title
-            ):
-                return True
-
-        # Common private applications
-        private_apps = {
-            "firefox",
-            "chrome",
-            "chromium",
-            "brave",
-            "edge",  # Browsers (potentially private browsing)
-            "keepass",
-            "bitwarden",
-            "1password",  # Password managers
-            "telegram",
-            "signal",
-            "discord",
-            "slack",  # Messaging
-            "evolution",
-            "thunderbird",  # Email clients
-        }
-
-        for private_app in private_apps:
-            if private_app in app_id or private_app in window_class:
-                return True
+    def _cleanup_loop(self):
+        """Run retention cleanup whenever it is requested, until stopped."""
+        # On Linux this lowers only the calling thread's priority
+        try:
+            os.nice(10)
+        except OSError as e:
+            logger.debug(f"Could not lower cleanup priority: {e}")
 
-        return False
+        while True:
+            self._cleanup_event.wait()
+            if self._stopping.is_set():
+                return
+            self._cleanup_event.clear()
+            try:
+                self._cleanup_old_memories()
+            except Exception as e:
+                logger.error(f"Error cleaning up memories: {e}")
 
     def _cleanup_old_memories(self):
         """Clean up old memories based on retention policy."""
@@ -250,56 +533,93 @@ class AlexandriaDaemon:
 
     def setup_schedule(self):
         """Setup the screenshot capture schedule."""
+        import schedule
+
         interval = self.config.screenshot_interval
 
-        schedule.every(interval).minutes.do(self.capture_and_process_screenshot)
+        schedule.every(interval).minutes.do(self._capture_and_queue)
 
         # Schedule daily cleanup at 3 AM
-        schedule.every().day.at("03:00").do(self._cleanup_old_memories)
+        schedule.every().day.at("03:00").do(self._cleanup_event.set)
 
         logger.info(f"Scheduled screenshot capture every {interval} minutes")
 
     def run(self):
         """Main daemon loop."""
+        import schedule
+
         logger.info("Starting Alexandria daemon")
 
         self.setup_schedule()
 
         # Take an initial screenshot
-        self.capture_and_process_screenshot()
+        self._capture_and_queue()
 
-        # Main loop
+        # Main loop: sleep until the next job is due, or until stop() is
+        # called. The wait is capped so a suspend or clock change is
+        # noticed within a minute.
         while self.running.is_set():
             try:
                 schedule.run_pending()
-                time.sleep(1)
-            except KeyboardInterrupt:
-                break
+                idle = schedule.idle_seconds()
+                if idle is None:
+                    idle = 60
+                self._stopping.wait(timeout=max(0, min(idle, 60)))
             except Exception as e:
                 logger.error(f"Error in main loop: {e}")
-                time.sleep(5)  # Wait before retrying
+                self._stopping.wait(timeout=5)  # Wait before retrying
 
+        # Let the worker finish what is already queued
+        self._work_q.put(None)
+        self._worker.join()
+        self._cleanup_thread.join()
+        self.executor.shutdown(wait=True)
         logger.info("Alexandria daemon stopped")
 
     def stop(self):
         """Stop the daemon."""
         self.running.clear()
+        self._stopping.set()
+        self._cleanup_event.set()
 
     def status(self) -> dict:
         """Get daemon status information."""
-        stats = self.db.get_statistics()
-
-        return {
-            "running": self.running.is_set(),
-            "config_file": str(self.config.config_file),
-            "database_path": self.config.database_path,
-            "screenshots_dir": str(self.screenshots_dir),
-            "screenshot_backend": self.config.get("wayland", "screenshot_backend"),
-            "ocr_enabled": self.config.get("ocr", "enabled"),
-            "interval_minutes": self.config.screenshot_interval,
-            "statistics": stats,
+        return get_status(self.config, self.db, running=self.running.is_set())
+
+
+def get_status(
+    config: Config, db: Optional[MemoryDB] = None, running: bool = False
+) -> dict:
+    """Collect status information without starting the capture stack.
+
+    Without ``db`` the database is opened only if it already exists; a
+    fresh install reports empty statistics rather than creating anything.
+    """
+    if db is None and Path(config.database_path).exists():
+        db = MemoryDB(f"sqlite:///{config.database_path}")
+
+    if db is not None:
+        statistics = db.get_statistics()
+    else:
+        statistics = {
+            "total_memories": 0,
+            "private_memories": 0,
+            "memories_with_text": 0,
+            "oldest_memory": None,
+            "newest_memory": None,
         }
 
+    return {
+        "running": running,
+        "config_file": str(config.config_file),
+        "database_path": config.database_path,
+        "screenshots_dir": str(config.data_dir / "screenshots"),
+        "screenshot_backend": config.get("wayland", "screenshot_backend"),
+        "ocr_enabled": config.get("ocr", "enabled"),
+        "interval_minutes": config.screenshot_interval,
+        "statistics": statistics,
+    }
+
 
 def main():
     """Main entry point for the daemon."""
@@ -317,13 +637,14 @@ def main():
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    daemon = AlexandriaDaemon()
-
     if args.status:
-        status = daemon.status()
+        # Only the configuration and database are needed here
+        status = get_status(Config())
         print(json.dumps(status, indent=2, default=str))
         return
 
+    daemon = AlexandriaDaemon()
+
     if args.one_shot:
         daemon.capture_and_process_screenshot()
         return